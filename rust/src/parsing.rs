@@ -26,6 +26,7 @@ pub struct ParsedDateTime {
     pub minute: u32,
     pub second: u32,
     pub microsecond: u32,
+    pub nanosecond: u32,
     pub offset: Option<i32>,
     pub has_offset: bool,
     pub tzname: Option<String>,
@@ -45,6 +46,7 @@ impl ParsedDateTime {
             minute: 0,
             second: 0,
             microsecond: 0,
+            nanosecond: 0,
             offset: None,
             has_offset: false,
             tzname: None,
@@ -463,11 +465,16 @@ impl<'a> Parser<'a> {
                         self.inc();
 
                         datetime.microsecond = 0;
+                        datetime.nanosecond = 0;
                         let mut i: u8 = 0;
 
-                        while i < 6 {
+                        while i < 9 {
                             if let Some(digit) = self.current.to_digit(10) {
-                                datetime.microsecond = datetime.microsecond * 10 + digit;
+                                if i < 6 {
+                                    datetime.microsecond = datetime.microsecond * 10 + digit;
+                                } else {
+                                    datetime.nanosecond = datetime.nanosecond * 10 + digit;
+                                }
                             } else if i == 0 {
                                 // One digit minimum is required
                                 return Err(self.unexpected_character_error("subsecond", 1));
@@ -484,11 +491,15 @@ impl<'a> Parser<'a> {
                             self.inc();
                         }
 
-                        // Expand missing microsecond
+                        // Expand missing microsecond and nanosecond
                         while i < 6 {
                             datetime.microsecond *= 10;
                             i += 1;
                         }
+                        while i < 9 {
+                            datetime.nanosecond *= 10;
+                            i += 1;
+                        }
                     }
 
                     if !datetime.extended_date_format {
@@ -512,11 +523,16 @@ impl<'a> Parser<'a> {
                         self.inc();
 
                         datetime.microsecond = 0;
+                        datetime.nanosecond = 0;
                         let mut i: u8 = 0;
 
-                        while i < 6 {
+                        while i < 9 {
                             if let Some(digit) = self.current.to_digit(10) {
-                                datetime.microsecond = datetime.microsecond * 10 + digit;
+                                if i < 6 {
+                                    datetime.microsecond = datetime.microsecond * 10 + digit;
+                                } else {
+                                    datetime.nanosecond = datetime.nanosecond * 10 + digit;
+                                }
                             } else if i == 0 {
                                 // One digit minimum is required
                                 return Err(self.unexpected_character_error("subsecond", 1));
@@ -533,11 +549,15 @@ impl<'a> Parser<'a> {
                             self.inc();
                         }
 
-                        // Expand missing microsecond
+                        // Expand missing microsecond and nanosecond
                         while i < 6 {
                             datetime.microsecond *= 10;
                             i += 1;
                         }
+                        while i < 9 {
+                            datetime.nanosecond *= 10;
+                            i += 1;
+                        }
                     }
                 }
 
@@ -551,6 +571,7 @@ impl<'a> Parser<'a> {
             && datetime.minute == 0
             && datetime.second == 0
             && datetime.microsecond == 0
+            && datetime.nanosecond == 0
         {
             // Special case for 24:00:00, which is valid for ISO 8601.
             // This is equivalent to 00:00:00 the next day.
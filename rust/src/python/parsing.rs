@@ -1,21 +1,82 @@
 use pyo3::exceptions;
 use pyo3::prelude::*;
+use pyo3::sync::GILOnceCell;
 use pyo3::types::PyDate;
 use pyo3::types::PyDateTime;
 use pyo3::types::PyTime;
+use pyo3::types::PyType;
 
-use crate::parsing::Parser;
+use crate::parsing::{ParsedDateTime, Parser};
 use crate::python::types::{Duration, FixedTimezone};
 
+static UTC: GILOnceCell<PyObject> = GILOnceCell::new();
+static FIXED_TIMEZONE: GILOnceCell<PyObject> = GILOnceCell::new();
+
+/// Returns an attribute of the pendulum.tz module,
+/// which is only looked up the first time.
+fn tz_attribute<'py>(
+    py: Python<'py>,
+    cell: &'static GILOnceCell<PyObject>,
+    name: &str,
+) -> PyResult<&'py PyAny> {
+    cell.get_or_try_init(py, || {
+        Ok::<_, PyErr>(py.import("pendulum.tz")?.getattr(name)?.to_object(py))
+    })
+    .map(|attribute| attribute.as_ref(py))
+}
+
+/// Builds an instance of the given datetime class,
+/// using the cached pendulum timezones for offsets.
+fn new_datetime(
+    py: Python,
+    datetime_class: &PyType,
+    datetime: &ParsedDateTime,
+) -> PyResult<PyObject> {
+    let tzinfo = match datetime.offset {
+        Some(offset) => {
+            if datetime.tzname.as_deref() == Some("UTC") {
+                Some(tz_attribute(py, &UTC, "UTC")?)
+            } else {
+                Some(tz_attribute(py, &FIXED_TIMEZONE, "fixed_timezone")?.call1((offset,))?)
+            }
+        }
+        None => None,
+    };
+
+    let dt = datetime_class.call1((
+        datetime.year as i32,
+        datetime.month as u8,
+        datetime.day as u8,
+        datetime.hour as u8,
+        datetime.minute as u8,
+        datetime.second as u8,
+        datetime.microsecond,
+        tzinfo,
+    ))?;
+
+    // Only classes able to carry them, like DateTime, keep the nanoseconds
+    if datetime.nanosecond != 0 && datetime_class.hasattr("_nanosecond")? {
+        dt.setattr("_nanosecond", datetime.nanosecond)?;
+    }
+
+    Ok(dt.to_object(py))
+}
+
 #[pyfunction]
-pub fn parse_iso8601(py: Python, input: &str) -> PyResult<PyObject> {
+#[pyo3(signature = (input, datetime_class=None))]
+pub fn parse_iso8601(
+    py: Python,
+    input: &str,
+    datetime_class: Option<&PyType>,
+) -> PyResult<PyObject> {
     let parsed = Parser::new(input).parse();
 
     match parsed {
         Ok(parsed) => match (parsed.datetime, parsed.duration, parsed.second_datetime) {
             (Some(datetime), None, None) => match (datetime.has_date, datetime.has_time) {
-                (true, true) => match datetime.offset {
-                    Some(offset) => {
+                (true, true) => match (datetime_class, datetime.offset) {
+                    (Some(datetime_class), _) => new_datetime(py, datetime_class, &datetime),
+                    (None, Some(offset)) => {
                         let dt = PyDateTime::new(
                             py,
                             datetime.year as i32,
@@ -34,7 +95,7 @@ pub fn parse_iso8601(py: Python, input: &str) -> PyResult<PyObject> {
 
                         Ok(dt.to_object(py))
                     }
-                    None => {
+                    (None, None) => {
                         let dt = PyDateTime::new(
                             py,
                             datetime.year as i32,
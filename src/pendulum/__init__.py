@@ -1,7 +1,12 @@
 from __future__ import annotations
 
 import datetime as _datetime
+import sys as _sys
+import time as _time
 
+from importlib import import_module
+from typing import TYPE_CHECKING
+from typing import Any
 from typing import Union
 from typing import cast
 from typing import overload
@@ -17,20 +22,29 @@ from pendulum.constants import SECONDS_PER_MINUTE
 from pendulum.constants import WEEKS_PER_YEAR
 from pendulum.constants import YEARS_PER_CENTURY
 from pendulum.constants import YEARS_PER_DECADE
+from pendulum.conversion import convert_many
+from pendulum.conversion import convert_timestamps
+from pendulum.conversion import from_epoch_micros
+from pendulum.conversion import from_epoch_millis
+from pendulum.conversion import from_epoch_nanos
+from pendulum.conversion import from_epoch_seconds
 from pendulum.date import Date
 from pendulum.datetime import DateTime
 from pendulum.day import WeekDay
 from pendulum.duration import Duration
+from pendulum.duration import DurationAccumulator
 from pendulum.formatting import Formatter
 from pendulum.helpers import format_diff
+from pendulum.helpers import format_diffs
 from pendulum.helpers import get_locale
+from pendulum.helpers import get_week_ends_at
+from pendulum.helpers import get_week_starts_at
 from pendulum.helpers import locale
 from pendulum.helpers import set_locale
+from pendulum.helpers import settings
 from pendulum.helpers import week_ends_at
 from pendulum.helpers import week_starts_at
 from pendulum.interval import Interval
-from pendulum.parser import parse
-from pendulum.testing.traveller import Traveller
 from pendulum.time import Time
 from pendulum.tz import UTC
 from pendulum.tz import fixed_timezone
@@ -42,6 +56,28 @@ from pendulum.tz.timezone import FixedTimezone
 from pendulum.tz.timezone import Timezone
 
 
+if TYPE_CHECKING:
+    from pendulum.datetime_array import DateTimeArray as _DateTimeArray
+    from pendulum.datetime_array import truncate as _truncate
+    from pendulum.interval_index import IntervalIndex as _IntervalIndex
+    from pendulum.parser import parse as _parse
+    from pendulum.parser import parse_many as _parse_many
+    from pendulum.testing.traveller import Traveller
+
+    # Served by __getattr__() at runtime
+    DateTimeArray = _DateTimeArray
+    IntervalIndex = _IntervalIndex
+    parse = _parse
+    parse_many = _parse_many
+    truncate = _truncate
+
+    _traveller = Traveller(DateTime)
+
+    freeze = _traveller.freeze
+    travel = _traveller.travel
+    travel_to = _traveller.travel_to
+    travel_back = _traveller.travel_back
+
 MONDAY = WeekDay.MONDAY
 TUESDAY = WeekDay.TUESDAY
 WEDNESDAY = WeekDay.WEDNESDAY
@@ -57,6 +93,11 @@ _WEEK_ENDS_AT: WeekDay = WeekDay.SUNDAY
 
 _formatter = Formatter()
 
+_timezones: dict[str, Timezone] = {}
+# Keyed by the timezones as passed by callers, local ones excepted
+_coarse_now: dict[object, tuple[int, DateTime]] = {}
+_days: dict[tuple[object, int], tuple[float, float, DateTime]] = {}
+
 
 @overload
 def timezone(name: int) -> FixedTimezone:
@@ -80,10 +121,17 @@ def timezone(name: str | int) -> Timezone | FixedTimezone:
     if isinstance(name, int):
         return fixed_timezone(name)
 
-    if name.lower() == "utc":
-        return UTC
+    try:
+        return _timezones[name]
+    except KeyError:
+        pass
+
+    # Looking up a zone is costly since zoneinfo reads its file again
+    # whenever the instance it cached has been garbage collected.
+    tz = UTC if name.lower() == "utc" else Timezone(name)
+    _timezones[name] = tz
 
-    return Timezone(name)
+    return tz
 
 
 def _safe_timezone(
@@ -136,6 +184,7 @@ def datetime(
     tz: str | float | Timezone | FixedTimezone | _datetime.tzinfo | None = UTC,
     fold: int = 1,
     raise_on_unknown_times: bool = False,
+    nanosecond: int = 0,
 ) -> DateTime:
     """
     Creates a new DateTime instance from a specific date and time.
@@ -151,6 +200,7 @@ def datetime(
         tz=tz,
         fold=fold,
         raise_on_unknown_times=raise_on_unknown_times,
+        nanosecond=nanosecond,
     )
 
 
@@ -244,32 +294,92 @@ def instance(
     return DateTime.instance(obj, tz=tz)
 
 
-def now(tz: str | Timezone | None = None) -> DateTime:
+def now(
+    tz: str | Timezone | FixedTimezone | None = None, *, coarse: bool = False
+) -> DateTime:
     """
     Get a DateTime instance for the current date and time.
+
+    :param tz: The timezone. Defaults to the local timezone.
+    :param coarse: Whether to truncate the time to the second.
+        Coarse instances are shared by all calls within the same second,
+        which is cheaper when the current time is requested repeatedly.
+    """
+    if not coarse:
+        return DateTime.now(tz)
+
+    if tz is None or tz == "local":
+        tz = local_timezone()
+
+    second = int(_time.time())
+
+    cached = _coarse_now.get(tz)
+    if cached is not None and cached[0] == second:
+        return cached[1]
+
+    resolved = _safe_timezone(tz)
+
+    dt = _datetime.datetime.fromtimestamp(second, resolved)
+    current = DateTime(
+        dt.year,
+        dt.month,
+        dt.day,
+        dt.hour,
+        dt.minute,
+        dt.second,
+        tzinfo=resolved,
+        fold=dt.fold,
+    )
+    _coarse_now[tz] = (second, current)
+
+    return current
+
+
+def _day(tz: str | Timezone | FixedTimezone | None, days: int) -> DateTime:
+    """
+    Returns the start of the day the given number of days away from today.
+
+    Results are memoized until the current day ends.
     """
-    return DateTime.now(tz)
+    if tz is None or tz == "local":
+        tz = local_timezone()
+
+    timestamp = _time.time()
+
+    cached = _days.get((tz, days))
+    if cached is not None and cached[0] <= timestamp < cached[1]:
+        return cached[2]
+
+    today = DateTime.now(tz).start_of("day")
+    day = today.add(days=days) if days else today
+    _days[(tz, days)] = (
+        today.timestamp(),
+        today.add(days=1).timestamp(),
+        day,
+    )
+
+    return day
 
 
 def today(tz: str | Timezone = "local") -> DateTime:
     """
     Create a DateTime instance for today.
     """
-    return now(tz).start_of("day")
+    return _day(tz, 0)
 
 
 def tomorrow(tz: str | Timezone = "local") -> DateTime:
     """
     Create a DateTime instance for tomorrow.
     """
-    return today(tz).add(days=1)
+    return _day(tz, 1)
 
 
 def yesterday(tz: str | Timezone = "local") -> DateTime:
     """
     Create a DateTime instance for yesterday.
     """
-    return today(tz).subtract(days=1)
+    return _day(tz, -1)
 
 
 def from_format(
@@ -338,14 +448,37 @@ def interval(start: DateTime, end: DateTime, absolute: bool = False) -> Interval
     return Interval(start, end, absolute=absolute)
 
 
-# Testing
+# Lazily loaded attributes
+#
+# They are not needed by the core features and some of them are costly
+# to import, so their modules are only imported on first access.
+
+_LAZY_ATTRIBUTES = {
+    "DateTimeArray": "pendulum.datetime_array",
+    "truncate": "pendulum.datetime_array",
+    "IntervalIndex": "pendulum.interval_index",
+    "parse": "pendulum.parser",
+    "parse_many": "pendulum.parser",
+}
+# Testing helpers, bound to a traveller which may import time_machine
+_TRAVELLER_METHODS = ("freeze", "travel", "travel_to", "travel_back")
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(import_module(_LAZY_ATTRIBUTES[name]), name)
+    elif name == "_traveller":
+        value = import_module("pendulum.testing.traveller").Traveller(DateTime)
+    elif name in _TRAVELLER_METHODS:
+        value = getattr(_sys.modules[__name__]._traveller, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Caching the value so that this is only called once per name
+    globals()[name] = value
 
-_traveller = Traveller(DateTime)
+    return value
 
-freeze = _traveller.freeze
-travel = _traveller.travel
-travel_to = _traveller.travel_to
-travel_back = _traveller.travel_back
 
 __all__ = [
     "__version__",
@@ -361,17 +494,28 @@ __all__ = [
     "YEARS_PER_DECADE",
     "Date",
     "DateTime",
+    "DateTimeArray",
     "Duration",
+    "DurationAccumulator",
     "Formatter",
     "WeekDay",
     "date",
     "datetime",
     "duration",
     "format_diff",
+    "format_diffs",
+    "convert_many",
+    "convert_timestamps",
     "freeze",
     "from_format",
+    "from_epoch_micros",
+    "from_epoch_millis",
+    "from_epoch_nanos",
+    "from_epoch_seconds",
     "from_timestamp",
     "get_locale",
+    "get_week_ends_at",
+    "get_week_starts_at",
     "instance",
     "interval",
     "local",
@@ -379,10 +523,13 @@ __all__ = [
     "naive",
     "now",
     "set_locale",
+    "settings",
     "week_ends_at",
     "week_starts_at",
     "parse",
+    "parse_many",
     "Interval",
+    "IntervalIndex",
     "Time",
     "UTC",
     "local_timezone",
@@ -396,6 +543,7 @@ __all__ = [
     "travel",
     "travel_back",
     "travel_to",
+    "truncate",
     "FixedTimezone",
     "Timezone",
     "yesterday",
@@ -29,6 +29,7 @@ class PreciseDiff(NamedTuple):
 
 def parse_iso8601(
     text: str,
+    datetime_class: type[datetime] | None = None,
 ) -> datetime | date | time | Duration: ...
 def days_in_year(year: int) -> int: ...
 def is_leap(year: int) -> bool: ...
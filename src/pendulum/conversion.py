@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+import datetime as _datetime
+
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Iterable
+from typing import List
+from typing import Literal
+from typing import Tuple
+from typing import cast
+from typing import overload
+
+import pendulum
+
+from pendulum.constants import SECONDS_PER_DAY
+from pendulum.constants import SECONDS_PER_HOUR
+from pendulum.constants import SECONDS_PER_MINUTE
+from pendulum.constants import US_PER_SECOND
+from pendulum.datetime import DateTime
+from pendulum.tz.timezone import UTC
+
+
+if TYPE_CHECKING:
+    from pendulum.tz.timezone import FixedTimezone
+    from pendulum.tz.timezone import Timezone
+
+_EPOCH = _datetime.datetime(1970, 1, 1, tzinfo=_datetime.timezone.utc)
+_EPOCH_ORDINAL = _EPOCH.toordinal()
+_MICROSECOND = _datetime.timedelta(microseconds=1)
+_NS_PER_UNIT = {
+    "seconds": US_PER_SECOND * 1000,
+    "milliseconds": US_PER_SECOND,
+    "microseconds": 1000,
+    "nanoseconds": 1,
+}
+
+# The year, month, day, hour, minute, second, microsecond
+# and UTC offset, in seconds, of a local time
+LocalTime = Tuple[int, int, int, int, int, int, int, int]
+
+
+@overload
+def convert_many(
+    dts: Iterable[_datetime.datetime],
+    tz: str | Timezone | FixedTimezone,
+    raw: Literal[False] = ...,
+) -> list[DateTime]:
+    ...
+
+
+@overload
+def convert_many(
+    dts: Iterable[_datetime.datetime],
+    tz: str | Timezone | FixedTimezone,
+    raw: Literal[True],
+) -> list[LocalTime]:
+    ...
+
+
+def convert_many(
+    dts: Iterable[_datetime.datetime],
+    tz: str | Timezone | FixedTimezone,
+    raw: bool = False,
+) -> list[DateTime] | list[LocalTime]:
+    """
+    Converts several datetimes to the given timezone,
+    like DateTime.in_timezone() would.
+
+    The timezone is resolved once for the whole batch and the offsets
+    are computed without building intermediate datetimes.
+    Sorted datetimes are the fastest to convert.
+
+    :param dts: The datetimes to convert, naive ones being localized
+    :param tz: The timezone to convert to
+    :param raw: Whether to return the local times as tuples
+                of their fields and UTC offset instead of DateTime instances
+    """
+    tz = pendulum._safe_timezone(tz)
+
+    microseconds = []
+    nanoseconds = []
+    for dt in dts:
+        nanoseconds.append(dt._nanosecond if isinstance(dt, DateTime) else 0)
+
+        if dt.tzinfo is None:
+            dt = tz.convert(dt)
+
+        # Using the native subtraction since DateTime returns an Interval
+        microseconds.append(_datetime.datetime.__sub__(dt, _EPOCH) // _MICROSECOND)
+
+    results = _localize(microseconds, tz, raw)
+    if not raw:
+        for result, nanosecond in zip(cast(List[DateTime], results), nanoseconds):
+            if nanosecond:
+                result._nanosecond = nanosecond
+
+    return results
+
+
+@overload
+def convert_timestamps(
+    timestamps: Iterable[float],
+    tz: str | Timezone | FixedTimezone,
+    unit: str = ...,
+    raw: Literal[False] = ...,
+) -> list[DateTime]:
+    ...
+
+
+@overload
+def convert_timestamps(
+    timestamps: Iterable[float],
+    tz: str | Timezone | FixedTimezone,
+    unit: str = ...,
+    *,
+    raw: Literal[True],
+) -> list[LocalTime]:
+    ...
+
+
+def convert_timestamps(
+    timestamps: Iterable[float],
+    tz: str | Timezone | FixedTimezone,
+    unit: str = "seconds",
+    raw: bool = False,
+) -> list[DateTime] | list[LocalTime]:
+    """
+    Converts several UNIX timestamps to local times in the given timezone.
+
+    See convert_many() for details.
+
+    :param timestamps: The timestamps to convert
+    :param tz: The timezone to convert to
+    :param unit: The unit of the timestamps:
+                 seconds, milliseconds, microseconds or nanoseconds,
+                 whose sub-microsecond part is kept by DateTime instances
+    :param raw: Whether to return the local times as tuples
+                of their fields and UTC offset instead of DateTime instances
+    """
+    if unit not in _NS_PER_UNIT:
+        raise ValueError(f'Invalid unit "{unit}" for convert_timestamps()')
+
+    tz = pendulum._safe_timezone(tz)
+
+    if unit == "nanoseconds":
+        splits = [divmod(int(timestamp), 1000) for timestamp in timestamps]
+        results = _localize([split[0] for split in splits], tz, raw)
+        if not raw:
+            for dt, (_, nanosecond) in zip(cast(List[DateTime], results), splits):
+                if nanosecond:
+                    dt._nanosecond = nanosecond
+
+        return results
+
+    factor = _NS_PER_UNIT[unit] // 1000
+    microseconds = [
+        timestamp * factor if isinstance(timestamp, int) else round(timestamp * factor)
+        for timestamp in timestamps
+    ]
+
+    return _localize(microseconds, tz, raw)
+
+
+def from_epoch_seconds(
+    seconds: int, tz: str | Timezone | FixedTimezone = UTC
+) -> DateTime:
+    """
+    Creates a DateTime instance from a number of seconds since the UNIX epoch.
+
+    Unlike from_timestamp(), the local time is computed from the integer value
+    directly, without rounding or building an intermediate UTC datetime.
+
+    :param seconds: The number of seconds since the UNIX epoch
+    :param tz: The timezone of the DateTime instance
+    """
+    return _from_epoch(seconds * US_PER_SECOND, tz)
+
+
+def from_epoch_millis(
+    milliseconds: int, tz: str | Timezone | FixedTimezone = UTC
+) -> DateTime:
+    """
+    Creates a DateTime instance from a number of milliseconds since the UNIX epoch.
+
+    :param milliseconds: The number of milliseconds since the UNIX epoch
+    :param tz: The timezone of the DateTime instance
+    """
+    return _from_epoch(milliseconds * 1000, tz)
+
+
+def from_epoch_micros(
+    microseconds: int, tz: str | Timezone | FixedTimezone = UTC
+) -> DateTime:
+    """
+    Creates a DateTime instance from a number of microseconds since the UNIX epoch.
+
+    :param microseconds: The number of microseconds since the UNIX epoch
+    :param tz: The timezone of the DateTime instance
+    """
+    return _from_epoch(microseconds, tz)
+
+
+def from_epoch_nanos(
+    nanoseconds: int, tz: str | Timezone | FixedTimezone = UTC
+) -> DateTime:
+    """
+    Creates a DateTime instance from a number of nanoseconds since the UNIX epoch.
+
+    The sub-microsecond part is available as the nanosecond attribute.
+
+    :param nanoseconds: The number of nanoseconds since the UNIX epoch
+    :param tz: The timezone of the DateTime instance
+    """
+    microseconds, nanosecond = divmod(nanoseconds, 1000)
+    dt = _from_epoch(microseconds, tz)
+    if nanosecond:
+        dt._nanosecond = nanosecond
+
+    return dt
+
+
+def _from_epoch(microseconds: int, tz: str | Timezone | FixedTimezone) -> DateTime:
+    return _localize([microseconds], pendulum._safe_timezone(tz), False)[0]
+
+
+@overload
+def _localize(
+    microseconds: list[int], tz: Timezone | FixedTimezone, raw: Literal[False]
+) -> list[DateTime]:
+    ...
+
+
+@overload
+def _localize(
+    microseconds: list[int], tz: Timezone | FixedTimezone, raw: Literal[True]
+) -> list[LocalTime]:
+    ...
+
+
+@overload
+def _localize(
+    microseconds: list[int], tz: Timezone | FixedTimezone, raw: bool
+) -> list[DateTime] | list[LocalTime]:
+    ...
+
+
+def _localize(
+    microseconds: list[int], tz: Timezone | FixedTimezone, raw: bool
+) -> list[DateTime] | list[LocalTime]:
+    """
+    Breaks down UTC timestamps, in microseconds, into local times.
+    """
+    offsets = tz._utc_offsets_at(value // US_PER_SECOND for value in microseconds)
+
+    results: list[Any] = []
+    ordinal = None
+    for value, (offset, fold) in zip(microseconds, offsets):
+        seconds, microsecond = divmod(value, US_PER_SECOND)
+        days, seconds = divmod(seconds + offset, SECONDS_PER_DAY)
+        if days + _EPOCH_ORDINAL != ordinal:
+            ordinal = days + _EPOCH_ORDINAL
+            day = _datetime.date.fromordinal(ordinal)
+
+        hour, seconds = divmod(seconds, SECONDS_PER_HOUR)
+        minute, second = divmod(seconds, SECONDS_PER_MINUTE)
+
+        if raw:
+            results.append(
+                (
+                    day.year,
+                    day.month,
+                    day.day,
+                    hour,
+                    minute,
+                    second,
+                    microsecond,
+                    offset,
+                )
+            )
+        else:
+            results.append(
+                DateTime(
+                    day.year,
+                    day.month,
+                    day.day,
+                    hour,
+                    minute,
+                    second,
+                    microsecond,
+                    tzinfo=tz,
+                    fold=fold,
+                )
+            )
+
+    return results
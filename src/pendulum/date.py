@@ -23,6 +23,8 @@ from pendulum.constants import YEARS_PER_DECADE
 from pendulum.day import WeekDay
 from pendulum.exceptions import PendulumException
 from pendulum.helpers import add_duration
+from pendulum.helpers import get_week_ends_at
+from pendulum.helpers import get_week_starts_at
 from pendulum.interval import Interval
 from pendulum.mixins.default import FormattableMixin
 
@@ -444,9 +446,10 @@ class Date(FormattableMixin, date):
         Reset the date to the first day of the week.
         """
         dt = self
+        wday = get_week_starts_at()
 
-        if self.day_of_week != pendulum._WEEK_STARTS_AT:
-            dt = self.previous(pendulum._WEEK_STARTS_AT)
+        if self.day_of_week != wday:
+            dt = self.previous(wday)
 
         return dt.start_of("day")
 
@@ -455,9 +458,10 @@ class Date(FormattableMixin, date):
         Reset the date to the last day of the week.
         """
         dt = self
+        wday = get_week_ends_at()
 
-        if self.day_of_week != pendulum._WEEK_ENDS_AT:
-            dt = self.next(pendulum._WEEK_ENDS_AT)
+        if self.day_of_week != wday:
+            dt = self.next(wday)
 
         return dt.end_of("day")
 
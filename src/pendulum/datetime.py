@@ -26,6 +26,7 @@ from pendulum.constants import RFC2822
 from pendulum.constants import RSS
 from pendulum.constants import SECONDS_PER_DAY
 from pendulum.constants import SECONDS_PER_MINUTE
+from pendulum.constants import US_PER_SECOND
 from pendulum.constants import W3C
 from pendulum.constants import YEARS_PER_CENTURY
 from pendulum.constants import YEARS_PER_DECADE
@@ -33,6 +34,8 @@ from pendulum.date import Date
 from pendulum.day import WeekDay
 from pendulum.exceptions import PendulumException
 from pendulum.helpers import add_duration
+from pendulum.helpers import get_week_ends_at
+from pendulum.helpers import get_week_starts_at
 from pendulum.interval import Interval
 from pendulum.time import Time
 from pendulum.tz import UTC
@@ -82,6 +85,10 @@ class DateTime(datetime.datetime, Date):
 
     _EPOCH: datetime.datetime = datetime.datetime(1970, 1, 1, tzinfo=UTC)
 
+    # Sub-microsecond part, only set on instances created
+    # from a source with a nanosecond precision
+    _nanosecond: int = 0
+
     @classmethod
     def create(
         cls,
@@ -95,31 +102,38 @@ class DateTime(datetime.datetime, Date):
         tz: str | float | Timezone | FixedTimezone | None | datetime.tzinfo = UTC,
         fold: int = 1,
         raise_on_unknown_times: bool = False,
+        nanosecond: int = 0,
     ) -> Self:
         """
         Creates a new DateTime instance from a specific date and time.
         """
-        if tz is not None:
-            tz = pendulum._safe_timezone(tz)
+        if tz is None:
+            instance = cls(
+                year, month, day, hour, minute, second, microsecond, fold=fold
+            )
+        else:
+            # The timezone builds the instance directly,
+            # without intermediate naive datetimes
+            instance = pendulum._safe_timezone(tz)._create(
+                cls,
+                year,
+                month,
+                day,
+                hour,
+                minute,
+                second,
+                microsecond,
+                fold,
+                raise_on_unknown_times,
+            )
 
-        dt = datetime.datetime(
-            year, month, day, hour, minute, second, microsecond, fold=fold
-        )
+        if nanosecond:
+            if not 0 <= nanosecond <= 999:
+                raise ValueError("nanosecond must be in 0..999")
 
-        if tz is not None:
-            dt = tz.convert(dt, raise_on_unknown_times=raise_on_unknown_times)
+            instance._nanosecond = nanosecond
 
-        return cls(
-            dt.year,
-            dt.month,
-            dt.day,
-            dt.hour,
-            dt.minute,
-            dt.second,
-            dt.microsecond,
-            tzinfo=dt.tzinfo,
-            fold=dt.fold,
-        )
+        return instance
 
     @classmethod
     def instance(
@@ -166,9 +180,7 @@ class DateTime(datetime.datetime, Date):
         elif tz is UTC or tz == "UTC":
             dt = datetime.datetime.now(UTC)
         else:
-            dt = datetime.datetime.now(UTC)
-            tz = pendulum._safe_timezone(tz)
-            dt = dt.astimezone(tz)
+            dt = datetime.datetime.now(pendulum._safe_timezone(tz))
 
         return cls(
             dt.year,
@@ -222,13 +234,25 @@ class DateTime(datetime.datetime, Date):
             minute = self.minute
         if second is None:
             second = self.second
+        # The nanosecond is only kept if the microsecond is
+        nanosecond = 0
         if microsecond is None:
             microsecond = self.microsecond
+            nanosecond = self._nanosecond
         if tz is None:
             tz = self.tz
 
         return self.__class__.create(
-            year, month, day, hour, minute, second, microsecond, tz=tz, fold=self.fold
+            year,
+            month,
+            day,
+            hour,
+            minute,
+            second,
+            microsecond,
+            tz=tz,
+            fold=self.fold,
+            nanosecond=nanosecond,
         )
 
     @property
@@ -255,6 +279,22 @@ class DateTime(datetime.datetime, Date):
 
         return delta.days * SECONDS_PER_DAY + delta.seconds
 
+    @property
+    def int_timestamp_ns(self) -> int:
+        """
+        The number of nanoseconds since the UNIX epoch.
+        """
+        return (
+            self.int_timestamp * US_PER_SECOND + self.microsecond
+        ) * 1000 + self._nanosecond
+
+    @property
+    def nanosecond(self) -> int:
+        """
+        The nanoseconds within the current microsecond, from 0 to 999.
+        """
+        return self._nanosecond
+
     @property
     def offset(self) -> int | None:
         return self.get_offset()
@@ -354,7 +394,11 @@ class DateTime(datetime.datetime, Date):
         if not self.timezone:
             dt = dt.replace(fold=1)
 
-        return tz.convert(dt)
+        dt = tz.convert(dt)
+        if self._nanosecond:
+            dt._nanosecond = self._nanosecond
+
+        return dt
 
     def in_tz(self, tz: str | Timezone | FixedTimezone) -> Self:
         """
@@ -614,6 +658,7 @@ class DateTime(datetime.datetime, Date):
                 dt.second,
                 dt.microsecond,
                 tz=self.tz,
+                nanosecond=self._nanosecond,
             )
 
         dt = datetime.datetime(
@@ -629,7 +674,7 @@ class DateTime(datetime.datetime, Date):
 
         dt = self.tz.convert(dt)
 
-        return self.__class__(
+        instance = self.__class__(
             dt.year,
             dt.month,
             dt.day,
@@ -640,6 +685,10 @@ class DateTime(datetime.datetime, Date):
             tzinfo=self.tz,
             fold=dt.fold,
         )
+        if self._nanosecond:
+            instance._nanosecond = self._nanosecond
+
+        return instance
 
     def subtract(
         self,
@@ -685,7 +734,7 @@ class DateTime(datetime.datetime, Date):
                 microseconds=delta.microseconds,
             )
         elif isinstance(delta, pendulum.Duration):
-            return self.add(**delta._signature)  # type: ignore[attr-defined]
+            return self.add(**delta._signature)  # type: ignore[arg-type]
 
         return self.add(seconds=delta.total_seconds())
 
@@ -782,11 +831,16 @@ class DateTime(datetime.datetime, Date):
         * year: date to last day of the year and time to 23:59:59.999999
         * decade: date to last day of the decade and time to 23:59:59.999999
         * century: date to last day of century and time to 23:59:59.999999
+
+        The nanosecond is set to 999 in every case.
         """
         if unit not in self._MODIFIERS_VALID_UNITS:
             raise ValueError(f'Invalid unit "{unit}" for end_of()')
 
-        return cast("Self", getattr(self, f"_end_of_{unit}")())
+        dt = cast("Self", getattr(self, f"_end_of_{unit}")())
+        dt._nanosecond = 999
+
+        return dt
 
     def _start_of_second(self) -> Self:
         """
@@ -903,9 +957,10 @@ class DateTime(datetime.datetime, Date):
         and the time to 00:00:00.
         """
         dt = self
+        wday = get_week_starts_at()
 
-        if self.day_of_week != pendulum._WEEK_STARTS_AT:
-            dt = self.previous(pendulum._WEEK_STARTS_AT)
+        if self.day_of_week != wday:
+            dt = self.previous(wday)
 
         return dt.start_of("day")
 
@@ -915,9 +970,10 @@ class DateTime(datetime.datetime, Date):
         and the time to 23:59:59.
         """
         dt = self
+        wday = get_week_ends_at()
 
-        if self.day_of_week != pendulum._WEEK_ENDS_AT:
-            dt = self.next(pendulum._WEEK_ENDS_AT)
+        if self.day_of_week != wday:
+            dt = self.next(wday)
 
         return dt.end_of("day")
 
@@ -1313,8 +1369,11 @@ class DateTime(datetime.datetime, Date):
             minute = self.minute
         if second is None:
             second = self.second
+        # The nanosecond is only kept if the microsecond is
+        nanosecond = 0
         if microsecond is None:
             microsecond = self.microsecond
+            nanosecond = self._nanosecond
         if tzinfo is True:
             tzinfo = self.tzinfo
         if fold is None:
@@ -1333,6 +1392,7 @@ class DateTime(datetime.datetime, Date):
             microsecond,
             tz=tzinfo,
             fold=fold,
+            nanosecond=nanosecond,
         )
 
     def __getnewargs__(self) -> tuple[Self]:
@@ -1366,10 +1426,18 @@ class DateTime(datetime.datetime, Date):
         type[Self],
         tuple[int, int, int, int, int, int, int, datetime.tzinfo | None],
     ]:
+        if self._nanosecond:
+            # The extra state is restored as an instance attribute
+            return (  # type: ignore[return-value]
+                self.__class__,
+                self._getstate(protocol),
+                {"_nanosecond": self._nanosecond},
+            )
+
         return self.__class__, self._getstate(protocol)
 
     def __deepcopy__(self, _: dict[int, Self]) -> Self:
-        return self.__class__(
+        dt = self.__class__(
             self.year,
             self.month,
             self.day,
@@ -1380,6 +1448,10 @@ class DateTime(datetime.datetime, Date):
             tzinfo=self.tz,
             fold=self.fold,
         )
+        if self._nanosecond:
+            dt._nanosecond = self._nanosecond
+
+        return dt
 
     def _cmp(self, other: datetime.datetime, **kwargs: Any) -> int:
         # Fix for pypy which compares using this method
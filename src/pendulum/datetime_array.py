@@ -0,0 +1,481 @@
+from __future__ import annotations
+
+import datetime as _datetime
+
+from array import array
+from typing import TYPE_CHECKING
+from typing import Callable
+from typing import ClassVar
+from typing import Iterable
+from typing import Iterator
+from typing import overload
+
+import pendulum
+
+from pendulum.constants import SECONDS_PER_DAY
+from pendulum.constants import US_PER_SECOND
+from pendulum.constants import YEARS_PER_CENTURY
+from pendulum.constants import YEARS_PER_DECADE
+from pendulum.datetime import DateTime
+from pendulum.helpers import add_duration
+from pendulum.helpers import get_week_starts_at
+from pendulum.tz.timezone import UTC
+from pendulum.tz.timezone import FixedTimezone
+from pendulum.tz.timezone import Timezone
+
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+    from typing_extensions import SupportsIndex
+
+_EPOCH = _datetime.datetime(1970, 1, 1, tzinfo=UTC)
+_NAIVE_EPOCH = _datetime.datetime(1970, 1, 1)
+_EPOCH_ORDINAL = _NAIVE_EPOCH.toordinal()
+_MICROSECOND = _datetime.timedelta(microseconds=1)
+
+_US_PER_MINUTE = 60 * US_PER_SECOND
+_US_PER_HOUR = 60 * _US_PER_MINUTE
+_US_PER_DAY = SECONDS_PER_DAY * US_PER_SECOND
+
+_FIXED_UNIT_SIZES = {
+    "minute": _US_PER_MINUTE,
+    "hour": _US_PER_HOUR,
+    "day": _US_PER_DAY,
+}
+
+
+class DateTimeArray:
+    """
+    A compact, immutable sequence of datetimes sharing a single timezone.
+
+    Instants are stored as microseconds since the UNIX epoch in an int64
+    ``array``, which exposes the buffer protocol and can be wrapped,
+    for instance, with ``numpy.frombuffer(values.microseconds, dtype="int64")``.
+
+    DateTime instances are only built when indexing or iterating.
+    """
+
+    __slots__ = ("_tz", "_values")
+
+    _MODIFIERS_VALID_UNITS: ClassVar[list[str]] = DateTime._MODIFIERS_VALID_UNITS
+
+    def __init__(
+        self,
+        microseconds: Iterable[int] = (),
+        tz: str | Timezone | FixedTimezone = UTC,
+    ) -> None:
+        if isinstance(microseconds, array) and microseconds.typecode == "q":
+            self._values: array[int] = microseconds
+        else:
+            self._values = array("q", microseconds)
+
+        self._tz: Timezone | FixedTimezone = pendulum._safe_timezone(tz)
+
+    @classmethod
+    def from_datetimes(
+        cls,
+        dts: Iterable[_datetime.datetime],
+        tz: str | Timezone | FixedTimezone | None = None,
+    ) -> Self:
+        """
+        Creates an array from datetime instances.
+
+        Naive datetimes are interpreted in the given timezone.
+        If no timezone is given, the one of the first datetime is used,
+        or UTC if it is naive.
+        """
+        values: array[int] = array("q")
+        resolved: Timezone | FixedTimezone | None = (
+            None if tz is None else pendulum._safe_timezone(tz)
+        )
+
+        for dt in dts:
+            if resolved is None:
+                resolved = (
+                    UTC if dt.tzinfo is None else pendulum._safe_timezone(dt.tzinfo)
+                )
+
+            if dt.tzinfo is None:
+                dt = resolved.convert(
+                    _datetime.datetime(
+                        dt.year,
+                        dt.month,
+                        dt.day,
+                        dt.hour,
+                        dt.minute,
+                        dt.second,
+                        dt.microsecond,
+                        fold=dt.fold,
+                    )
+                )
+
+            values.append(_epoch_microseconds(dt))
+
+        return cls(values, resolved or UTC)
+
+    @property
+    def microseconds(self) -> array[int]:
+        """
+        The underlying buffer of microseconds since the UNIX epoch.
+        """
+        return self._values
+
+    @property
+    def timezone(self) -> Timezone | FixedTimezone:
+        return self._tz
+
+    @property
+    def tz(self) -> Timezone | FixedTimezone:
+        return self._tz
+
+    def in_timezone(self, tz: str | Timezone | FixedTimezone) -> Self:
+        """
+        Returns the same instants expressed in another timezone.
+
+        The underlying buffer is shared since only the timezone changes.
+        """
+        return self.__class__(self._values, tz)
+
+    def in_tz(self, tz: str | Timezone | FixedTimezone) -> Self:
+        return self.in_timezone(tz)
+
+    # ADDITIONS AND SUBSTRACTIONS
+
+    def add(
+        self,
+        years: int = 0,
+        months: int = 0,
+        weeks: int = 0,
+        days: int = 0,
+        hours: int = 0,
+        minutes: int = 0,
+        seconds: float = 0,
+        microseconds: int = 0,
+    ) -> Self:
+        """
+        Add a duration to every datetime of the array.
+
+        This follows the semantics of ``DateTime.add()``: units of variable
+        length (years, months, weeks and days) are added to the local time
+        while the others are added to the absolute time.
+        """
+        delta = round(
+            (hours * 3600 + minutes * 60 + seconds) * US_PER_SECOND + microseconds
+        )
+
+        if not any([years, months, weeks, days]):
+            return self.__class__(
+                array("q", [v + delta for v in self._values]), self._tz
+            )
+
+        if not years and not months and isinstance(self._tz, FixedTimezone):
+            delta += (weeks * 7 + days) * _US_PER_DAY
+
+            return self.__class__(
+                array("q", [v + delta for v in self._values]), self._tz
+            )
+
+        def shift(local: _datetime.datetime) -> _datetime.datetime:
+            return add_duration(
+                local,
+                years=years,
+                months=months,
+                weeks=weeks,
+                days=days,
+                hours=hours,
+                minutes=minutes,
+                seconds=seconds,
+                microseconds=microseconds,
+            ).replace(fold=1)
+
+        return self._map_local(shift)
+
+    def subtract(
+        self,
+        years: int = 0,
+        months: int = 0,
+        weeks: int = 0,
+        days: int = 0,
+        hours: int = 0,
+        minutes: int = 0,
+        seconds: float = 0,
+        microseconds: int = 0,
+    ) -> Self:
+        """
+        Remove a duration from every datetime of the array.
+        """
+        return self.add(
+            years=-years,
+            months=-months,
+            weeks=-weeks,
+            days=-days,
+            hours=-hours,
+            minutes=-minutes,
+            seconds=-seconds,
+            microseconds=-microseconds,
+        )
+
+    # Modifiers
+
+    def start_of(self, unit: str) -> Self:
+        """
+        Returns a copy of the array with every datetime reset
+        to the start of the given unit, in the array's timezone.
+
+        See ``DateTime.start_of()`` for the supported units.
+        """
+        if unit not in self._MODIFIERS_VALID_UNITS:
+            raise ValueError(f'Invalid unit "{unit}" for start_of()')
+
+        return self.__class__(_truncate(self._values, unit, self._tz), self._tz)
+
+    # Accessors
+
+    def _materialize(self, value: int) -> DateTime:
+        dt = (_EPOCH + _datetime.timedelta(microseconds=value)).astimezone(self._tz)
+
+        return DateTime(
+            dt.year,
+            dt.month,
+            dt.day,
+            dt.hour,
+            dt.minute,
+            dt.second,
+            dt.microsecond,
+            tzinfo=self._tz,
+            fold=dt.fold,
+        )
+
+    def _map_local(
+        self, func: Callable[[_datetime.datetime], _datetime.datetime]
+    ) -> Self:
+        """
+        Applies a function to the local time of each datetime
+        and localizes the results back into the array's timezone.
+        """
+        tz = self._tz
+        values: array[int] = array("q")
+        for value in self._values:
+            local = (_EPOCH + _datetime.timedelta(microseconds=value)).astimezone(tz)
+            local = func(local.replace(tzinfo=None))
+
+            values.append(_epoch_microseconds(tz.convert(local)))
+
+        return self.__class__(values, tz)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    @overload
+    def __getitem__(self, index: SupportsIndex) -> DateTime:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Self:
+        ...
+
+    def __getitem__(self, index: SupportsIndex | slice) -> DateTime | Self:
+        if isinstance(index, slice):
+            return self.__class__(self._values[index], self._tz)
+
+        return self._materialize(self._values[index])
+
+    def __iter__(self) -> Iterator[DateTime]:
+        for value in self._values:
+            yield self._materialize(value)
+
+    # Comparisons
+
+    def _compare(
+        self,
+        other: DateTimeArray | _datetime.datetime,
+        op: Callable[[int, int], bool],
+    ) -> list[bool]:
+        if isinstance(other, DateTimeArray):
+            if len(other) != len(self):
+                raise ValueError("Cannot compare arrays of different lengths")
+
+            return [op(a, b) for a, b in zip(self._values, other._values)]
+
+        if other.tzinfo is None:
+            raise TypeError("can't compare offset-naive and offset-aware datetimes")
+
+        value = _epoch_microseconds(other)
+
+        return [op(a, value) for a in self._values]
+
+    def __eq__(self, other: object) -> list[bool]:  # type: ignore[override]
+        if not isinstance(other, (DateTimeArray, _datetime.datetime)):
+            return NotImplemented
+
+        return self._compare(other, int.__eq__)
+
+    def __ne__(self, other: object) -> list[bool]:  # type: ignore[override]
+        if not isinstance(other, (DateTimeArray, _datetime.datetime)):
+            return NotImplemented
+
+        return self._compare(other, int.__ne__)
+
+    def __lt__(self, other: DateTimeArray | _datetime.datetime) -> list[bool]:
+        return self._compare(other, int.__lt__)
+
+    def __le__(self, other: DateTimeArray | _datetime.datetime) -> list[bool]:
+        return self._compare(other, int.__le__)
+
+    def __gt__(self, other: DateTimeArray | _datetime.datetime) -> list[bool]:
+        return self._compare(other, int.__gt__)
+
+    def __ge__(self, other: DateTimeArray | _datetime.datetime) -> list[bool]:
+        return self._compare(other, int.__ge__)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._values.tolist()}, tz={self._tz!r})"
+
+
+def _epoch_microseconds(dt: _datetime.datetime) -> int:
+    # Using the native subtraction since DateTime returns an Interval
+    return _datetime.datetime.__sub__(dt, _EPOCH) // _MICROSECOND
+
+
+@overload
+def truncate(
+    values: DateTimeArray,
+    unit: str,
+    tz: str | Timezone | FixedTimezone | None = None,
+) -> DateTimeArray:
+    ...
+
+
+@overload
+def truncate(
+    values: Iterable[int],
+    unit: str,
+    tz: str | Timezone | FixedTimezone | None = None,
+) -> array[int]:
+    ...
+
+
+def truncate(
+    values: DateTimeArray | Iterable[int],
+    unit: str,
+    tz: str | Timezone | FixedTimezone | None = None,
+) -> DateTimeArray | array[int]:
+    """
+    Resets datetimes to the start of the given unit in a timezone,
+    like DateTime.start_of() would, to use them as bucket keys.
+
+    See DateTime.start_of() for the supported units.
+
+    :param values: The datetimes to truncate, as an array
+                   or as microseconds since the UNIX epoch
+    :param unit: The unit to truncate to
+    :param tz: The timezone to truncate in,
+               the one of the array or UTC by default
+    """
+    if unit not in DateTimeArray._MODIFIERS_VALID_UNITS:
+        raise ValueError(f'Invalid unit "{unit}" for truncate()')
+
+    if isinstance(values, DateTimeArray):
+        resolved = values.tz if tz is None else pendulum._safe_timezone(tz)
+
+        return DateTimeArray(_truncate(values.microseconds, unit, resolved), resolved)
+
+    return _truncate(values, unit, UTC if tz is None else pendulum._safe_timezone(tz))
+
+
+def _truncate(
+    values: Iterable[int], unit: str, tz: Timezone | FixedTimezone
+) -> array[int]:
+    """
+    Truncates microseconds since the UNIX epoch in the given timezone.
+
+    Local times are computed from offsets looked up in the transition table
+    and truncated arithmetically. Converting the resulting buckets back
+    to instants is costly but only done once per distinct bucket.
+    """
+    if unit == "second":
+        return array("q", [v - v % US_PER_SECOND for v in values])
+
+    size = _FIXED_UNIT_SIZES.get(unit)
+
+    if isinstance(tz, FixedTimezone) and size is not None:
+        # Fixed offsets never change so we can truncate the local time directly
+        offset = tz.offset * US_PER_SECOND
+
+        return array("q", [v - (v + offset) % size for v in values])
+
+    if not isinstance(values, (array, list)):
+        values = list(values)
+
+    week_start = get_week_starts_at()
+    first_days: dict[int, int] = {}
+    buckets: dict[int, int] = {}
+    results: array[int] = array("q")
+    offsets = tz._utc_offsets_at(value // US_PER_SECOND for value in values)
+    for value, (offset, fold) in zip(values, offsets):
+        local = value + offset * US_PER_SECOND
+        if size is not None:
+            start = local - local % size
+        else:
+            day = local // _US_PER_DAY
+            if day not in first_days:
+                first_days[day] = _first_day(day, unit, week_start)
+
+            start = first_days[day] * _US_PER_DAY
+
+        # The fold only matters for ambiguous local times
+        # but is part of the key to resolve them like start_of() does
+        key = start * 2 + fold
+        if key not in buckets:
+            local_start = _NAIVE_EPOCH + _datetime.timedelta(microseconds=start)
+            local_start = local_start.replace(fold=_start_fold(local_start, fold, tz))
+            buckets[key] = _epoch_microseconds(tz.convert(local_start))
+
+        results.append(buckets[key])
+
+    return results
+
+
+def _start_fold(
+    local_start: _datetime.datetime, fold: int, tz: Timezone | FixedTimezone
+) -> int:
+    """
+    Returns the fold resolving the local start of a unit like start_of() does.
+
+    Skipped starts are moved forward past the gap
+    and only ambiguous ones keep the fold of the truncated value.
+    """
+    if isinstance(tz, Timezone):
+        offset_before, offset_after = tz._local_offsets(local_start)
+        if offset_before > offset_after:
+            return fold
+
+    return 1
+
+
+def _first_day(day: int, unit: str, week_start: int) -> int:
+    """
+    Returns the first day, counted from the UNIX epoch,
+    of the week, month, year, decade or century of the given day.
+    """
+    if unit == "week":
+        # The UNIX epoch is a Thursday
+        return day - (day + 3 - week_start) % 7
+
+    date = _datetime.date.fromordinal(day + _EPOCH_ORDINAL)
+    if unit == "month":
+        first = date.replace(day=1)
+    elif unit == "year":
+        first = date.replace(month=1, day=1)
+    elif unit == "decade":
+        first = _datetime.date(date.year - date.year % YEARS_PER_DECADE, 1, 1)
+    else:
+        year = date.year - 1 - (date.year - 1) % YEARS_PER_CENTURY + 1
+        first = _datetime.date(year, 1, 1)
+
+    return first.toordinal() - _EPOCH_ORDINAL
+
+
+__all__ = ["DateTimeArray", "truncate"]
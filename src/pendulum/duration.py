@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from datetime import timedelta
 from typing import TYPE_CHECKING
+from typing import Iterable
 from typing import cast
 from typing import overload
 
@@ -43,6 +44,57 @@ def _divide_and_round(a: float, b: float) -> int:
     return q
 
 
+def _units(
+    weeks: float,
+    days: float,
+    hours: float,
+    minutes: float,
+    seconds: float,
+    milliseconds: float,
+    microseconds: float,
+) -> tuple[float, float, float, float, float, float] | None:
+    """
+    Returns the units a duration is created with, as expected by add(),
+    or None if they are only integer seconds and microseconds
+    since those can be recovered from the duration itself.
+    """
+    if (
+        not (weeks or days or hours or minutes)
+        and isinstance(seconds, int)
+        and isinstance(milliseconds, int)
+        and isinstance(microseconds, int)
+    ):
+        return None
+
+    return weeks, days, hours, minutes, seconds, microseconds + milliseconds * 1000
+
+
+_MICROSECOND = timedelta(microseconds=1)
+_US_PER_DAY = SECONDS_PER_DAY * US_PER_SECOND
+
+
+def _total_microseconds(delta: timedelta) -> int:
+    """
+    Returns the total number of microseconds of a duration or a timedelta,
+    years and months counting as 365 and 30 days like in total_seconds().
+    """
+    if isinstance(delta, Duration):
+        return delta._total_microseconds()
+
+    return delta // _MICROSECOND
+
+
+def _to_microseconds(delta: timedelta) -> int:
+    """
+    Returns the number of microseconds of a duration or a timedelta,
+    years and months excluded.
+    """
+    if isinstance(delta, Duration):
+        return delta._to_microseconds()
+
+    return delta // _MICROSECOND
+
+
 class Duration(timedelta):
     """
     Replacement for the standard timedelta class.
@@ -50,23 +102,20 @@ class Duration(timedelta):
     Provides several improvements over the base class.
     """
 
-    _total: float = 0
-    _years: int = 0
-    _months: int = 0
-    _weeks: int = 0
-    _days: int = 0
-    _remaining_days: int = 0
-    _seconds: int = 0
-    _microseconds: int = 0
-
-    _y = None
-    _m = None
-    _w = None
-    _d = None
-    _h = None
-    _i = None
-    _s = None
-    _invert = None
+    # The breakdown in weeks, days, seconds, etc. is only computed
+    # when first needed and the units the duration was created with
+    # are only kept when they can't be recovered from its value.
+    __slots__: tuple[str, ...] = ("_months", "_parts", "_units", "_years")
+
+    if PYPY:
+        # PyPy's timedelta stores its own fields in _days, _seconds
+        # and _microseconds, so the breakdown is computed eagerly there.
+        __slots__ = (*__slots__, "_total")
+
+    _years: int
+    _months: int
+    _units: tuple[float, float, float, float, float, float] | None
+    _parts: tuple[float, int, int, int] | None
 
     def __new__(
         cls,
@@ -94,37 +143,148 @@ class Duration(timedelta):
             weeks,
         )
 
+        self._parts = None
+        self._units = _units(
+            weeks, days, hours, minutes, seconds, milliseconds, microseconds
+        )
+
+        if PYPY:
+            self._store_breakdown(years, months)
+
+        self._months = months
+        self._years = years
+
+        return self
+
+    @classmethod
+    def _from_microseconds(
+        cls, microseconds: int, years: int = 0, months: int = 0
+    ) -> Self:
+        """
+        Creates a duration from a number of microseconds, years and months
+        excluded, without going through the conversion of other units.
+        """
+        self = timedelta.__new__(cls, years * 365 + months * 30, 0, microseconds)
+
+        self._parts = None
+        self._units = None
+
+        if PYPY:
+            self._store_breakdown(years, months)
+
+        self._months = months
+        self._years = years
+
+        return self
+
+    @staticmethod
+    def sum(deltas: Iterable[timedelta]) -> Duration:
+        """
+        Returns the sum of several durations, or native timedeltas.
+
+        Unlike chained additions, no intermediate duration is created
+        and years and months are kept instead of being converted to days.
+
+        :param deltas: The durations to sum.
+        """
+        return DurationAccumulator(deltas).as_duration()
+
+    def _normalize(self, years: int, months: int) -> tuple[float, int, int, int]:
+        """
+        Computes the total seconds, days, seconds and microseconds
+        of the duration, years and months excluded.
+        """
         # Intuitive normalization
-        total = self.total_seconds() - (years * 365 + months * 30) * SECONDS_PER_DAY
-        self._total = total
+        usec = self._raw_microseconds() - (years * 365 + months * 30) * _US_PER_DAY
 
         m = 1
-        if total < 0:
+        if usec < 0:
             m = -1
 
-        self._microseconds = round(total % m * 1e6)
-        self._seconds = abs(int(total)) % SECONDS_PER_DAY * m
+        seconds, microseconds = divmod(abs(usec), US_PER_SECOND)
+        days, seconds = divmod(seconds, SECONDS_PER_DAY)
 
-        _days = abs(int(total)) // SECONDS_PER_DAY * m
-        self._days = _days
-        self._remaining_days = abs(_days) % 7 * m
-        self._weeks = abs(_days) // 7 * m
-        self._months = months
-        self._years = years
+        return usec / US_PER_SECOND, days * m, seconds * m, microseconds * m
+
+    if PYPY:
+
+        def _raw_microseconds(self) -> int:
+            return cast(
+                int, timedelta._to_microseconds(self)  # type: ignore[attr-defined]
+            )
+
+        def _store_breakdown(self, years: int, months: int) -> None:
+            # The normalized values overwrite the fields of PyPy's timedelta,
+            # which the breakdown properties would otherwise shadow.
+            names = ("_total", "_days", "_seconds", "_microseconds")
+            for name, value in zip(names, self._normalize(years, months)):
+                setattr(self, name, value)
+
+        def _total_microseconds(self) -> int:
+            days = self._years * 365 + self._months * 30 + self._days
+
+            return (
+                days * SECONDS_PER_DAY + self._seconds
+            ) * US_PER_SECOND + self._microseconds
+
+    else:
+
+        def _raw_microseconds(self) -> int:
+            return timedelta.__floordiv__(self, _MICROSECOND)
 
-        self._signature = {  # type: ignore[attr-defined]
-            "years": years,
-            "months": months,
+        # Years and months are included in the native timedelta
+        _total_microseconds = _raw_microseconds
+
+        def _breakdown(self) -> tuple[float, int, int, int]:
+            if self._parts is None:
+                self._parts = self._normalize(self._years, self._months)
+
+            return self._parts
+
+        @property
+        def _total(self) -> float:
+            return self._breakdown()[0]
+
+        @property
+        def _days(self) -> int:
+            return self._breakdown()[1]
+
+        @property
+        def _seconds(self) -> int:
+            return self._breakdown()[2]
+
+        @property
+        def _microseconds(self) -> int:
+            return self._breakdown()[3]
+
+    @property
+    def _weeks(self) -> int:
+        return abs(self._days) // 7 * self._sign(self._days)
+
+    @property
+    def _remaining_days(self) -> int:
+        return abs(self._days) % 7 * self._sign(self._days)
+
+    @property
+    def _signature(self) -> dict[str, float]:
+        units = self._units
+        if units is None:
+            # Only integer seconds and microseconds were given
+            units = (0, 0, 0, 0, 0, self._fixed_microseconds())
+
+        weeks, days, hours, minutes, seconds, microseconds = units
+
+        return {
+            "years": self._years,
+            "months": self._months,
             "weeks": weeks,
             "days": days,
             "hours": hours,
             "minutes": minutes,
             "seconds": seconds,
-            "microseconds": microseconds + milliseconds * 1000,
+            "microseconds": microseconds,
         }
 
-        return self
-
     def total_minutes(self) -> float:
         return self.total_seconds() / SECONDS_PER_MINUTE
 
@@ -182,23 +342,15 @@ class Duration(timedelta):
 
     @property
     def hours(self) -> int:
-        if self._h is None:
-            seconds = self._seconds
-            self._h = 0
-            if abs(seconds) >= 3600:
-                self._h = (abs(seconds) // 3600 % 24) * self._sign(seconds)
+        seconds = self._seconds
 
-        return self._h
+        return (abs(seconds) // 3600 % 24) * self._sign(seconds)
 
     @property
     def minutes(self) -> int:
-        if self._i is None:
-            seconds = self._seconds
-            self._i = 0
-            if abs(seconds) >= 60:
-                self._i = (abs(seconds) // 60 % 60) * self._sign(seconds)
+        seconds = self._seconds
 
-        return self._i
+        return (abs(seconds) // 60 % 60) * self._sign(seconds)
 
     @property
     def seconds(self) -> int:
@@ -206,11 +358,9 @@ class Duration(timedelta):
 
     @property
     def remaining_seconds(self) -> int:
-        if self._s is None:
-            self._s = self._seconds
-            self._s = abs(self._s) % 60 * self._sign(self._s)
+        seconds = self._seconds
 
-        return self._s
+        return abs(seconds) % 60 * self._sign(seconds)
 
     @property
     def microseconds(self) -> int:
@@ -218,10 +368,7 @@ class Duration(timedelta):
 
     @property
     def invert(self) -> bool:
-        if self._invert is None:
-            self._invert = self.total_seconds() < 0
-
-        return self._invert
+        return self.total_seconds() < 0
 
     def in_weeks(self) -> int:
         return int(self.total_weeks())
@@ -331,7 +478,9 @@ class Duration(timedelta):
 
     def __add__(self, other: timedelta) -> Self:
         if isinstance(other, timedelta):
-            return self.__class__(seconds=self.total_seconds() + other.total_seconds())
+            return self._from_microseconds(
+                self._total_microseconds() + _total_microseconds(other)
+            )
 
         return NotImplemented
 
@@ -339,7 +488,9 @@ class Duration(timedelta):
 
     def __sub__(self, other: timedelta) -> Self:
         if isinstance(other, timedelta):
-            return self.__class__(seconds=self.total_seconds() - other.total_seconds())
+            return self._from_microseconds(
+                self._total_microseconds() - _total_microseconds(other)
+            )
 
         return NotImplemented
 
@@ -354,21 +505,31 @@ class Duration(timedelta):
         )
 
     def _to_microseconds(self) -> int:
-        return (self._days * (24 * 3600) + self._seconds) * 1000000 + self._microseconds
+        return (
+            self._total_microseconds()
+            - (self._years * 365 + self._months * 30) * _US_PER_DAY
+        )
+
+    def _fixed_microseconds(self) -> int:
+        """
+        Returns the number of microseconds of the duration
+        which are not part of its years and months.
+        """
+        return self._to_microseconds()
 
     def __mul__(self, other: int | float) -> Self:
         if isinstance(other, int):
-            return self.__class__(
+            return self._from_microseconds(
+                self._to_microseconds() * other,
                 years=self._years * other,
                 months=self._months * other,
-                seconds=self._total * other,
             )
 
         if isinstance(other, float):
             usec = self._to_microseconds()
             a, b = other.as_integer_ratio()
 
-            return self.__class__(0, 0, _divide_and_round(usec * a, b))
+            return self._from_microseconds(_divide_and_round(usec * a, b))
 
         return NotImplemented
 
@@ -388,14 +549,10 @@ class Duration(timedelta):
 
         usec = self._to_microseconds()
         if isinstance(other, timedelta):
-            return cast(
-                int, usec // other._to_microseconds()  # type: ignore[attr-defined]
-            )
+            return usec // _to_microseconds(other)
 
         if isinstance(other, int):
-            return self.__class__(
-                0,
-                0,
+            return self._from_microseconds(
                 usec // other,
                 years=self._years // other,
                 months=self._months // other,
@@ -415,14 +572,10 @@ class Duration(timedelta):
 
         usec = self._to_microseconds()
         if isinstance(other, timedelta):
-            return cast(
-                float, usec / other._to_microseconds()  # type: ignore[attr-defined]
-            )
+            return usec / _to_microseconds(other)
 
         if isinstance(other, int):
-            return self.__class__(
-                0,
-                0,
+            return self._from_microseconds(
                 _divide_and_round(usec, other),
                 years=_divide_and_round(self._years, other),
                 months=_divide_and_round(self._months, other),
@@ -431,9 +584,7 @@ class Duration(timedelta):
         if isinstance(other, float):
             a, b = other.as_integer_ratio()
 
-            return self.__class__(
-                0,
-                0,
+            return self._from_microseconds(
                 _divide_and_round(b * usec, a),
                 years=_divide_and_round(self._years * b, a),
                 months=_divide_and_round(self._months, other),
@@ -443,20 +594,17 @@ class Duration(timedelta):
 
     def __mod__(self, other: timedelta) -> Self:
         if isinstance(other, timedelta):
-            r = self._to_microseconds() % other._to_microseconds()  # type: ignore[attr-defined] # noqa: E501
+            r = self._to_microseconds() % _to_microseconds(other)
 
-            return self.__class__(0, 0, r)
+            return self._from_microseconds(r)
 
         return NotImplemented
 
     def __divmod__(self, other: timedelta) -> tuple[int, Duration]:
         if isinstance(other, timedelta):
-            q, r = divmod(
-                self._to_microseconds(),
-                other._to_microseconds(),  # type: ignore[attr-defined]
-            )
+            q, r = divmod(self._to_microseconds(), _to_microseconds(other))
 
-            return q, self.__class__(0, 0, r)
+            return q, self._from_microseconds(r)
 
         return NotImplemented
 
@@ -484,6 +632,8 @@ class AbsoluteDuration(Duration):
     Duration that expresses a time difference in absolute values.
     """
 
+    __slots__ = ()
+
     def __new__(
         cls,
         days: float = 0,
@@ -503,31 +653,164 @@ class AbsoluteDuration(Duration):
             cls, days, seconds, microseconds, milliseconds, minutes, hours, weeks
         )
 
-        # We need to compute the total_seconds() value
-        # on a native timedelta object
-        delta = timedelta(
-            days, seconds, microseconds, milliseconds, minutes, hours, weeks
-        )
+        # The signature is the absolute value of the duration
+        self._parts = None
+        self._units = None
 
-        # Intuitive normalization
-        self._total = delta.total_seconds()
-        total = abs(self._total)
+        if PYPY:
+            self._store_breakdown(abs(years), abs(months))
 
-        self._microseconds = round(total % 1 * 1e6)
-        days, self._seconds = divmod(int(total), SECONDS_PER_DAY)
-        self._days = abs(days + years * 365 + months * 30)
-        self._weeks, self._remaining_days = divmod(days, 7)
         self._months = abs(months)
         self._years = abs(years)
 
         return self
 
+    @classmethod
+    def _from_microseconds(
+        cls, microseconds: int, years: int = 0, months: int = 0
+    ) -> Self:
+        return cls(0, 0, microseconds, years=years, months=months)
+
+    def _normalize(self, years: int, months: int) -> tuple[float, int, int, int]:
+        # The underlying timedelta does not include years and months
+        # so the total is the one of the native timedelta object
+        usec = self._raw_microseconds()
+
+        seconds, microseconds = divmod(abs(usec), US_PER_SECOND)
+        days, seconds = divmod(seconds, SECONDS_PER_DAY)
+
+        return (
+            usec / US_PER_SECOND,
+            days + years * 365 + months * 30,
+            seconds,
+            microseconds,
+        )
+
+    @property
+    def _weeks(self) -> int:
+        return int(abs(self._total)) // SECONDS_PER_DAY // 7
+
+    @property
+    def _remaining_days(self) -> int:
+        return int(abs(self._total)) // SECONDS_PER_DAY % 7
+
+    def _total_microseconds(self) -> int:
+        return abs(round(self._total * US_PER_SECOND))
+
+    def _fixed_microseconds(self) -> int:
+        return self._total_microseconds()
+
+    def _to_microseconds(self) -> int:
+        # Years and months are not part of the native timedelta
+        # but they are included in the days of absolute durations.
+        return (
+            self._total_microseconds()
+            + (self._years * 365 + self._months * 30) * _US_PER_DAY
+        )
+
     def total_seconds(self) -> float:
         return abs(self._total)
 
+    def __mul__(self, other: int | float) -> Self:
+        if isinstance(other, int):
+            # Years and months are multiplied separately
+            return self._from_microseconds(
+                round(self._total * US_PER_SECOND) * other,
+                years=self._years * other,
+                months=self._months * other,
+            )
+
+        return super().__mul__(other)
+
+    __rmul__ = __mul__
+
     @property
     def invert(self) -> bool:
-        if self._invert is None:
-            self._invert = self._total < 0
+        return self._total < 0
+
+
+class DurationAccumulator:
+    """
+    Mutable sum of durations.
+
+    Durations are accumulated as integer microseconds, years and months
+    and a Duration is only created when the total is requested.
+    Unlike with the + operator, years and months are kept as such
+    instead of being converted to days.
+    """
+
+    __slots__ = ("_microseconds", "_months", "_years")
 
-        return self._invert
+    def __init__(self, deltas: Iterable[timedelta] = ()) -> None:
+        self._microseconds = 0
+        self._months = 0
+        self._years = 0
+
+        self.update(deltas)
+
+    def add(self, delta: timedelta) -> None:
+        """
+        Adds a duration, or a native timedelta, to the total.
+        """
+        self.update((delta,))
+
+    def subtract(self, delta: timedelta) -> None:
+        """
+        Subtracts a duration, or a native timedelta, from the total.
+        """
+        if isinstance(delta, Duration):
+            self._microseconds -= delta._fixed_microseconds()
+            self._months -= delta._months
+            self._years -= delta._years
+        elif isinstance(delta, timedelta):
+            self._microseconds -= delta // _MICROSECOND
+        else:
+            raise TypeError(f"Expected a timedelta, got {type(delta).__name__}")
+
+    def update(self, deltas: Iterable[timedelta]) -> None:
+        """
+        Adds several durations, or native timedeltas, to the total.
+        """
+        microseconds = self._microseconds
+        months = self._months
+        years = self._years
+        for delta in deltas:
+            if isinstance(delta, Duration):
+                microseconds += delta._fixed_microseconds()
+                months += delta._months
+                years += delta._years
+            elif isinstance(delta, timedelta):
+                microseconds += delta // _MICROSECOND
+            else:
+                raise TypeError(f"Expected a timedelta, got {type(delta).__name__}")
+
+        self._microseconds = microseconds
+        self._months = months
+        self._years = years
+
+    def as_duration(self) -> Duration:
+        """
+        Returns the total as a Duration.
+        """
+        return Duration._from_microseconds(
+            self._microseconds, years=self._years, months=self._months
+        )
+
+    def __iadd__(self, other: timedelta) -> Self:
+        if not isinstance(other, timedelta):
+            return NotImplemented
+
+        self.add(other)
+
+        return self
+
+    def __isub__(self, other: timedelta) -> Self:
+        if not isinstance(other, timedelta):
+            return NotImplemented
+
+        self.subtract(other)
+
+        return self
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.as_duration()!r})"
@@ -9,6 +9,10 @@ if t.TYPE_CHECKING:
     from pendulum import Duration
 
 
+# Plenty for the distinct outputs of a few locales
+_CACHE_SIZE = 4096
+
+
 class DifferenceFormatter:
     """
     Handles formatting differences in text.
@@ -16,6 +20,9 @@ class DifferenceFormatter:
 
     def __init__(self, locale: str = "en") -> None:
         self._locale = Locale.load(locale)
+        # Formatted differences, keyed by their unit, count, direction,
+        # formatting options and locale since they are often repeated.
+        self._cache: dict[tuple[str, int, bool, bool, bool, Locale], str] = {}
 
     def format(
         self,
@@ -33,7 +40,29 @@ class DifferenceFormatter:
         :param locale: The locale to use
         """
         locale = self._locale if locale is None else Locale.load(locale)
+        unit, count = self._bucket(diff, locale)
+        key = (unit, count, diff.invert, is_now, absolute, locale)
+
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+
+        text = self._format(unit, count, diff.invert, is_now, absolute, locale)
+        if len(self._cache) >= _CACHE_SIZE:
+            self._cache.clear()
+
+        self._cache[key] = text
+
+        return text
+
+    def _bucket(self, diff: Duration, locale: Locale) -> tuple[str, int]:
+        """
+        Returns the unit in which a difference is expressed and its count.
 
+        Differences of a few seconds use the "few_second" unit
+        if the locale supports it.
+        """
         if diff.years > 0:
             unit = "year"
             count = diff.years
@@ -70,39 +99,48 @@ class DifferenceFormatter:
         elif 10 < diff.remaining_seconds <= 59:
             unit = "second"
             count = diff.remaining_seconds
+        elif locale.get("custom.units.few_second") is not None:
+            return "few_second", 0
         else:
-            # We check if the "a few seconds" unit exists
+            unit = "second"
+            count = diff.remaining_seconds
+
+        if count == 0:
+            count = 1
+
+        return unit, count
+
+    def _format(
+        self,
+        unit: str,
+        count: int,
+        is_future: bool,
+        is_now: bool,
+        absolute: bool,
+        locale: Locale,
+    ) -> str:
+        if unit == "few_second":
             time = locale.get("custom.units.few_second")
-            if time is not None:
-                if absolute:
-                    return t.cast(str, time)
+            if absolute:
+                return t.cast(str, time)
 
-                key = "custom"
-                is_future = diff.invert
-                if is_now:
-                    if is_future:
-                        key += ".from_now"
-                    else:
-                        key += ".ago"
+            key = "custom"
+            if is_now:
+                if is_future:
+                    key += ".from_now"
                 else:
-                    if is_future:
-                        key += ".after"
-                    else:
-                        key += ".before"
-
-                return t.cast(str, locale.get(key).format(time))
+                    key += ".ago"
             else:
-                unit = "second"
-                count = diff.remaining_seconds
+                if is_future:
+                    key += ".after"
+                else:
+                    key += ".before"
 
-        if count == 0:
-            count = 1
+            return t.cast(str, locale.get(key).format(time))
 
         if absolute:
             key = f"translations.units.{unit}"
         else:
-            is_future = diff.invert
-
             if is_now:
                 # Relative to now, so we can use
                 # the CLDR data
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import datetime
+import functools
 import re
 
 from typing import TYPE_CHECKING
@@ -8,7 +9,10 @@ from typing import Any
 from typing import Callable
 from typing import ClassVar
 from typing import Match
+from typing import NamedTuple
 from typing import Sequence
+from typing import Tuple
+from typing import Union
 from typing import cast
 
 import pendulum
@@ -43,6 +47,27 @@ _MATCH_WORD = (
 )
 _MATCH_TIMEZONE = "[A-Za-z0-9-+]+(/[A-Za-z0-9-+_]+)?"
 
+# A compiled format is a sequence of literal chunks
+# and callables rendering a single token.
+_CompiledFormat = Tuple[Union[str, Callable[["pendulum.DateTime"], str]], ...]
+
+
+class _CompiledPattern(NamedTuple):
+    """
+    A parsing format compiled to a regular expression.
+    """
+
+    regex: re.Pattern[str]
+    # (token, group index, whether the token is localizable)
+    tokens: tuple[tuple[str, int, bool], ...]
+
+
+def _nanoseconds(dt: pendulum.DateTime) -> int:
+    """
+    Returns the fractional second, in nanoseconds, of a datetime or time.
+    """
+    return dt.microsecond * 1000 + getattr(dt, "nanosecond", 0)
+
 
 class Formatter:
     _TOKENS: str = (
@@ -134,6 +159,9 @@ class Formatter:
         "SSSS": lambda dt: f"{dt.microsecond // 100:04d}",
         "SSSSS": lambda dt: f"{dt.microsecond // 10:05d}",
         "SSSSSS": lambda dt: f"{dt.microsecond:06d}",
+        "SSSSSSS": lambda dt: f"{_nanoseconds(dt) // 100:07d}",
+        "SSSSSSSS": lambda dt: f"{_nanoseconds(dt) // 10:08d}",
+        "SSSSSSSSS": lambda dt: f"{_nanoseconds(dt):09d}",
         # Timestamp
         "X": lambda dt: f"{dt.int_timestamp:d}",
         "x": lambda dt: f"{dt.int_timestamp * 1000 + dt.microsecond // 1000:d}",
@@ -151,6 +179,14 @@ class Formatter:
         "LLLL": "formats.datetime.full",
     }
 
+    _LOCALIZED_NAMES: ClassVar[dict[str, str]] = {
+        "MMM": "translations.months.abbreviated",
+        "MMMM": "translations.months.wide",
+        "dd": "translations.days.short",
+        "ddd": "translations.days.abbreviated",
+        "dddd": "translations.days.wide",
+    }
+
     _DEFAULT_DATE_FORMATS: ClassVar[dict[str, str]] = {
         "LTS": "h:mm:ss A",
         "LT": "h:mm A",
@@ -195,6 +231,9 @@ class Formatter:
         "SSSS": _MATCH_UNSIGNED,
         "SSSSS": _MATCH_UNSIGNED,
         "SSSSSS": _MATCH_UNSIGNED,
+        "SSSSSSS": _MATCH_UNSIGNED,
+        "SSSSSSSS": _MATCH_UNSIGNED,
+        "SSSSSSSSS": _MATCH_UNSIGNED,
         "x": _MATCH_SIGNED,
         "X": _MATCH_TIMESTAMP,
         "ZZ": _MATCH_SHORT_OFFSET,
@@ -233,6 +272,9 @@ class Formatter:
         "SSSS": lambda us: int(us) * 100,
         "SSSSS": lambda us: int(us) * 10,
         "SSSSSS": lambda us: int(us),
+        "SSSSSSS": lambda ns: int(ns) * 100,
+        "SSSSSSSS": lambda ns: int(ns) * 10,
+        "SSSSSSSSS": lambda ns: int(ns),
         "a": lambda meridiem: meridiem,
         "X": lambda ts: float(ts),
         "x": lambda ts: float(ts) / 1e3,
@@ -241,6 +283,18 @@ class Formatter:
         "z": str,
     }
 
+    # Maximum number of (format, locale) pairs kept compiled
+    # for formatting and parsing, respectively
+    _FORMAT_CACHE_SIZE: ClassVar[int] = 256
+
+    def __init__(self) -> None:
+        self._compiled_formats: Callable[
+            [str, str | Locale], _CompiledFormat
+        ] = functools.lru_cache(maxsize=self._FORMAT_CACHE_SIZE)(self._compile_format)
+        self._compiled_patterns: Callable[
+            [str, str], _CompiledPattern
+        ] = functools.lru_cache(maxsize=self._FORMAT_CACHE_SIZE)(self._compile_pattern)
+
     def format(
         self, dt: pendulum.DateTime, fmt: str, locale: str | Locale | None = None
     ) -> str:
@@ -251,18 +305,88 @@ class Formatter:
         :param fmt: The format to use
         :param locale: The locale to use
         """
-        loaded_locale: Locale = Locale.load(locale or pendulum.get_locale())
+        compiled = self._compiled_formats(fmt, locale or pendulum.get_locale())
 
-        result = self._FORMAT_RE.sub(
-            lambda m: m.group(1)
-            if m.group(1)
-            else m.group(2)
-            if m.group(2)
-            else self._format_token(dt, m.group(3), loaded_locale),
-            fmt,
+        return "".join(
+            [part if isinstance(part, str) else part(dt) for part in compiled]
         )
 
-        return result
+    def _compile_format(self, fmt: str, locale: str | Locale) -> _CompiledFormat:
+        """
+        Compiles a format into a sequence of literal chunks and token renderers.
+
+        :param fmt: The format to compile
+        :param locale: The locale to use
+        """
+        loaded_locale: Locale = Locale.load(locale or pendulum.get_locale())
+
+        parts: list[str | Callable[[pendulum.DateTime], str]] = []
+        position = 0
+        for m in self._FORMAT_RE.finditer(fmt):
+            if m.start() > position:
+                parts.append(fmt[position : m.start()])
+
+            position = m.end()
+
+            if m.group(1):
+                parts.append(m.group(1))
+            elif m.group(2):
+                parts.append(m.group(2))
+            elif m.group(3) in self._DATE_FORMATS:
+                parts.extend(
+                    self._compile_format(
+                        self._get_date_format(m.group(3), loaded_locale),
+                        loaded_locale,
+                    )
+                )
+            elif m.group(3) is not None:
+                parts.append(self._compile_token(m.group(3), loaded_locale))
+
+        if position < len(fmt):
+            parts.append(fmt[position:])
+
+        # Merging adjacent literal chunks
+        compiled: list[str | Callable[[pendulum.DateTime], str]] = []
+        for part in parts:
+            if isinstance(part, str) and compiled and isinstance(compiled[-1], str):
+                compiled[-1] += part
+            elif part != "":
+                compiled.append(part)
+
+        return tuple(compiled)
+
+    def _compile_token(
+        self, token: str, locale: Locale
+    ) -> str | Callable[[pendulum.DateTime], str]:
+        """
+        Returns a renderer for a given token and locale,
+        or the token itself if it is not a known token.
+
+        :param token: The token to compile
+        :param locale: The locale to use
+        """
+        if token in self._LOCALIZABLE_TOKENS:
+            translations = None
+            if token in self._LOCALIZED_NAMES:
+                translations = locale.get(self._LOCALIZED_NAMES[token])
+
+            if translations is not None:
+                if token.startswith("M"):
+                    return lambda dt: cast(str, translations[dt.month])
+
+                return lambda dt: cast(str, translations[dt.day_of_week])
+
+            return functools.partial(
+                self._format_localizable_token, token=token, locale=locale
+            )
+
+        if token in self._TOKENS_RULES:
+            return self._TOKENS_RULES[token]
+
+        if token in ["ZZ", "Z"]:
+            return functools.partial(self._format_offset, token=token)
+
+        return token
 
     def _format_token(self, dt: pendulum.DateTime, token: str, locale: Locale) -> str:
         """
@@ -273,11 +397,7 @@ class Formatter:
         :param locale: The locale to use
         """
         if token in self._DATE_FORMATS:
-            fmt = locale.get(f"custom.date_formats.{token}")
-            if fmt is None:
-                fmt = self._DEFAULT_DATE_FORMATS[token]
-
-            return self.format(dt, fmt, locale)
+            return self.format(dt, self._get_date_format(token, locale), locale)
 
         if token in self._LOCALIZABLE_TOKENS:
             return self._format_localizable_token(dt, token, locale)
@@ -287,20 +407,42 @@ class Formatter:
 
         # Timezone
         if token in ["ZZ", "Z"]:
-            if dt.tzinfo is None:
-                return ""
+            return self._format_offset(dt, token)
 
-            separator = ":" if token == "Z" else ""
-            offset = dt.utcoffset() or datetime.timedelta()
-            minutes = offset.total_seconds() / 60
+        return token
 
-            sign = "+" if minutes >= 0 else "-"
+    def _get_date_format(self, token: str, locale: Locale) -> str:
+        """
+        Returns the localized format of a given date format token.
 
-            hour, minute = divmod(abs(int(minutes)), 60)
+        :param token: The date format token
+        :param locale: The locale to use
+        """
+        fmt = locale.get(f"custom.date_formats.{token}")
+        if fmt is None:
+            fmt = self._DEFAULT_DATE_FORMATS[token]
 
-            return f"{sign}{hour:02d}{separator}{minute:02d}"
+        return cast(str, fmt)
 
-        return token
+    def _format_offset(self, dt: pendulum.DateTime, token: str) -> str:
+        """
+        Formats the UTC offset of a DateTime instance.
+
+        :param dt: The instance to format
+        :param token: The offset token to use (Z or ZZ)
+        """
+        if dt.tzinfo is None:
+            return ""
+
+        separator = ":" if token == "Z" else ""
+        offset = dt.utcoffset() or datetime.timedelta()
+        minutes = offset.total_seconds() / 60
+
+        sign = "+" if minutes >= 0 else "-"
+
+        hour, minute = divmod(abs(int(minutes)), 60)
+
+        return f"{sign}{hour:02d}{separator}{minute:02d}"
 
     def _format_localizable_token(
         self, dt: pendulum.DateTime, token: str, locale: Locale
@@ -374,15 +516,15 @@ class Formatter:
 
         :return: The parsed elements
         """
-        escaped_fmt = re.escape(fmt)
-
-        tokens = self._FROM_FORMAT_RE.findall(escaped_fmt)
-        if not tokens:
-            raise ValueError("The given time string does not match the given format")
-
         if not locale:
             locale = pendulum.get_locale()
 
+        compiled = self._compiled_patterns(fmt, locale)
+
+        m = compiled.regex.match(time)
+        if m is None:
+            raise ValueError(f"String does not match format {fmt}")
+
         loaded_locale: Locale = Locale.load(locale)
 
         parsed = {
@@ -393,6 +535,7 @@ class Formatter:
             "minute": None,
             "second": None,
             "microsecond": None,
+            "nanosecond": None,
             "tz": None,
             "quarter": None,
             "day_of_week": None,
@@ -401,19 +544,44 @@ class Formatter:
             "timestamp": None,
         }
 
+        for token, index, localizable in compiled.tokens:
+            if localizable:
+                self._get_parsed_locale_value(
+                    token, m.group(index), parsed, loaded_locale
+                )
+            else:
+                self._get_parsed_value(token, m.group(index), parsed, now)
+
+        return self._check_parsed(parsed, now)
+
+    def _compile_pattern(self, fmt: str, locale: str) -> _CompiledPattern:
+        """
+        Compiles a parsing format into a regular expression.
+
+        :param fmt: The format to compile
+        :param locale: The locale to use
+        """
+        escaped_fmt = re.escape(fmt)
+
+        tokens = self._FROM_FORMAT_RE.findall(escaped_fmt)
+        if not tokens:
+            raise ValueError("The given time string does not match the given format")
+
+        loaded_locale: Locale = Locale.load(locale)
+
         pattern = self._FROM_FORMAT_RE.sub(
             lambda m: self._replace_tokens(m.group(0), loaded_locale), escaped_fmt
         )
 
-        if not re.search("^" + pattern + "$", time):
-            raise ValueError(f"String does not match format {fmt}")
-
-        def _get_parsed_values(m: Match[str]) -> Any:
-            return self._get_parsed_values(m, parsed, loaded_locale, now)
+        regex = re.compile("^" + pattern + "$")
 
-        re.sub(pattern, _get_parsed_values, time)
-
-        return self._check_parsed(parsed, now)
+        return _CompiledPattern(
+            regex,
+            tuple(
+                (token, index, token in self._LOCALIZABLE_TOKENS)
+                for token, index in regex.groupindex.items()
+            ),
+        )
 
     def _check_parsed(
         self, parsed: dict[str, Any], now: pendulum.DateTime
@@ -433,6 +601,7 @@ class Formatter:
             "minute": parsed["minute"],
             "second": parsed["second"],
             "microsecond": parsed["microsecond"],
+            "nanosecond": parsed["nanosecond"] or 0,
             "tz": None,
         }
 
@@ -538,19 +707,6 @@ class Formatter:
 
         return validated
 
-    def _get_parsed_values(
-        self,
-        m: Match[str],
-        parsed: dict[str, Any],
-        locale: Locale,
-        now: pendulum.DateTime,
-    ) -> None:
-        for token, index in m.re.groupindex.items():
-            if token in self._LOCALIZABLE_TOKENS:
-                self._get_parsed_locale_value(token, m.group(index), parsed, locale)
-            else:
-                self._get_parsed_value(token, m.group(index), parsed, now)
-
     def _get_parsed_value(
         self,
         token: str,
@@ -588,7 +744,10 @@ class Formatter:
         elif "s" in token:
             parsed["second"] = parsed_token
         elif "S" in token:
-            parsed["microsecond"] = parsed_token
+            if len(token) > 6:
+                parsed["microsecond"], parsed["nanosecond"] = divmod(parsed_token, 1000)
+            else:
+                parsed["microsecond"] = parsed_token
         elif token in ["d", "E"]:
             parsed["day_of_week"] = parsed_token
         elif token in ["X", "x"]:
@@ -3,11 +3,16 @@ from __future__ import annotations
 import os
 import struct
 
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import date
 from datetime import datetime
 from datetime import timedelta
 from math import copysign
 from typing import TYPE_CHECKING
+from typing import Iterable
+from typing import Iterator
+from typing import NamedTuple
 from typing import TypeVar
 from typing import overload
 
@@ -21,6 +26,7 @@ from pendulum.locales.locale import Locale
 
 if TYPE_CHECKING:
     # Prevent import cycles
+    from pendulum.date import Date
     from pendulum.duration import Duration
 
 with_extensions = os.getenv("PENDULUM_EXTENSIONS", "1") == "1"
@@ -51,6 +57,22 @@ except ImportError:
 difference_formatter = DifferenceFormatter()
 
 
+class _Settings(NamedTuple):
+    """
+    Settings overridden in the current context.
+
+    Unset values fall back to the global ones.
+    """
+
+    locale: str | None = None
+    week_starts_at: WeekDay | None = None
+    week_ends_at: WeekDay | None = None
+
+
+_NO_SETTINGS = _Settings()
+_settings: ContextVar[_Settings] = ContextVar("pendulum_settings", default=_NO_SETTINGS)
+
+
 @overload
 def add_duration(
     dt: _DT,
@@ -168,6 +190,55 @@ def format_diff(
     return difference_formatter.format(diff, is_now, absolute, locale)
 
 
+def format_diffs(
+    dates: Iterable[Date],
+    other: Date | None = None,
+    absolute: bool = False,
+    locale: str | None = None,
+) -> list[str]:
+    """
+    Get the differences of several dates or datetimes in a human readable format,
+    like their diff_for_humans() method.
+
+    When comparing to now, it is only computed once for the whole batch.
+
+    :param dates: The dates or datetimes to format
+    :param other: The date or datetime to compare to (defaults to now)
+    :param absolute: removes time difference modifiers ago, after, etc
+    :param locale: The locale to use for localization
+    """
+    is_now = other is None
+    loaded_locale = Locale.load(locale or get_locale())
+
+    # Dates are compared to today and datetimes to now,
+    # each of them only being computed once.
+    now: pendulum.DateTime | None = None
+    today: Date | None = None
+
+    results = []
+    for dt in dates:
+        compared = other
+        if compared is None:
+            if isinstance(dt, pendulum.DateTime):
+                if now is None:
+                    now = dt.now()
+
+                compared = now
+            else:
+                if today is None:
+                    today = dt.today()
+
+                compared = today
+
+        results.append(
+            difference_formatter.format(
+                dt.diff(compared), is_now, absolute, loaded_locale
+            )
+        )
+
+    return results
+
+
 def _sign(x: float) -> int:
     return int(copysign(1, x))
 
@@ -186,21 +257,82 @@ def set_locale(name: str) -> None:
 
 
 def get_locale() -> str:
-    return pendulum._LOCALE
+    return _settings.get().locale or pendulum._LOCALE
 
 
 def week_starts_at(wday: WeekDay) -> None:
-    if wday < WeekDay.MONDAY or wday > WeekDay.SUNDAY:
-        raise ValueError("Invalid day of week")
+    _check_week_day(wday)
 
     pendulum._WEEK_STARTS_AT = wday
 
 
+def get_week_starts_at() -> WeekDay:
+    wday = _settings.get().week_starts_at
+
+    return pendulum._WEEK_STARTS_AT if wday is None else wday
+
+
 def week_ends_at(wday: WeekDay) -> None:
+    _check_week_day(wday)
+
+    pendulum._WEEK_ENDS_AT = wday
+
+
+def get_week_ends_at() -> WeekDay:
+    wday = _settings.get().week_ends_at
+
+    return pendulum._WEEK_ENDS_AT if wday is None else wday
+
+
+def _check_week_day(wday: WeekDay) -> None:
     if wday < WeekDay.MONDAY or wday > WeekDay.SUNDAY:
         raise ValueError("Invalid day of week")
 
-    pendulum._WEEK_ENDS_AT = wday
+
+@contextmanager
+def settings(
+    locale: str | None = None,
+    week_start: WeekDay | None = None,
+    week_end: WeekDay | None = None,
+) -> Iterator[None]:
+    """
+    Overrides the locale and the week boundaries in the current context only,
+    unlike set_locale(), week_starts_at() and week_ends_at()
+    which change them globally.
+
+    Since settings are stored in a context variable, concurrent threads
+    and asyncio tasks can each use their own without interfering.
+
+    :param locale: The locale to use
+    :param week_start: The first day of the week
+    :param week_end: The last day of the week,
+                     defaults to the day before week_start if it is set
+    """
+    if locale is not None:
+        Locale.load(locale)
+
+    if week_start is not None:
+        _check_week_day(week_start)
+
+        if week_end is None:
+            week_end = WeekDay((week_start - 1) % 7)
+
+    if week_end is not None:
+        _check_week_day(week_end)
+
+    current = _settings.get()
+    token = _settings.set(
+        _Settings(
+            locale or current.locale,
+            current.week_starts_at if week_start is None else week_start,
+            current.week_ends_at if week_end is None else week_end,
+        )
+    )
+
+    try:
+        yield
+    finally:
+        _settings.reset(token)
 
 
 __all__ = [
@@ -213,9 +345,13 @@ __all__ = [
     "week_day",
     "add_duration",
     "format_diff",
+    "format_diffs",
     "locale",
     "set_locale",
     "get_locale",
     "week_starts_at",
+    "get_week_starts_at",
     "week_ends_at",
+    "get_week_ends_at",
+    "settings",
 ]
@@ -6,16 +6,24 @@ from datetime import date
 from datetime import datetime
 from datetime import timedelta
 from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
 from typing import Iterator
+from typing import Sequence
 from typing import Union
 from typing import cast
 from typing import overload
 
 import pendulum
 
+from pendulum.constants import DAYS_PER_MONTHS
 from pendulum.constants import MONTHS_PER_YEAR
+from pendulum.constants import US_PER_SECOND
 from pendulum.duration import Duration
+from pendulum.helpers import is_leap
 from pendulum.helpers import precise_diff
+from pendulum.tz.timezone import FixedTimezone
+from pendulum.tz.timezone import Timezone
 
 
 if TYPE_CHECKING:
@@ -31,6 +39,8 @@ class Interval(Duration):
     An interval of time between two datetimes.
     """
 
+    __slots__ = ("_absolute", "_end", "_invert", "_precise_diff", "_start")
+
     @overload
     def __new__(
         cls,
@@ -80,56 +90,7 @@ class Interval(Duration):
         if absolute and start > end:
             end, start = start, end
 
-        _start = start
-        _end = end
-        if isinstance(start, pendulum.DateTime):
-            _start = datetime(
-                start.year,
-                start.month,
-                start.day,
-                start.hour,
-                start.minute,
-                start.second,
-                start.microsecond,
-                tzinfo=start.tzinfo,
-                fold=start.fold,
-            )
-        elif isinstance(start, pendulum.Date):
-            _start = date(start.year, start.month, start.day)
-
-        if isinstance(end, pendulum.DateTime):
-            _end = datetime(
-                end.year,
-                end.month,
-                end.day,
-                end.hour,
-                end.minute,
-                end.second,
-                end.microsecond,
-                tzinfo=end.tzinfo,
-                fold=end.fold,
-            )
-        elif isinstance(end, pendulum.Date):
-            _end = date(end.year, end.month, end.day)
-
-        # Fixing issues with datetime.__sub__()
-        # not handling offsets if the tzinfo is the same
-        if (
-            isinstance(_start, datetime)
-            and isinstance(_end, datetime)
-            and _start.tzinfo is _end.tzinfo
-        ):
-            if _start.tzinfo is not None:
-                offset = cast(timedelta, cast(datetime, start).utcoffset())
-                _start = (_start - offset).replace(tzinfo=None)
-
-            if isinstance(end, datetime) and _end.tzinfo is not None:
-                offset = cast(timedelta, end.utcoffset())
-                _end = (_end - offset).replace(tzinfo=None)
-
-        delta: timedelta = _end - _start  # type: ignore[operator]
-
-        return super().__new__(cls, seconds=delta.total_seconds())
+        return super().__new__(cls, seconds=_timedelta(start, end).total_seconds())
 
     def __init__(
         self,
@@ -139,64 +100,38 @@ class Interval(Duration):
     ) -> None:
         super().__init__()
 
-        _start: pendulum.DateTime | pendulum.Date | datetime | date
         if not isinstance(start, pendulum.Date):
             if isinstance(start, datetime):
                 start = pendulum.instance(start)
             else:
                 start = pendulum.date(start.year, start.month, start.day)
 
-            _start = start
-        else:
-            if isinstance(start, pendulum.DateTime):
-                _start = datetime(
-                    start.year,
-                    start.month,
-                    start.day,
-                    start.hour,
-                    start.minute,
-                    start.second,
-                    start.microsecond,
-                    tzinfo=start.tzinfo,
-                )
-            else:
-                _start = date(start.year, start.month, start.day)
-
-        _end: pendulum.DateTime | pendulum.Date | datetime | date
         if not isinstance(end, pendulum.Date):
             if isinstance(end, datetime):
                 end = pendulum.instance(end)
             else:
                 end = pendulum.date(end.year, end.month, end.day)
 
-            _end = end
-        else:
-            if isinstance(end, pendulum.DateTime):
-                _end = datetime(
-                    end.year,
-                    end.month,
-                    end.day,
-                    end.hour,
-                    end.minute,
-                    end.second,
-                    end.microsecond,
-                    tzinfo=end.tzinfo,
-                )
-            else:
-                _end = date(end.year, end.month, end.day)
-
         self._invert = False
         if start > end:
             self._invert = True
 
             if absolute:
                 end, start = start, end
-                _end, _start = _start, _end
 
         self._absolute = absolute
         self._start: pendulum.DateTime | pendulum.Date = start
         self._end: pendulum.DateTime | pendulum.Date = end
-        self._delta: PreciseDiff = precise_diff(_start, _end)
+        self._precise_diff: PreciseDiff | None = None
+
+    @property
+    def _delta(self) -> PreciseDiff:
+        # The calendar breakdown is not needed for containment checks
+        # or iteration, so it is only computed when first accessed.
+        if self._precise_diff is None:
+            self._precise_diff = precise_diff(_native(self._start), _native(self._end))
+
+        return self._precise_diff
 
     @property
     def years(self) -> int:
@@ -226,6 +161,10 @@ class Interval(Duration):
     def minutes(self) -> int:
         return self._delta.minutes
 
+    @property
+    def invert(self) -> bool:
+        return self._invert
+
     @property
     def start(self) -> pendulum.DateTime | pendulum.Date | datetime | date:
         return self._start
@@ -258,6 +197,18 @@ class Interval(Duration):
     def in_days(self) -> int:
         return self._delta.total_days
 
+    def in_nanoseconds(self) -> int:
+        """
+        Gives the duration of the Interval in nanoseconds,
+        including the sub-microsecond part of its endpoints.
+        """
+        start, end = self._start, self._end
+        nanoseconds = _timedelta(start, end) // _MICROSECOND * 1000
+        if isinstance(start, pendulum.DateTime) and isinstance(end, pendulum.DateTime):
+            nanoseconds += end.nanosecond - start.nanosecond
+
+        return abs(nanoseconds) if self._absolute else nanoseconds
+
     def in_words(self, locale: str | None = None, separator: str = " ") -> str:
         """
         Get the current interval in words in the current locale.
@@ -301,24 +252,27 @@ class Interval(Duration):
 
         return separator.join(parts)
 
-    def range(
-        self, unit: str, amount: int = 1
-    ) -> Iterator[pendulum.DateTime | pendulum.Date]:
-        method = "add"
-        op = operator.le
-        if not self._absolute and self.invert:
-            method = "subtract"
-            op = operator.ge
+    def range(self, unit: str, amount: int = 1) -> IntervalRange:
+        """
+        Returns the datetimes, or dates, of the interval
+        spaced by the given amount of the given unit.
 
-        start, end = self.start, self.end
+        The returned sequence computes its elements on demand,
+        so its length and arbitrary elements are available without iterating.
 
-        i = amount
-        while op(start, end):
-            yield cast(Union[pendulum.DateTime, pendulum.Date], start)
+        :param unit: The unit, as accepted by add()
+        :param amount: The number of units between two elements
+        """
+        if amount <= 0:
+            raise ValueError("The amount must be positive")
 
-            start = getattr(self.start, method)(**{unit: i})
+        step = amount
+        op = operator.le
+        if not self._absolute and self.invert:
+            step = -amount
+            op = operator.ge
 
-            i += amount
+        return IntervalRange(self._start, self._end, unit, step, op)
 
     def as_duration(self) -> Duration:
         """
@@ -327,7 +281,7 @@ class Interval(Duration):
         return Duration(seconds=self.total_seconds())
 
     def __iter__(self) -> Iterator[pendulum.DateTime | pendulum.Date]:
-        return self.range("days")
+        return iter(self.range("days"))
 
     def __contains__(
         self, item: datetime | date | pendulum.DateTime | pendulum.Date
@@ -453,3 +407,370 @@ class Interval(Duration):
 
     def __ne__(self, other: object) -> bool:
         return not self.__eq__(other)
+
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+_FIXED_UNITS = {"hours", "minutes", "seconds", "microseconds"}
+_DAYS_PER_UNIT = {"weeks": 7, "days": 1}
+_MONTHS_PER_UNIT = {"years": MONTHS_PER_YEAR, "months": 1}
+
+
+class IntervalRange(Sequence[Union["pendulum.DateTime", "pendulum.Date"]]):
+    """
+    The datetimes, or dates, of an interval spaced by a constant step.
+
+    The n-th element is the start of the interval shifted by n steps,
+    following the semantics of add(). Elements are computed directly
+    from their index rather than by repeatedly adding to the start.
+    """
+
+    def __init__(
+        self,
+        start: pendulum.DateTime | pendulum.Date,
+        end: pendulum.DateTime | pendulum.Date,
+        unit: str,
+        step: int,
+        op: Callable[[Any, Any], bool],
+    ) -> None:
+        self._start = start
+        self._end = end
+        self._unit = unit
+        self._step = step
+        self._op = op
+        self._length: int | None = None
+        self._next = 0
+        self._shift = self._get_shift()
+
+    def _get_shift(self) -> Callable[[int], pendulum.DateTime | pendulum.Date]:
+        """
+        Returns a function computing the start shifted by a number of steps.
+        """
+        start = self._start
+        unit = self._unit
+        step = self._step
+
+        if isinstance(start, datetime):
+            if start.tzinfo is None or isinstance(
+                start.tzinfo, (Timezone, FixedTimezone)
+            ):
+                if unit in _FIXED_UNITS:
+                    return self._get_fixed_shift(start, timedelta(**{unit: step}))
+
+                if unit in _DAYS_PER_UNIT:
+                    return self._get_local_shift(
+                        start, days=_DAYS_PER_UNIT[unit] * step
+                    )
+
+                if unit in _MONTHS_PER_UNIT:
+                    return self._get_local_shift(
+                        start, months=_MONTHS_PER_UNIT[unit] * step
+                    )
+        elif unit in _DAYS_PER_UNIT:
+            cls = start.__class__
+            ordinal = start.toordinal()
+            days = _DAYS_PER_UNIT[unit] * step
+
+            return lambda n: cls.fromordinal(ordinal + n * days)
+        elif unit in _MONTHS_PER_UNIT:
+            cls = start.__class__
+            months = _MONTHS_PER_UNIT[unit] * step
+
+            def shift_date(n: int) -> pendulum.Date:
+                year, month, day = _add_months(start, n * months)
+
+                return cls(year, month, day)
+
+            return shift_date
+
+        method = start.add
+
+        return lambda n: method(**{unit: n * step})
+
+    @staticmethod
+    def _get_fixed_shift(
+        start: pendulum.DateTime, delta: timedelta
+    ) -> Callable[[int], pendulum.DateTime]:
+        # Units of fixed length are added to the absolute time
+        # and the result is converted back to the timezone.
+        cls = start.__class__
+        tz = start.tzinfo
+        naive = datetime(
+            start.year,
+            start.month,
+            start.day,
+            start.hour,
+            start.minute,
+            start.second,
+            start.microsecond,
+        )
+
+        if tz is None:
+
+            def shift_naive(n: int) -> pendulum.DateTime:
+                dt = naive + delta * n
+
+                return cls(
+                    dt.year,
+                    dt.month,
+                    dt.day,
+                    dt.hour,
+                    dt.minute,
+                    dt.second,
+                    dt.microsecond,
+                    fold=1,
+                )
+
+            return shift_naive
+
+        utc = naive - cast(timedelta, start.utcoffset())
+
+        def shift(n: int) -> pendulum.DateTime:
+            dt = tz.fromutc((utc + delta * n).replace(tzinfo=tz))
+
+            return cls(
+                dt.year,
+                dt.month,
+                dt.day,
+                dt.hour,
+                dt.minute,
+                dt.second,
+                dt.microsecond,
+                tzinfo=tz,
+                fold=dt.fold,
+            )
+
+        return shift
+
+    @staticmethod
+    def _get_local_shift(
+        start: pendulum.DateTime, months: int = 0, days: int = 0
+    ) -> Callable[[int], pendulum.DateTime]:
+        # Units of variable length are added to the local time
+        # which is then normalized in the timezone.
+        cls = start.__class__
+        tz = cast(Union[Timezone, FixedTimezone, None], start.tzinfo)
+        ordinal = start.toordinal()
+        time = (start.hour, start.minute, start.second, start.microsecond)
+
+        def shift(n: int) -> pendulum.DateTime:
+            if months:
+                year, month, day = _add_months(start, n * months)
+            else:
+                d = date.fromordinal(ordinal + n * days)
+                year, month, day = d.year, d.month, d.day
+
+            dt = datetime(year, month, day, *time, fold=1)
+            if tz is not None:
+                dt = tz.convert(dt)
+
+            return cls(
+                dt.year,
+                dt.month,
+                dt.day,
+                dt.hour,
+                dt.minute,
+                dt.second,
+                dt.microsecond,
+                tzinfo=dt.tzinfo,
+                fold=dt.fold,
+            )
+
+        return shift
+
+    def _get(self, index: int) -> pendulum.DateTime | pendulum.Date:
+        if index == 0:
+            return self._start
+
+        return self._shift(index)
+
+    def _is_in_range(self, index: int) -> bool:
+        try:
+            return self._op(self._get(index), self._end)
+        except (OverflowError, ValueError):
+            # Out of the range of supported dates, hence past the end
+            return False
+
+    def __len__(self) -> int:
+        if self._length is None:
+            # Elements are monotonic, so the length is the index
+            # of the first element past the end, found by exponential search.
+            if not self._is_in_range(0):
+                self._length = 0
+
+                return 0
+
+            low, high = 0, 1
+            while self._is_in_range(high):
+                low, high = high, high * 2
+
+            while high - low > 1:
+                middle = (low + high) // 2
+                if self._is_in_range(middle):
+                    low = middle
+                else:
+                    high = middle
+
+            self._length = self._truncate_at_folds(high)
+
+        return self._length
+
+    def _truncate_at_folds(self, length: int) -> int:
+        """
+        Adjusts a length computed as if elements were monotonic.
+
+        Elements of fixed units are evenly spaced in absolute time
+        but, when compared to an end in the same timezone, only their
+        wall clock time matters, and it goes backward at repeated times.
+        An element close to a fold can then be past the end
+        even though the following ones are not.
+        """
+        start = self._start
+        end = self._end
+        if (
+            self._unit not in _FIXED_UNITS
+            or not isinstance(start, datetime)
+            or not isinstance(end, datetime)
+            or not isinstance(start.tzinfo, Timezone)
+            or end.tzinfo is not start.tzinfo
+        ):
+            return length
+
+        window = start.tzinfo._transition_window(end.year)
+        if window is None:
+            return length
+
+        step = timedelta(**{self._unit: self._step}) // _MICROSECOND
+        origin = (
+            _wall_microseconds(start)
+            - cast(timedelta, start.utcoffset()) // _MICROSECOND
+        )
+        wall = _wall_microseconds(end)
+
+        for at, before, after in window.transitions:
+            if before <= after:
+                continue
+
+            at *= US_PER_SECOND
+            before *= US_PER_SECOND
+            after *= US_PER_SECOND
+
+            if step > 0 and at + after <= wall < at + before:
+                # The first element after the end in the repeated period
+                index = max((wall - before - origin) // step + 1, 0)
+                if origin + index * step < at:
+                    length = min(length, index)
+            elif step < 0 and at + after < wall <= at + before:
+                # The first element before the end in the repeated period
+                index = max((origin - wall + after) // -step + 1, 0)
+                if origin + index * step >= at:
+                    length = min(length, index)
+
+        return length
+
+    @overload
+    def __getitem__(self, index: SupportsIndex) -> pendulum.DateTime | pendulum.Date:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[pendulum.DateTime | pendulum.Date]:
+        ...
+
+    def __getitem__(
+        self, index: SupportsIndex | slice
+    ) -> pendulum.DateTime | pendulum.Date | list[pendulum.DateTime | pendulum.Date]:
+        length = len(self)
+
+        if isinstance(index, slice):
+            return [self._get(i) for i in range(*index.indices(length))]
+
+        i = operator.index(index)
+        if i < 0:
+            i += length
+
+        if not 0 <= i < length:
+            raise IndexError("IntervalRange index out of range")
+
+        return self._get(i)
+
+    def __iter__(self) -> Iterator[pendulum.DateTime | pendulum.Date]:
+        op = self._op
+        end = self._end
+
+        i = 0
+        while True:
+            dt = self._get(i)
+            if not op(dt, end):
+                return
+
+            yield dt
+
+            i += 1
+
+    def __next__(self) -> pendulum.DateTime | pendulum.Date:
+        # Ranges used to be generators, so they can still be consumed
+        # with next(), independently of the iterators returned by iter().
+        dt = self._get(self._next)
+        if not self._op(dt, self._end):
+            raise StopIteration
+
+        self._next += 1
+
+        return dt
+
+    def __repr__(self) -> str:
+        return (
+            f"<IntervalRange [{self._start} -> {self._end}]"
+            f" {self._unit}={abs(self._step)}>"
+        )
+
+
+def _timedelta(
+    start: pendulum.DateTime | pendulum.Date | datetime | date,
+    end: pendulum.DateTime | pendulum.Date | datetime | date,
+) -> timedelta:
+    # Using the native subtractions since pendulum's return an Interval
+    if isinstance(start, datetime) and isinstance(end, datetime):
+        delta = datetime.__sub__(end, start)
+
+        if start.tzinfo is not None and start.tzinfo is end.tzinfo:
+            # datetime.__sub__() does not handle offsets
+            # if the tzinfo is the same
+            delta -= cast(timedelta, end.utcoffset()) - cast(
+                timedelta, start.utcoffset()
+            )
+
+        return delta
+
+    return date.__sub__(end, start)
+
+
+def _native(dt: pendulum.DateTime | pendulum.Date) -> datetime | date:
+    # precise_diff() relies on the native arithmetic operators
+    if isinstance(dt, datetime):
+        return datetime(
+            dt.year,
+            dt.month,
+            dt.day,
+            dt.hour,
+            dt.minute,
+            dt.second,
+            dt.microsecond,
+            tzinfo=dt.tzinfo,
+            fold=dt.fold,
+        )
+
+    return date(dt.year, dt.month, dt.day)
+
+
+def _wall_microseconds(dt: datetime) -> int:
+    # Using the native subtraction since DateTime returns an Interval
+    return datetime.__sub__(dt.replace(tzinfo=None), _EPOCH) // _MICROSECOND
+
+
+def _add_months(dt: date, months: int) -> tuple[int, int, int]:
+    year, month = divmod(dt.year * MONTHS_PER_YEAR + dt.month - 1 + months, 12)
+    month += 1
+
+    return year, month, min(DAYS_PER_MONTHS[int(is_leap(year))][month], dt.day)
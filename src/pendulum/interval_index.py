@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+import datetime as _datetime
+
+from bisect import bisect_right
+from typing import Iterable
+from typing import Iterator
+
+from pendulum.interval import Interval
+
+
+_EPOCH = _datetime.datetime(1970, 1, 1)
+_UTC_EPOCH = _EPOCH.replace(tzinfo=_datetime.timezone.utc)
+_MICROSECOND = _datetime.timedelta(microseconds=1)
+
+_DATE = "date"
+_NAIVE = "naive"
+_AWARE = "aware"
+
+
+class _Node:
+    """
+    A node of a centered interval tree.
+
+    It holds the intervals containing its center, sorted by start
+    and by descending end. The others are in the left subtree
+    if they end before the center, or in the right one otherwise.
+    """
+
+    __slots__ = ("by_end", "by_start", "center", "left", "right")
+
+    def __init__(
+        self,
+        center: int,
+        by_start: list[tuple[int, int]],
+        by_end: list[tuple[int, int]],
+        left: _Node | None,
+        right: _Node | None,
+    ) -> None:
+        self.center = center
+        self.by_start = by_start
+        self.by_end = by_end
+        self.left = left
+        self.right = right
+
+
+class IntervalIndex:
+    """
+    An immutable collection of intervals which can be queried efficiently.
+
+    Endpoints are compared as absolute instants, so intervals
+    and queries must either all be dates, naive datetimes
+    or aware datetimes.
+
+    >>> import pendulum
+    >>> dt = pendulum.datetime(2023, 1, 1)
+    >>> index = pendulum.IntervalIndex([
+    ...     pendulum.interval(dt, dt.add(days=2)),
+    ...     pendulum.interval(dt.add(days=1), dt.add(days=4)),
+    ... ])
+    >>> len(index.containing(dt.add(days=1, hours=12)))
+    2
+    """
+
+    __slots__ = ("_ends", "_intervals", "_kind", "_root", "_starts")
+
+    def __init__(self, intervals: Iterable[Interval] = ()) -> None:
+        kind: str | None = None
+        entries = []
+        for interval in intervals:
+            start_kind, start = _key(interval.start)
+            end_kind, end = _key(interval.end)
+            if kind is None:
+                kind = start_kind
+
+            if start_kind != kind or end_kind != kind:
+                raise TypeError(
+                    "Intervals of an index must all be between dates,"
+                    " naive datetimes or aware datetimes"
+                )
+
+            if start > end:
+                start, end = end, start
+
+            entries.append((start, end, interval))
+
+        entries.sort(key=lambda entry: entry[0])
+
+        self._kind = kind
+        self._starts = [entry[0] for entry in entries]
+        self._ends = [entry[1] for entry in entries]
+        self._intervals = [entry[2] for entry in entries]
+        self._root = self._build(list(range(len(entries))))
+
+    def _build(self, indices: list[int]) -> _Node | None:
+        """
+        Builds the tree of the given intervals, sorted by start.
+
+        Using the median start as the center ensures both subtrees
+        contain at most half of the intervals.
+        """
+        if not indices:
+            return None
+
+        starts = self._starts
+        ends = self._ends
+        center = starts[indices[len(indices) // 2]]
+
+        left = []
+        right = []
+        overlapping = []
+        for i in indices:
+            if ends[i] < center:
+                left.append(i)
+            elif starts[i] > center:
+                right.append(i)
+            else:
+                overlapping.append(i)
+
+        return _Node(
+            center,
+            [(starts[i], i) for i in overlapping],
+            sorted(((ends[i], i) for i in overlapping), reverse=True),
+            self._build(left),
+            self._build(right),
+        )
+
+    def _check_kind(self, kind: str) -> None:
+        if self._kind is not None and kind != self._kind:
+            raise TypeError(f"Cannot query an index of {self._kind} with a {kind}")
+
+    def containing(self, dt: _datetime.date) -> list[Interval]:
+        """
+        Returns the intervals containing the given date or datetime,
+        endpoints included, in no particular order.
+
+        :param dt: The date or datetime to look for
+        """
+        kind, key = _key(dt)
+        self._check_kind(kind)
+
+        intervals = self._intervals
+
+        return [intervals[i] for i in self._stab(key)]
+
+    def overlapping(self, start: _datetime.date, end: _datetime.date) -> list[Interval]:
+        """
+        Returns the intervals overlapping the given range,
+        endpoints included, in no particular order.
+
+        :param start: The start of the range
+        :param end: The end of the range
+        """
+        start_kind, start_key = _key(start)
+        end_kind, end_key = _key(end)
+        self._check_kind(start_kind)
+        self._check_kind(end_kind)
+
+        if start_key > end_key:
+            start_key, end_key = end_key, start_key
+
+        # Intervals overlapping the range either contain its start
+        # or start within it.
+        indices = self._stab(start_key)
+        indices.extend(
+            range(
+                bisect_right(self._starts, start_key),
+                bisect_right(self._starts, end_key),
+            )
+        )
+
+        intervals = self._intervals
+
+        return [intervals[i] for i in indices]
+
+    def _stab(self, key: int) -> list[int]:
+        indices = []
+        node = self._root
+        while node is not None:
+            if key < node.center:
+                for start, i in node.by_start:
+                    if start > key:
+                        break
+
+                    indices.append(i)
+
+                node = node.left
+            elif key > node.center:
+                for end, i in node.by_end:
+                    if end < key:
+                        break
+
+                    indices.append(i)
+
+                node = node.right
+            else:
+                indices.extend(i for _, i in node.by_start)
+
+                break
+
+        return indices
+
+    def merged(self) -> list[Interval]:
+        """
+        Returns the union of the intervals of the index as
+        the smallest list of disjoint intervals, sorted by start.
+
+        Intervals sharing an endpoint are merged.
+        """
+        merged: list[Interval] = []
+        if not self._intervals:
+            return merged
+
+        starts = self._starts
+        ends = self._ends
+        intervals = self._intervals
+
+        start_index = end_index = 0
+        for i in range(1, len(intervals)):
+            if starts[i] > ends[end_index]:
+                merged.append(self._span(start_index, end_index))
+                start_index = end_index = i
+            elif ends[i] > ends[end_index]:
+                end_index = i
+
+        merged.append(self._span(start_index, end_index))
+
+        return merged
+
+    def _span(self, start_index: int, end_index: int) -> Interval:
+        return Interval(
+            _lower(self._intervals[start_index]), _upper(self._intervals[end_index])
+        )
+
+    def __len__(self) -> int:
+        return len(self._intervals)
+
+    def __iter__(self) -> Iterator[Interval]:
+        """
+        Iterates over the intervals, sorted by start.
+        """
+        return iter(self._intervals)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._intervals!r})"
+
+
+def _key(value: _datetime.date) -> tuple[str, int]:
+    """
+    Returns the kind of a date or datetime and a sortable integer for it.
+    """
+    if isinstance(value, _datetime.datetime):
+        # Using the native subtraction since DateTime returns an Interval
+        if value.tzinfo is None:
+            return _NAIVE, _datetime.datetime.__sub__(value, _EPOCH) // _MICROSECOND
+
+        return _AWARE, _datetime.datetime.__sub__(value, _UTC_EPOCH) // _MICROSECOND
+
+    return _DATE, value.toordinal()
+
+
+def _lower(interval: Interval) -> _datetime.date:
+    start, end = interval.start, interval.end
+
+    return start if _key(start)[1] <= _key(end)[1] else end
+
+
+def _upper(interval: Interval) -> _datetime.date:
+    start, end = interval.start, interval.end
+
+    return end if _key(start)[1] <= _key(end)[1] else start
+
+
+__all__ = ["IntervalIndex"]
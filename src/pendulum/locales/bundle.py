@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import ast
+import inspect
+import marshal
+import mmap
+import struct
+
+from importlib import import_module
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Iterable
+from typing import cast
+
+from pendulum.utils._compat import resources
+
+
+if TYPE_CHECKING:
+    import os
+
+_MAGIC = b"PLB"
+_VERSION = 1
+# Magic, format version and size of the index
+_HEADER = struct.Struct("<3sBI")
+
+# Entries of the locale data which are functions, stored as source code
+_RULES = ("plural", "ordinal")
+
+
+class LocaleBundle:
+    """
+    A file holding the data of several locales, generated by compile_bundle().
+
+    Only the index is read when opening a bundle, the data of a locale
+    is read from the memory mapped file the first time it is requested.
+
+    Since plural rules are stored as source code,
+    only bundles from a trusted source must be loaded.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        with open(path, "rb") as f:
+            self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, index_size = _HEADER.unpack_from(self._buffer)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"[{path}] is not a valid locale bundle.")
+
+        start = _HEADER.size
+        self._index: dict[str, tuple[int, int]] = marshal.loads(
+            self._buffer[start : start + index_size]
+        )
+        self._start = start + index_size
+
+    def __contains__(self, locale: object) -> bool:
+        return locale in self._index
+
+    def locales(self) -> list[str]:
+        return list(self._index)
+
+    def load(self, locale: str) -> tuple[dict[str, Any], dict[str, Any]]:
+        """
+        Returns the data of a locale, in the same shape as the locale modules,
+        and its flattened key table.
+
+        :param locale: The normalized name of the locale
+        """
+        offset, size = self._index[locale]
+        start = self._start + offset
+        rules, table = marshal.loads(self._buffer[start : start + size])
+
+        data = {key: value for key, value in table.items() if "." not in key}
+        for name, source in rules.items():
+            data[name] = eval(source, {})
+
+        return data, table
+
+
+def compile_bundle(
+    path: str | os.PathLike[str], locales: Iterable[str] | None = None
+) -> None:
+    """
+    Compiles the data of the given locales, all of them by default,
+    into a single bundle file that can be loaded by Locale.use_bundle().
+
+    :param path: The path of the bundle to write
+    :param locales: The names of the locales to include
+    """
+    if locales is None:
+        locales = available_locales()
+
+    index: dict[str, tuple[int, int]] = {}
+    payloads: list[bytes] = []
+    offset = 0
+    for locale in locales:
+        module = import_module(f"pendulum.locales.{locale}.locale")
+        rules = _rule_sources(module)
+        table: dict[str, Any] = {}
+        _flatten(
+            {key: value for key, value in module.locale.items() if key not in rules},
+            "",
+            table,
+        )
+
+        payload = marshal.dumps((rules, table))
+        index[locale] = (offset, len(payload))
+        payloads.append(payload)
+        offset += len(payload)
+
+    header = marshal.dumps(index)
+
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, _VERSION, len(header)))
+        f.write(header)
+        f.writelines(payloads)
+
+
+def available_locales() -> list[str]:
+    """
+    Returns the names of the locales shipped with pendulum.
+    """
+    return sorted(
+        entry.name
+        for entry in cast(Path, resources.files(__package__)).iterdir()
+        if entry.joinpath("locale.py").is_file()
+    )
+
+
+def _flatten(data: dict[Any, Any], prefix: str, table: dict[str, Any]) -> None:
+    """
+    Stores every value reachable with a dotted key in the given table.
+
+    Non string keys cannot be part of a dotted key,
+    so their values are only reachable through their parent.
+    """
+    for key, value in data.items():
+        if not isinstance(key, str):
+            continue
+
+        table[f"{prefix}{key}"] = value
+
+        if isinstance(value, dict):
+            _flatten(value, f"{prefix}{key}.", table)
+
+
+def _rule_sources(module: Any) -> dict[str, str]:
+    """
+    Extracts the source code of the rules of a locale module.
+    """
+    source = inspect.getsource(module)
+    rules = {}
+    for node in ast.parse(source).body:
+        if (
+            isinstance(node, ast.Assign)
+            and isinstance(node.targets[0], ast.Name)
+            and node.targets[0].id == "locale"
+            and isinstance(node.value, ast.Dict)
+        ):
+            for key, value in zip(node.value.keys, node.value.values):
+                if isinstance(key, ast.Constant) and key.value in _RULES:
+                    # Parenthesized since the expression may span several lines
+                    segment = ast.get_source_segment(source, value)
+                    rules[key.value] = f"({segment})"
+
+    if set(rules) != set(_RULES):
+        raise ValueError(f"Unable to find the rules of [{module.__name__}].")
+
+    return rules
+
+
+__all__ = ["LocaleBundle", "available_locales", "compile_bundle"]
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import os
 import re
 
 from importlib import import_module
 from pathlib import Path
+from typing import TYPE_CHECKING
 from typing import Any
 from typing import ClassVar
 from typing import Dict
@@ -12,17 +14,47 @@ from typing import cast
 from pendulum.utils._compat import resources
 
 
+if TYPE_CHECKING:
+    from pendulum.locales.bundle import LocaleBundle
+
+
 class Locale:
     """
     Represent a specific locale.
     """
 
     _cache: ClassVar[dict[str, Locale]] = {}
+    _bundle: ClassVar[LocaleBundle | None] = None
 
-    def __init__(self, locale: str, data: Any) -> None:
+    def __init__(
+        self, locale: str, data: Any, keys: dict[str, Any] | None = None
+    ) -> None:
         self._locale: str = locale
         self._data: Any = data
-        self._key_cache: dict[str, str] = {}
+        # Values of dotted keys, possibly precomputed
+        self._key_cache: dict[str, Any] = {} if keys is None else dict(keys)
+
+    @classmethod
+    def use_bundle(cls, path: str | os.PathLike[str] | None) -> None:
+        """
+        Loads locales from a bundle generated by
+        pendulum.locales.bundle.compile_bundle() instead of their modules,
+        or from their modules again if path is None.
+
+        The bundle can also be set with the PENDULUM_LOCALE_BUNDLE
+        environment variable.
+
+        :param path: The path of the bundle
+        """
+        if path is None:
+            cls._bundle = None
+        else:
+            # Bundles are seldom used, and their module is costly to import
+            from pendulum.locales.bundle import LocaleBundle
+
+            cls._bundle = LocaleBundle(path)
+
+        cls._cache.clear()
 
     @classmethod
     def load(cls, locale: str | Locale) -> Locale:
@@ -33,6 +65,15 @@ class Locale:
         if locale in cls._cache:
             return cls._cache[locale]
 
+        if cls._bundle is not None:
+            if locale not in cls._bundle:
+                raise ValueError(f"Locale [{locale}] does not exist.")
+
+            data, keys = cls._bundle.load(locale)
+            cls._cache[locale] = cls(locale, data, keys)
+
+            return cls._cache[locale]
+
         # Checking locale existence
         actual_locale = locale
         locale_path = cast(Path, resources.files(__package__).joinpath(actual_locale))
@@ -98,3 +139,7 @@ class Locale:
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}('{self._locale}')"
+
+
+if os.getenv("PENDULUM_LOCALE_BUNDLE"):
+    Locale.use_bundle(os.environ["PENDULUM_LOCALE_BUNDLE"])
@@ -0,0 +1,329 @@
+# mypy: no-warn-redundant-casts
+from __future__ import annotations
+
+import os
+
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from multiprocessing.shared_memory import SharedMemory
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Iterable
+from typing import Iterator
+from typing import Sequence
+from typing import cast
+
+import pendulum
+
+from pendulum.constants import US_PER_SECOND
+from pendulum.datetime_array import DateTimeArray
+from pendulum.locales.locale import Locale
+from pendulum.parser import EpochBatch
+from pendulum.parser import parse_many
+
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from typing_extensions import Self
+
+    from pendulum.tz.timezone import FixedTimezone
+    from pendulum.tz.timezone import Timezone
+
+# The number of shards per worker, to balance the load
+# when some shards are slower to process than others
+_SHARDS_PER_PROCESS = 4
+
+# Resources loaded when a worker starts, kept alive for its whole life
+_resources: list[Any] = []
+
+
+class ParallelExecutor:
+    """
+    Runs batch operations over several worker processes.
+
+    Instants are exchanged through shared memory as int64 buffers
+    of microseconds since the UNIX epoch, so only their location
+    is sent to the workers, not the values themselves.
+
+    >>> import pendulum
+    >>> from pendulum.parallel import ParallelExecutor
+    >>> values = pendulum.DateTimeArray([0, 90_000_000_000], tz="Europe/Paris")
+    >>> with ParallelExecutor(2, timezones=["Europe/Paris"]) as executor:
+    ...     executor.start_of(values, "day").microseconds
+    array('q', [-3600000000, 82800000000])
+    """
+
+    def __init__(
+        self,
+        processes: int | None = None,
+        timezones: Iterable[str | Timezone | FixedTimezone] = (),
+        locales: Iterable[str] = (),
+    ) -> None:
+        """
+        :param processes: The number of worker processes,
+                          the number of CPUs by default
+        :param timezones: The timezones to load once in each worker
+        :param locales: The locales to load once in each worker
+        """
+        self._processes = processes or os.cpu_count() or 1
+        self._executor = ProcessPoolExecutor(
+            self._processes,
+            initializer=_initialize,
+            initargs=(
+                [pendulum._safe_timezone(tz) for tz in timezones],
+                [Locale.normalize_locale(locale) for locale in locales],
+            ),
+        )
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        """
+        Stops the worker processes.
+        """
+        self._executor.shutdown()
+
+    def parse_many(self, texts: Sequence[str], **options: Any) -> EpochBatch:
+        """
+        Parses datetime strings, like pendulum.parse_many() with raw=True does.
+
+        :param texts: The strings to parse
+        """
+        count = len(texts)
+        with _shared(count * 8) as microseconds, _shared(
+            count * array("l").itemsize
+        ) as offsets:
+            futures = [
+                self._executor.submit(
+                    _parse_shard,
+                    texts[start:stop],
+                    start,
+                    microseconds.name,
+                    offsets.name,
+                    options,
+                )
+                for start, stop in self._shards(count)
+            ]
+
+            errors: dict[int, ValueError] = {}
+            for future in futures:
+                errors.update(future.result())
+
+            return EpochBatch(
+                _read(microseconds, "q", 0, count),
+                _read(offsets, "l", 0, count),
+                errors,
+            )
+
+    def start_of(self, values: DateTimeArray, unit: str) -> DateTimeArray:
+        """
+        Resets every datetime of an array to the start of the given unit,
+        like DateTimeArray.start_of() does.
+
+        :param values: The datetimes to truncate
+        :param unit: The unit to truncate to
+        """
+        if unit not in DateTimeArray._MODIFIERS_VALID_UNITS:
+            raise ValueError(f'Invalid unit "{unit}" for start_of()')
+
+        count = len(values)
+        with _shared(count * 8, values.microseconds) as source, _shared(
+            count * 8
+        ) as target:
+            self._map(_start_of_shard, count, source.name, target.name, values.tz, unit)
+
+            return DateTimeArray(_read(target, "q", 0, count), values.tz)
+
+    def utc_offsets(self, values: DateTimeArray) -> array[int]:
+        """
+        Returns the UTC offset, in seconds, of every datetime of an array.
+
+        Adding them to the instants gives the local times.
+
+        :param values: The datetimes to convert
+        """
+        count = len(values)
+        itemsize = array("l").itemsize
+        with _shared(count * 8, values.microseconds) as source, _shared(
+            count * itemsize
+        ) as target:
+            self._map(_utc_offsets_shard, count, source.name, target.name, values.tz)
+
+            return _read(target, "l", 0, count)
+
+    def format(
+        self, values: DateTimeArray, fmt: str, locale: str | None = None
+    ) -> list[str]:
+        """
+        Formats every datetime of an array.
+
+        :param values: The datetimes to format
+        :param fmt: The format to use, as accepted by DateTime.format()
+        :param locale: The locale to use, the current one by default
+        """
+        locale = locale or pendulum.get_locale()
+
+        count = len(values)
+        with _shared(count * 8, values.microseconds) as source:
+            futures = [
+                self._executor.submit(
+                    _format_shard, source.name, start, stop, values.tz, fmt, locale
+                )
+                for start, stop in self._shards(count)
+            ]
+
+            return [string for future in futures for string in future.result()]
+
+    def _map(self, func: Any, count: int, *args: Any) -> None:
+        futures = [
+            self._executor.submit(func, start, stop, *args)
+            for start, stop in self._shards(count)
+        ]
+        for future in futures:
+            future.result()
+
+    def _shards(self, count: int) -> Iterator[tuple[int, int]]:
+        shards = self._processes * _SHARDS_PER_PROCESS
+        size = max(-(-count // shards), 1)
+        for start in range(0, count, size):
+            yield start, min(start + size, count)
+
+
+def _initialize(timezones: list[Timezone | FixedTimezone], locales: list[str]) -> None:
+    # Unpickling the timezones already loaded them
+    _resources.extend(timezones)
+    _resources.extend(Locale.load(locale) for locale in locales)
+
+
+@contextmanager
+def _shared(size: int, values: array[int] | None = None) -> Iterator[SharedMemory]:
+    """
+    Creates a shared memory block of the given size,
+    initialized with the given values, and releases it on exit.
+    """
+    # Empty blocks are not supported
+    memory = SharedMemory(create=True, size=max(size, 1))
+    try:
+        if values is not None:
+            _buffer(memory)[:size] = memoryview(values).cast("B")
+
+        yield memory
+    finally:
+        memory.close()
+        memory.unlink()
+
+
+@contextmanager
+def _attached(name: str) -> Iterator[SharedMemory]:
+    memory = SharedMemory(name)
+    try:
+        yield memory
+    finally:
+        memory.close()
+
+
+def _buffer(memory: SharedMemory) -> memoryview:
+    # The buffer is only unset once the block is closed
+    return cast(memoryview, memory.buf)
+
+
+def _read(memory: SharedMemory, typecode: str, start: int, stop: int) -> array[int]:
+    values: array[int] = array(typecode)
+    values.frombytes(_buffer(memory)[start * values.itemsize : stop * values.itemsize])
+
+    return values
+
+
+def _write(memory: SharedMemory, start: int, values: array[int]) -> None:
+    offset = start * values.itemsize
+    _buffer(memory)[offset : offset + len(values) * values.itemsize] = memoryview(
+        values
+    ).cast("B")
+
+
+def _parse_shard(
+    texts: Sequence[str],
+    start: int,
+    microseconds_name: str,
+    offsets_name: str,
+    options: dict[str, Any],
+) -> dict[int, ValueError]:
+    batch = parse_many(texts, raw=True, **options)
+
+    with _attached(microseconds_name) as microseconds:
+        _write(microseconds, start, batch.microseconds)
+
+    with _attached(offsets_name) as offsets:
+        _write(offsets, start, batch.offsets)
+
+    return {start + i: error for i, error in batch.errors.items()}
+
+
+def _start_of_shard(
+    start: int,
+    stop: int,
+    source_name: str,
+    target_name: str,
+    tz: Timezone | FixedTimezone,
+    unit: str,
+) -> None:
+    with _attached(source_name) as source:
+        values = DateTimeArray(_read(source, "q", start, stop), tz)
+
+    with _attached(target_name) as target:
+        _write(target, start, values.start_of(unit).microseconds)
+
+
+def _utc_offsets_shard(
+    start: int,
+    stop: int,
+    source_name: str,
+    target_name: str,
+    tz: Timezone | FixedTimezone,
+) -> None:
+    with _attached(source_name) as source:
+        values = _read(source, "q", start, stop)
+
+    offsets = array(
+        "l",
+        (
+            offset
+            for offset, _ in tz._utc_offsets_at(
+                value // US_PER_SECOND for value in values
+            )
+        ),
+    )
+
+    with _attached(target_name) as target:
+        _write(target, start, offsets)
+
+
+def _format_shard(
+    source_name: str,
+    start: int,
+    stop: int,
+    tz: Timezone | FixedTimezone,
+    fmt: str,
+    locale: str,
+) -> list[str]:
+    with _attached(source_name) as source:
+        values = _read(source, "q", start, stop)
+
+    return [
+        dt.format(fmt, locale=locale)
+        for dt in pendulum.convert_timestamps(values, tz, "microseconds")
+    ]
+
+
+__all__ = ["ParallelExecutor"]
@@ -3,12 +3,20 @@ from __future__ import annotations
 import datetime
 import typing as t
 
+from array import array
+
 import pendulum
 
 from pendulum.duration import Duration
+from pendulum.parsing import DEFAULT_OPTIONS
 from pendulum.parsing import _Interval
-from pendulum.parsing import parse as base_parse
+from pendulum.parsing import _normalize
+from pendulum.parsing import _parse as base_parse_raw
+from pendulum.parsing import _parse_non_iso8601
+from pendulum.parsing import parse_iso8601
+from pendulum.parsing.exceptions import ParserError
 from pendulum.tz.timezone import UTC
+from pendulum.tz.timezone import FixedTimezone
 
 
 if t.TYPE_CHECKING:
@@ -22,6 +30,36 @@ try:
 except ImportError:
     RustDuration = None  # type: ignore[assignment,misc]
 
+_EPOCH = datetime.datetime(1970, 1, 1)
+_MICROSECOND = datetime.timedelta(microseconds=1)
+
+
+class ParsedBatch(t.NamedTuple):
+    """
+    The result of parsing several strings at once.
+
+    Rows that could not be parsed are set to None in ``values``
+    and their error is stored in ``errors``, keyed by row index.
+    """
+
+    values: list[Date | DateTime | Time | Duration | Interval | None]
+    errors: dict[int, ValueError]
+
+
+class EpochBatch(t.NamedTuple):
+    """
+    The raw result of parsing several datetime strings at once.
+
+    ``microseconds`` holds the number of microseconds since the UNIX epoch
+    and ``offsets`` the UTC offset, in seconds, of each row.
+    Rows that could not be parsed are set to 0 in both arrays
+    and their error is stored in ``errors``, keyed by row index.
+    """
+
+    microseconds: array[int]
+    offsets: array[int]
+    errors: dict[int, ValueError]
+
 
 def parse(text: str, **options: t.Any) -> Date | Time | DateTime | Duration:
     # Use the mock now value if it exists
@@ -40,8 +78,53 @@ def _parse(text: str, **options: t.Any) -> Date | DateTime | Time | Duration | I
     if text == "now":
         return pendulum.now()
 
-    parsed = base_parse(text, **options)
+    return _parse_text(text, {**DEFAULT_OPTIONS, **options})
+
+
+def _parse_text(
+    text: str, options: dict[str, t.Any]
+) -> Date | DateTime | Time | Duration | Interval:
+    """
+    Parses a string with options already merged with the default ones.
+
+    :param text: The string to parse.
+    """
+    # ISO 8601 datetimes are the most common inputs so the parser
+    # builds them as DateTime instances directly, with a cached timezone,
+    # instead of going through a native datetime first.
+    parsed: datetime.date | datetime.time | _Interval | RustDuration
+    try:
+        parsed = parse_iso8601(text, pendulum.DateTime)
+    except ValueError:
+        parsed = _parse_non_iso8601(text, **options)
+    else:
+        if isinstance(parsed, pendulum.DateTime):
+            if parsed.tzinfo is not None:
+                return parsed
+
+            tz = options.get("tz", UTC)
+            if isinstance(tz, FixedTimezone):
+                dt = tz.convert(parsed)
+            else:
+                dt = t.cast("DateTime", _convert(parsed, **options))
+
+            if parsed.nanosecond:
+                dt._nanosecond = parsed.nanosecond
+
+            return dt
+
+    return _convert(_normalize(parsed, **options), **options)
+
+
+def _convert(
+    parsed: datetime.date | datetime.time | _Interval | Duration | RustDuration,
+    **options: t.Any,
+) -> Date | DateTime | Time | Duration | Interval:
+    """
+    Converts an element parsed by the base parser into its pendulum equivalent.
 
+    :param parsed: The parsed element.
+    """
     if isinstance(parsed, datetime.datetime):
         return pendulum.datetime(
             parsed.year,
@@ -126,3 +209,92 @@ def _parse(text: str, **options: t.Any) -> Date | DateTime | Time | Duration | I
         )
 
     raise NotImplementedError
+
+
+@t.overload
+def parse_many(
+    texts: t.Iterable[str], raw: t.Literal[False] = ..., **options: t.Any
+) -> ParsedBatch:
+    ...
+
+
+@t.overload
+def parse_many(
+    texts: t.Iterable[str], raw: t.Literal[True], **options: t.Any
+) -> EpochBatch:
+    ...
+
+
+def parse_many(
+    texts: t.Iterable[str], raw: bool = False, **options: t.Any
+) -> ParsedBatch | EpochBatch:
+    """
+    Parses several strings with the same options.
+
+    Options are resolved once for the whole batch and failures
+    are reported per row instead of aborting on the first invalid string.
+
+    :param texts: The strings to parse.
+    :param raw: Whether to return epoch microseconds and offsets arrays
+                instead of pendulum instances. Only datetimes are supported
+                in this mode.
+    """
+    options["now"] = options.get("now")
+    _options: dict[str, t.Any] = {**DEFAULT_OPTIONS, **options}
+
+    # Resolving the timezone once for the whole batch
+    if _options.get("tz") is not None:
+        _options["tz"] = pendulum._safe_timezone(_options["tz"])
+
+    if raw:
+        return _parse_many_raw(texts, _options)
+
+    values: list[Date | DateTime | Time | Duration | Interval | None] = []
+    errors: dict[int, ValueError] = {}
+    for i, text in enumerate(texts):
+        try:
+            if text == "now":
+                values.append(pendulum.now())
+
+                continue
+
+            values.append(_parse_text(text, _options))
+        except ValueError as e:
+            values.append(None)
+            errors[i] = e
+
+    return ParsedBatch(values, errors)
+
+
+def _parse_many_raw(texts: t.Iterable[str], options: dict[str, t.Any]) -> EpochBatch:
+    tz = options.get("tz") or UTC
+
+    microseconds: array[int] = array("q")
+    offsets: array[int] = array("l")
+    errors: dict[int, ValueError] = {}
+    for i, text in enumerate(texts):
+        try:
+            if text == "now":
+                parsed: t.Any = pendulum.now(tz)
+            else:
+                parsed = _normalize(base_parse_raw(text, **options), **options)
+
+            if not isinstance(parsed, datetime.datetime):
+                raise ParserError(f"String [{text}] does not represent a datetime")
+
+            if parsed.tzinfo is None:
+                parsed = tz.convert(parsed.replace(fold=1))
+
+            offset = int(parsed.utcoffset().total_seconds())
+            delta = parsed.replace(tzinfo=None) - _EPOCH
+        except ValueError as e:
+            microseconds.append(0)
+            offsets.append(0)
+            errors[i] = e
+
+            continue
+
+        microseconds.append(delta // _MICROSECOND - offset * 1_000_000)
+        offsets.append(offset)
+
+    return EpochBatch(microseconds, offsets, errors)
@@ -13,9 +13,8 @@ from typing import Any
 from typing import Optional
 from typing import cast
 
-from dateutil import parser
-
 from pendulum.parsing.exceptions import ParserError
+from pendulum.parsing.fuzzy import parse_fuzzy
 
 
 with_extensions = os.getenv("PENDULUM_EXTENSIONS", "1") == "1"
@@ -112,6 +111,15 @@ def _parse(text: str, **options: Any) -> datetime | date | time | _Interval | Du
     with contextlib.suppress(ValueError):
         return parse_iso8601(text)
 
+    return _parse_non_iso8601(text, **options)
+
+
+def _parse_non_iso8601(
+    text: str, **options: Any
+) -> datetime | date | time | _Interval | Duration:
+    """
+    Parses a string which is known not to be an ISO 8601 string.
+    """
     with contextlib.suppress(ValueError):
         return _parse_iso8601_interval(text)
 
@@ -119,11 +127,18 @@ def _parse(text: str, **options: Any) -> datetime | date | time | _Interval | Du
         return _parse_common(text, **options)
 
     # We couldn't parse the string
-    # so we fallback on the dateutil parser
+    # so we fallback on the fuzzy and dateutil parsers
     # If not strict
     if options.get("strict", True):
         raise ParserError(f"Unable to parse string [{text}]")
 
+    with contextlib.suppress(ParserError):
+        return parse_fuzzy(text, day_first=options["day_first"])
+
+    # dateutil is costly to import so it is only loaded
+    # when it is actually needed.
+    from dateutil import parser
+
     try:
         dt = parser.parse(
             text, dayfirst=options["day_first"], yearfirst=options["year_first"]
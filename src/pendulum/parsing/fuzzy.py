@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import datetime
+import re
+
+from pendulum.parsing.exceptions import ParserError
+from pendulum.tz import fixed_timezone
+from pendulum.tz.timezone import UTC
+from pendulum.tz.timezone import FixedTimezone
+from pendulum.tz.timezone import Timezone
+
+
+MONTHS = {
+    "jan": 1,
+    "january": 1,
+    "feb": 2,
+    "february": 2,
+    "mar": 3,
+    "march": 3,
+    "apr": 4,
+    "april": 4,
+    "may": 5,
+    "jun": 6,
+    "june": 6,
+    "jul": 7,
+    "july": 7,
+    "aug": 8,
+    "august": 8,
+    "sep": 9,
+    "sept": 9,
+    "september": 9,
+    "oct": 10,
+    "october": 10,
+    "nov": 11,
+    "november": 11,
+    "dec": 12,
+    "december": 12,
+}
+
+WEEKDAYS = {
+    "mon",
+    "monday",
+    "tue",
+    "tues",
+    "tuesday",
+    "wed",
+    "wednesday",
+    "thu",
+    "thur",
+    "thurs",
+    "thursday",
+    "fri",
+    "friday",
+    "sat",
+    "saturday",
+    "sun",
+    "sunday",
+}
+
+UTC_NAMES = {"gmt", "ut", "utc", "z"}
+
+RFC_2822 = re.compile(
+    "^"
+    r"(?:(?P<weekday>[a-z]+),?\ +)?"  # Day of week (optional)
+    r"(?P<day>\d{1,2})\ +"  # Day
+    r"(?P<month>[a-z]+)\ +"  # Month name
+    r"(?P<year>\d{4})"  # Year
+    "(?:"  # Time (optional)
+    r"    \ +(?P<hour>\d{1,2}):(?P<minute>\d{2})(?::(?P<second>\d{2}))?"
+    r"    (?:\ *(?P<tz>[a-z]+|[+-]\d{4}))?"  # Timezone (optional)
+    ")?"
+    "$",
+    re.VERBOSE | re.IGNORECASE,
+)
+
+US_DATE = re.compile(
+    r"^(?P<first>\d{1,2})/(?P<last>\d{1,2})/(?P<year>\d{4})"  # MM/DD/YYYY
+    "(?:"  # Time (optional)
+    r"    \ +(?P<hour>\d{1,2}):(?P<minute>\d{2})"
+    r"    (?::(?P<second>\d{2})(?:\.(?P<subsecond>\d{1,6}))?)?"
+    r"    (?:\ *(?P<meridiem>[ap]m))?"  # AM/PM (optional)
+    ")?"
+    "$",
+    re.VERBOSE | re.IGNORECASE,
+)
+
+
+def parse_fuzzy(text: str, day_first: bool = False) -> datetime.datetime:
+    """
+    Parses common non ISO 8601 layouts:
+    RFC 2822 dates, like "Thu, 06 Oct 2016 12:34:56 GMT",
+    and US slash dates, like "10/06/2016 12:34 PM".
+
+    Results are the same as the ones of the dateutil parser,
+    with offsets of zero being UTC, and a ParserError is raised
+    for anything else. Timezone names are case insensitive
+    and the Tues, Thur and Thurs abbreviations are accepted,
+    which dateutil rejects.
+
+    :param text: The string to parse.
+    :param day_first: Whether slash dates start with the day.
+    """
+    try:
+        m = RFC_2822.match(text)
+        if m:
+            return _parse_rfc_2822(m)
+
+        m = US_DATE.match(text)
+        if m:
+            return _parse_us_date(m, day_first)
+    except ValueError:
+        pass
+
+    raise ParserError(f"Unable to parse string [{text}]")
+
+
+def _parse_rfc_2822(m: re.Match[str]) -> datetime.datetime:
+    weekday = m.group("weekday")
+    if weekday and weekday.lower() not in WEEKDAYS:
+        raise ParserError("Invalid day of week")
+
+    # The day of week is ignored since the date is fully specified
+    month = MONTHS.get(m.group("month").lower())
+    if month is None:
+        raise ParserError("Invalid month")
+
+    year = int(m.group("year"))
+    day = int(m.group("day"))
+
+    if not m.group("hour"):
+        return datetime.datetime(year, month, day)
+
+    tzinfo: Timezone | FixedTimezone | None = None
+    tz = m.group("tz")
+    if tz:
+        if tz[0] in "+-":
+            offset = int(tz[1:3]) * 3600 + int(tz[3:5]) * 60
+            if tz[0] == "-":
+                offset = -offset
+
+            # dateutil returns UTC for offsets of zero
+            tzinfo = fixed_timezone(offset) if offset else UTC
+        elif tz.lower() in UTC_NAMES:
+            tzinfo = UTC
+        else:
+            # Other abbreviations are ambiguous
+            raise ParserError("Unsupported timezone")
+
+    return datetime.datetime(
+        year,
+        month,
+        day,
+        int(m.group("hour")),
+        int(m.group("minute")),
+        int(m.group("second") or 0),
+        tzinfo=tzinfo,
+    )
+
+
+def _parse_us_date(m: re.Match[str], day_first: bool) -> datetime.datetime:
+    if day_first:
+        day, month = int(m.group("first")), int(m.group("last"))
+    else:
+        month, day = int(m.group("first")), int(m.group("last"))
+
+    year = int(m.group("year"))
+
+    if not m.group("hour"):
+        return datetime.datetime(year, month, day)
+
+    hour = int(m.group("hour"))
+    meridiem = m.group("meridiem")
+    if meridiem:
+        if not 1 <= hour <= 12:
+            raise ParserError("Invalid hour")
+
+        hour %= 12
+        if meridiem.lower() == "pm":
+            hour += 12
+
+    microsecond = 0
+    if m.group("subsecond"):
+        microsecond = int(f"{m.group('subsecond'):0<6}")
+
+    return datetime.datetime(
+        year,
+        month,
+        day,
+        hour,
+        int(m.group("minute")),
+        int(m.group("second") or 0),
+        microsecond,
+    )
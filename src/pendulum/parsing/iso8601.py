@@ -15,6 +15,7 @@ from pendulum.helpers import is_leap
 from pendulum.helpers import is_long_year
 from pendulum.helpers import week_day
 from pendulum.parsing.exceptions import ParserError
+from pendulum.tz import fixed_timezone
 from pendulum.tz.timezone import UTC
 from pendulum.tz.timezone import FixedTimezone
 from pendulum.tz.timezone import Timezone
@@ -83,12 +84,16 @@ ISO8601_DURATION = re.compile(
 
 def parse_iso8601(
     text: str,
+    datetime_class: type[datetime.datetime] = datetime.datetime,
 ) -> datetime.datetime | datetime.date | datetime.time | Duration:
     """
     ISO 8601 compliant parser.
 
     :param text: The string to parse
     :type text: str
+    :param datetime_class: The class of the returned datetimes,
+                           which must accept the same arguments as datetime.datetime
+    :type datetime_class: type
 
     :rtype: datetime.datetime or datetime.time or datetime.date
     """
@@ -109,6 +114,7 @@ def parse_iso8601(
     minute = 0
     second = 0
     microsecond = 0
+    nanosecond = 0
     tzinfo: FixedTimezone | Timezone | None = None
 
     if m.group("date"):
@@ -225,10 +231,10 @@ def parse_iso8601(
 
     # Grabbing subseconds, if any
     if m.group("subsecondsection"):
-        # Limiting to 6 chars
-        subsecond = m.group("subsecond")[:6]
+        subsecond = f'{m.group("subsecond"):0<9}'
 
-        microsecond = int(f"{subsecond:0<6}")
+        microsecond = int(subsecond[:6])
+        nanosecond = int(subsecond[6:])
 
     # Grabbing timezone, if any
     tz = m.group("tz")
@@ -252,15 +258,21 @@ def parse_iso8601(
             if negative:
                 offset = -1 * offset
 
-            tzinfo = FixedTimezone(offset)
+            tzinfo = fixed_timezone(offset)
 
     if is_time:
         return datetime.time(hour, minute, second, microsecond, tzinfo=tzinfo)
 
-    return datetime.datetime(
+    dt = datetime_class(
         year, month, day, hour, minute, second, microsecond, tzinfo=tzinfo
     )
 
+    # Only classes able to carry them, like DateTime, keep the nanoseconds
+    if nanosecond and hasattr(datetime_class, "_nanosecond"):
+        dt._nanosecond = nanosecond  # type: ignore[attr-defined]
+
+    return dt
+
 
 def _parse_iso8601_duration(text: str, **options: str) -> Duration | None:
     m = ISO8601_DURATION.match(text)
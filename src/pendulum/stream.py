@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import functools
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import NamedTuple
+
+import pendulum
+
+from pendulum.datetime import DateTime
+from pendulum.parser import parse_many
+from pendulum.parsing.exceptions import ParserError
+from pendulum.tz.timezone import UTC
+
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    from pendulum.date import Date
+    from pendulum.duration import Duration
+    from pendulum.interval import Interval
+    from pendulum.time import Time
+    from pendulum.tz.timezone import FixedTimezone
+    from pendulum.tz.timezone import Timezone
+
+_CHUNK_SIZE = 10_000
+
+
+class BadLine(NamedTuple):
+    """
+    A line which could not be processed, yielded in place of its result.
+
+    ``row`` is the position of the line in the input, starting at 0.
+    """
+
+    row: int
+    line: str
+    error: ValueError
+
+
+# The results of a chunk of lines, BadLine instances included
+_Chunk = List[Any]
+
+
+def parse_lines(
+    lines: Iterable[str],
+    fmt: str | None = None,
+    tz: str | Timezone | FixedTimezone = UTC,
+    locale: str | None = None,
+    chunk_size: int = _CHUNK_SIZE,
+    processes: int = 0,
+) -> Iterator[Date | DateTime | Time | Duration | Interval | BadLine]:
+    """
+    Lazily parses lines of text, like the lines of a file.
+
+    Lines are processed in chunks, optionally spread over several processes,
+    and their results are yielded in order. Lines which cannot be parsed
+    are yielded as BadLine instances instead of aborting the stream.
+
+    :param lines: The lines to parse, surrounding whitespace is ignored
+    :param fmt: The format of the lines, as accepted by from_format(),
+                or None to parse them like parse() does
+    :param tz: The timezone of the lines without timezone information
+    :param locale: The locale of the format, the current one by default
+    :param chunk_size: The number of lines processed at once
+    :param processes: The number of worker processes,
+                      0 to process the lines in the current process
+    """
+    worker = functools.partial(
+        _parse_chunk,
+        fmt=fmt,
+        tz=pendulum._safe_timezone(tz),
+        locale=locale or pendulum.get_locale(),
+    )
+
+    return _run(worker, lines, chunk_size, processes)
+
+
+def reformat_lines(
+    lines: Iterable[str],
+    in_fmt: str | None,
+    out_fmt: str,
+    tz: str | Timezone | FixedTimezone = UTC,
+    locale: str | None = None,
+    chunk_size: int = _CHUNK_SIZE,
+    processes: int = 0,
+) -> Iterator[str | BadLine]:
+    """
+    Lazily converts lines of text representing datetimes to another format.
+
+    See parse_lines() for details.
+
+    :param lines: The lines to reformat, surrounding whitespace is ignored
+    :param in_fmt: The format of the lines, as accepted by from_format(),
+                   or None to parse them like parse() does
+    :param out_fmt: The format of the results, as accepted by DateTime.format()
+    :param tz: The timezone of the lines without timezone information,
+               and of the results
+    :param locale: The locale of the formats, the current one by default
+    :param chunk_size: The number of lines processed at once
+    :param processes: The number of worker processes,
+                      0 to process the lines in the current process
+    """
+    worker = functools.partial(
+        _reformat_chunk,
+        in_fmt=in_fmt,
+        out_fmt=out_fmt,
+        tz=pendulum._safe_timezone(tz),
+        locale=locale or pendulum.get_locale(),
+    )
+
+    return _run(worker, lines, chunk_size, processes)
+
+
+def _run(
+    worker: Callable[[int, list[str]], _Chunk],
+    lines: Iterable[str],
+    chunk_size: int,
+    processes: int,
+) -> Iterator[Any]:
+    if chunk_size < 1:
+        raise ValueError("The chunk size must be at least 1")
+
+    if processes < 0:
+        raise ValueError("The number of processes cannot be negative")
+
+    if not processes:
+        return _run_locally(worker, lines, chunk_size)
+
+    return _run_in_pool(worker, lines, chunk_size, processes)
+
+
+def _run_locally(
+    worker: Callable[[int, list[str]], _Chunk],
+    lines: Iterable[str],
+    chunk_size: int,
+) -> Iterator[Any]:
+    for start, chunk in _chunks(lines, chunk_size):
+        yield from worker(start, chunk)
+
+
+def _run_in_pool(
+    worker: Callable[[int, list[str]], _Chunk],
+    lines: Iterable[str],
+    chunk_size: int,
+    processes: int,
+) -> Iterator[Any]:
+    with ProcessPoolExecutor(processes) as executor:
+        pending: deque[Future[_Chunk]] = deque()
+        for start, chunk in _chunks(lines, chunk_size):
+            pending.append(executor.submit(worker, start, chunk))
+
+            # Bounding the number of chunks in flight
+            # so that the input is not read all at once
+            if len(pending) > 2 * processes:
+                yield from pending.popleft().result()
+
+        while pending:
+            yield from pending.popleft().result()
+
+
+def _chunks(lines: Iterable[str], size: int) -> Iterator[tuple[int, list[str]]]:
+    """
+    Splits lines into lists of the given size, along with the index of their start.
+    """
+    iterator = iter(lines)
+    start = 0
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+
+        yield start, chunk
+
+        start += len(chunk)
+
+
+def _parse_chunk(
+    start: int,
+    lines: list[str],
+    fmt: str | None,
+    tz: Timezone | FixedTimezone,
+    locale: str,
+) -> _Chunk:
+    texts = [line.strip() for line in lines]
+
+    if fmt is None:
+        batch = parse_many(texts, tz=tz)
+        results: _Chunk = batch.values
+        for i, error in batch.errors.items():
+            results[i] = BadLine(start + i, lines[i], error)
+
+        return results
+
+    # Resolving the current time once for the whole chunk
+    now = pendulum.now(tz)
+    results = []
+    for i, text in enumerate(texts):
+        try:
+            parts = pendulum._formatter.parse(text, fmt, now, locale=locale)
+            if parts["tz"] is None:
+                parts["tz"] = tz
+
+            results.append(pendulum.datetime(**parts))
+        except ValueError as e:
+            results.append(BadLine(start + i, lines[i], e))
+
+    return results
+
+
+def _reformat_chunk(
+    start: int,
+    lines: list[str],
+    in_fmt: str | None,
+    out_fmt: str,
+    tz: Timezone | FixedTimezone,
+    locale: str,
+) -> _Chunk:
+    results = _parse_chunk(start, lines, in_fmt, tz, locale)
+    for i, result in enumerate(results):
+        if isinstance(result, BadLine):
+            continue
+
+        if isinstance(result, DateTime):
+            if result.tzinfo is not tz:
+                result = result.in_timezone(tz)
+
+            results[i] = result.format(out_fmt, locale=locale)
+        else:
+            results[i] = BadLine(
+                start + i,
+                lines[i],
+                ParserError(
+                    f"String [{lines[i].strip()}] does not represent a datetime"
+                ),
+            )
+
+    return results
+
+
+__all__ = ["BadLine", "parse_lines", "reformat_lines"]
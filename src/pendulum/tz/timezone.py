@@ -2,13 +2,20 @@
 from __future__ import annotations
 
 import datetime as _datetime
+import functools
 
 from abc import ABC
 from abc import abstractmethod
+from bisect import bisect_right
+from operator import index
 from typing import TYPE_CHECKING
+from typing import Iterable
+from typing import Iterator
+from typing import NamedTuple
 from typing import TypeVar
 from typing import cast
 
+from pendulum.constants import SECONDS_PER_DAY
 from pendulum.tz.exceptions import AmbiguousTime
 from pendulum.tz.exceptions import InvalidTimezone
 from pendulum.tz.exceptions import NonExistingTime
@@ -17,6 +24,7 @@ from pendulum.utils._compat import zoneinfo
 
 if TYPE_CHECKING:
     from typing_extensions import Self
+    from typing_extensions import SupportsIndex
 
 POST_TRANSITION = "post"
 PRE_TRANSITION = "pre"
@@ -25,6 +33,22 @@ TRANSITION_ERROR = "error"
 
 _DT = TypeVar("_DT", bound=_datetime.datetime)
 
+_EPOCH_ORDINAL = _datetime.date(1970, 1, 1).toordinal()
+_ONE_SECOND = _datetime.timedelta(seconds=1)
+_PROBING_STEP = 3 * SECONDS_PER_DAY
+
+
+class _TransitionWindow(NamedTuple):
+    # The UTC offset, in seconds, in effect at the start of the window
+    offset: int
+    # For each transition, the first local timestamp it skips or repeats
+    bounds: list[int]
+    # For each transition, its UTC timestamp and the offsets before and after it
+    transitions: list[tuple[int, int, int]]
+
+
+_WINDOW_CACHE_SIZE = 1024
+
 
 class PendulumTimezone(ABC):
     @property
@@ -36,6 +60,44 @@ class PendulumTimezone(ABC):
     def convert(self, dt: _DT, raise_on_unknown_times: bool = False) -> _DT:
         raise NotImplementedError
 
+    def convert_many(
+        self, dts: Iterable[_DT], raise_on_unknown_times: bool = False
+    ) -> list[_DT]:
+        """
+        Converts several datetimes in the current timezone.
+
+        This is equivalent to calling convert() on each of them.
+        """
+        convert = self.convert
+
+        return [convert(dt, raise_on_unknown_times) for dt in dts]
+
+    def _utc_offsets_at(self, timestamps: Iterable[int]) -> Iterator[tuple[int, int]]:
+        """
+        Yields the UTC offset, in seconds, and the fold
+        of the local time at each of the given UTC timestamps, in seconds.
+        """
+        raise NotImplementedError
+
+    def _create(
+        self,
+        cls: type[_DT],
+        year: SupportsIndex,
+        month: SupportsIndex,
+        day: SupportsIndex,
+        hour: SupportsIndex,
+        minute: SupportsIndex,
+        second: SupportsIndex,
+        microsecond: SupportsIndex,
+        fold: int,
+        raise_on_unknown_times: bool = False,
+    ) -> _DT:
+        """
+        Creates an instance of the given class for a local time
+        in the current timezone, normalized like convert() does.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def datetime(
         self,
@@ -93,25 +155,7 @@ class Timezone(zoneinfo.ZoneInfo, PendulumTimezone):
         """
 
         if dt.tzinfo is None:
-            # Technically, utcoffset() can return None, but none of the zone information
-            # in tzdata sets _tti_before to None. This can be checked with the following
-            # code:
-            #
-            # >>> import zoneinfo
-            # >>> from zoneinfo._zoneinfo import ZoneInfo
-            #
-            # >>> for tzname in zoneinfo.available_timezones():
-            # >>>     if ZoneInfo(tzname)._tti_before is None:
-            # >>>         print(tzname)
-
-            offset_before = cast(
-                _datetime.timedelta,
-                (self.utcoffset(dt.replace(fold=0)) if dt.fold else self.utcoffset(dt)),
-            )
-            offset_after = cast(
-                _datetime.timedelta,
-                (self.utcoffset(dt) if dt.fold else self.utcoffset(dt.replace(fold=1))),
-            )
+            offset_before, offset_after = self._local_offsets(dt)
 
             if offset_after > offset_before:
                 # Skipped time
@@ -121,8 +165,8 @@ class Timezone(zoneinfo.ZoneInfo, PendulumTimezone):
                 dt = cast(
                     _DT,
                     dt
-                    + (
-                        (offset_after - offset_before)
+                    + _datetime.timedelta(
+                        seconds=(offset_after - offset_before)
                         if dt.fold
                         else (offset_before - offset_after)
                     ),
@@ -135,6 +179,260 @@ class Timezone(zoneinfo.ZoneInfo, PendulumTimezone):
 
         return cast(_DT, dt.astimezone(self))
 
+    def _create(
+        self,
+        cls: type[_DT],
+        year: SupportsIndex,
+        month: SupportsIndex,
+        day: SupportsIndex,
+        hour: SupportsIndex,
+        minute: SupportsIndex,
+        second: SupportsIndex,
+        microsecond: SupportsIndex,
+        fold: int,
+        raise_on_unknown_times: bool = False,
+    ) -> _DT:
+        window = self._transition_window(index(year))
+        if window is not None:
+            if not window.transitions:
+                return cls(
+                    year,
+                    month,
+                    day,
+                    hour,
+                    minute,
+                    second,
+                    microsecond,
+                    tzinfo=self,
+                    fold=fold,
+                )
+
+            offset_before, offset_after = self._window_offsets(
+                window,
+                _datetime.date(year, month, day).toordinal(),
+                index(hour) * 3600 + index(minute) * 60 + index(second),
+            )
+            if offset_before == offset_after:
+                return cls(
+                    year,
+                    month,
+                    day,
+                    hour,
+                    minute,
+                    second,
+                    microsecond,
+                    tzinfo=self,
+                    fold=fold,
+                )
+
+        # Skipped and repeated times need the whole normalization
+        dt = self.convert(
+            _datetime.datetime(
+                year, month, day, hour, minute, second, microsecond, fold=fold
+            ),
+            raise_on_unknown_times=raise_on_unknown_times,
+        )
+
+        return cls(
+            dt.year,
+            dt.month,
+            dt.day,
+            dt.hour,
+            dt.minute,
+            dt.second,
+            dt.microsecond,
+            tzinfo=self,
+            fold=dt.fold,
+        )
+
+    def _local_offsets(self, dt: _datetime.datetime) -> tuple[int, int]:
+        """
+        Returns the UTC offsets, in seconds, of a naive datetime
+        for fold=0 and fold=1 respectively.
+
+        They only differ if the datetime is skipped or repeated.
+        """
+        window = self._transition_window(dt.year)
+        if window is None:
+            return self._utcoffsets(dt)
+
+        return self._window_offsets(
+            window, dt.toordinal(), dt.hour * 3600 + dt.minute * 60 + dt.second
+        )
+
+    def _window_offsets(
+        self, window: _TransitionWindow, ordinal: int, seconds: int
+    ) -> tuple[int, int]:
+        """
+        Returns the UTC offsets, in seconds, of a local time
+        given as the ordinal of its day and its seconds since midnight,
+        for fold=0 and fold=1 respectively.
+        """
+        local = (ordinal - _EPOCH_ORDINAL) * SECONDS_PER_DAY + seconds
+        index = bisect_right(window.bounds, local) - 1
+        if index < 0:
+            return window.offset, window.offset
+
+        at, before, after = window.transitions[index]
+        if local < at + max(before, after):
+            return before, after
+
+        return after, after
+
+    def _utcoffsets(self, dt: _datetime.datetime) -> tuple[int, int]:
+        # Technically, utcoffset() can return None, but none of the zone information
+        # in tzdata sets _tti_before to None. This can be checked with the following
+        # code:
+        #
+        # >>> import zoneinfo
+        # >>> from zoneinfo._zoneinfo import ZoneInfo
+        #
+        # >>> for tzname in zoneinfo.available_timezones():
+        # >>>     if ZoneInfo(tzname)._tti_before is None:
+        # >>>         print(tzname)
+        offset_before = cast(_datetime.timedelta, self.utcoffset(dt.replace(fold=0)))
+        offset_after = cast(_datetime.timedelta, self.utcoffset(dt.replace(fold=1)))
+
+        return offset_before // _ONE_SECOND, offset_after // _ONE_SECOND
+
+    def _transition_window(self, year: int) -> _TransitionWindow | None:
+        """
+        Returns the transitions which can affect local times of the given year.
+
+        Windows are computed lazily, by probing the offsets of the timezone
+        since zoneinfo does not expose its transitions, and the most recently
+        used ones are cached.
+        Transitions are assumed to be more than three days apart,
+        which holds for every zone of the IANA database.
+        """
+        if self.key is not None:
+            return _shared_transition_window(self.key, year)
+
+        try:
+            windows = self._transition_windows
+        except AttributeError:
+            windows = {}
+            self._transition_windows: dict[int, _TransitionWindow | None] = windows
+
+        try:
+            return windows[year]
+        except KeyError:
+            pass
+
+        window = self._compute_transition_window(year)
+        windows[year] = window
+
+        return window
+
+    def _compute_transition_window(self, year: int) -> _TransitionWindow | None:
+        if not 1 < year < 9999:
+            return None
+
+        # Local times are less than a day away from UTC,
+        # so a margin on both sides covers every local time of the year.
+        start = (
+            _datetime.date(year, 1, 1).toordinal() - _EPOCH_ORDINAL - 2
+        ) * SECONDS_PER_DAY
+        end = (
+            _datetime.date(year + 1, 1, 1).toordinal() - _EPOCH_ORDINAL + 2
+        ) * SECONDS_PER_DAY
+
+        return self._probe_transitions(start, end)
+
+    def _probe_transitions(self, start: int, end: int) -> _TransitionWindow:
+        offset = self._offset_at(start)
+        bounds = []
+        transitions = []
+
+        previous = offset
+        low = start
+        while low < end:
+            high = min(low + _PROBING_STEP, end)
+            current = self._offset_at(high)
+            if current != previous:
+                # Narrow the transition down to the second
+                while high - low > 1:
+                    middle = (low + high) // 2
+                    if self._offset_at(middle) == previous:
+                        low = middle
+                    else:
+                        high = middle
+
+                bounds.append(high + min(previous, current))
+                transitions.append((high, previous, current))
+                previous = current
+
+            low = high
+
+        return _TransitionWindow(offset, bounds, transitions)
+
+    def _utc_offsets_at(self, timestamps: Iterable[int]) -> Iterator[tuple[int, int]]:
+        """
+        Yields the UTC offset, in seconds, and the fold
+        of the local time at each of the given UTC timestamps, in seconds.
+
+        The period between two transitions is only looked up
+        when a timestamp falls out of the current one,
+        so sorted timestamps are the fastest to process.
+        """
+        start = end = fold_end = offset = 0
+        for timestamp in timestamps:
+            if not start <= timestamp < end:
+                start, end, fold_end, offset = self._period_at(timestamp)
+
+            yield offset, int(timestamp < fold_end)
+
+    def _period_at(self, timestamp: int) -> tuple[int, int, int, int]:
+        """
+        Returns the period of constant UTC offset containing the given timestamp,
+        as its bounds, the end of its repeated local times and its offset.
+        """
+        year = _datetime.date.fromordinal(
+            timestamp // SECONDS_PER_DAY + _EPOCH_ORDINAL
+        ).year
+        window = self._transition_window(year)
+        if window is None:
+            dt = self.fromutc(
+                _datetime.datetime(1970, 1, 1, tzinfo=self)
+                + _datetime.timedelta(seconds=timestamp)
+            )
+            offset = cast(_datetime.timedelta, dt.utcoffset()) // _ONE_SECOND
+
+            return timestamp, timestamp + 1, timestamp + dt.fold, offset
+
+        # The window covers the whole year, so its bounds are safe defaults
+        start = (
+            _datetime.date(year, 1, 1).toordinal() - _EPOCH_ORDINAL
+        ) * SECONDS_PER_DAY
+        end = (
+            _datetime.date(year + 1, 1, 1).toordinal() - _EPOCH_ORDINAL
+        ) * SECONDS_PER_DAY
+        fold_end = start
+        offset = window.offset
+        for at, before, after in window.transitions:
+            if at > timestamp:
+                end = at
+
+                break
+
+            start = at
+            # Local times are repeated right after the clock is turned back
+            fold_end = at + max(before - after, 0)
+            offset = after
+
+        return start, end, fold_end, offset
+
+    def _offset_at(self, timestamp: int) -> int:
+        """
+        Returns the UTC offset, in seconds, at the given UTC timestamp.
+        """
+        dt = self.fromutc(
+            _datetime.datetime(1970, 1, 1, tzinfo=self)
+            + _datetime.timedelta(seconds=timestamp)
+        )
+
+        return cast(_datetime.timedelta, dt.utcoffset()) // _ONE_SECOND
+
     def datetime(
         self,
         year: int,
@@ -148,16 +446,21 @@ class Timezone(zoneinfo.ZoneInfo, PendulumTimezone):
         """
         Return a normalized datetime for the current timezone.
         """
-        return self.convert(
-            _datetime.datetime(
-                year, month, day, hour, minute, second, microsecond, fold=1
-            )
+        return self._create(
+            _datetime.datetime, year, month, day, hour, minute, second, microsecond, 1
         )
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}('{self.name}')"
 
 
+@functools.lru_cache(maxsize=_WINDOW_CACHE_SIZE)
+def _shared_transition_window(key: str, year: int) -> _TransitionWindow | None:
+    # zoneinfo only keeps weak references to the instances it caches,
+    # so windows are shared by key to survive the instances.
+    return Timezone(key)._compute_transition_window(year)
+
+
 class FixedTimezone(_datetime.tzinfo, PendulumTimezone):
     def __init__(self, offset: int, name: str | None = None) -> None:
         sign = "-" if offset < 0 else "+"
@@ -192,6 +495,30 @@ class FixedTimezone(_datetime.tzinfo, PendulumTimezone):
 
         return cast(_DT, dt.astimezone(self))
 
+    def _create(
+        self,
+        cls: type[_DT],
+        year: SupportsIndex,
+        month: SupportsIndex,
+        day: SupportsIndex,
+        hour: SupportsIndex,
+        minute: SupportsIndex,
+        second: SupportsIndex,
+        microsecond: SupportsIndex,
+        fold: int,
+        raise_on_unknown_times: bool = False,
+    ) -> _DT:
+        # Fixed offsets have neither skipped nor repeated times
+        return cls(
+            year, month, day, hour, minute, second, microsecond, tzinfo=self, fold=0
+        )
+
+    def _utc_offsets_at(self, timestamps: Iterable[int]) -> Iterator[tuple[int, int]]:
+        offset = self._offset
+
+        for _ in timestamps:
+            yield offset, 0
+
     def datetime(
         self,
         year: int,
@@ -202,10 +529,8 @@ class FixedTimezone(_datetime.tzinfo, PendulumTimezone):
         second: int = 0,
         microsecond: int = 0,
     ) -> _datetime.datetime:
-        return self.convert(
-            _datetime.datetime(
-                year, month, day, hour, minute, second, microsecond, fold=1
-            )
+        return self._create(
+            _datetime.datetime, year, month, day, hour, minute, second, microsecond, 1
         )
 
     @property
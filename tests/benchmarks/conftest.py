@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from pendulum import _helpers
+from pendulum import helpers
+
+
+# Only pytest-benchmark defines this hook, pytest-codspeed does not
+@pytest.hookimpl(optionalhook=True)
+def pytest_benchmark_update_machine_info(
+    config: Any, machine_info: dict[str, Any]
+) -> None:
+    # PENDULUM_EXTENSIONS=1 falls back to pure Python if the extensions
+    # are not built, so record which implementation actually ran.
+    machine_info["pendulum_implementation"] = (
+        "python" if helpers.precise_diff.__module__ == _helpers.__name__ else "rust"
+    )
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from typing import Any
+from typing import Callable
+
+import pytest
+
+import pendulum
+
+
+@pytest.fixture
+def dt() -> pendulum.DateTime:
+    return pendulum.datetime(2016, 3, 26, 12, 34, 56, 123456, tz="Europe/Paris")
+
+
+@pytest.mark.benchmark(group="DateTime")
+def test_add(benchmark: Callable[..., Any], dt: pendulum.DateTime) -> None:
+    benchmark(dt.add, years=1, months=2, days=3, hours=4)
+
+
+@pytest.mark.benchmark(group="DateTime")
+def test_add_fixed_units(benchmark: Callable[..., Any], dt: pendulum.DateTime) -> None:
+    benchmark(dt.add, hours=25, minutes=10, seconds=5)
+
+
+@pytest.mark.benchmark(group="DateTime")
+def test_subtract(benchmark: Callable[..., Any], dt: pendulum.DateTime) -> None:
+    benchmark(dt.subtract, months=14, days=3)
+
+
+@pytest.mark.benchmark(group="DateTime")
+def test_diff(benchmark: Callable[..., Any], dt: pendulum.DateTime) -> None:
+    other = pendulum.datetime(2019, 11, 2, 3, 4, 5, tz="America/New_York")
+
+    benchmark(lambda: dt.diff(other).in_days())
+
+
+@pytest.mark.benchmark(group="DateTime")
+def test_diff_in_words(benchmark: Callable[..., Any], dt: pendulum.DateTime) -> None:
+    other = pendulum.datetime(2019, 11, 2, 3, 4, 5, tz="America/New_York")
+
+    benchmark(lambda: dt.diff(other).in_words())
+
+
+@pytest.mark.benchmark(group="DateTime")
+def test_diff_for_humans(benchmark: Callable[..., Any], dt: pendulum.DateTime) -> None:
+    other = dt.add(days=3, hours=2)
+
+    benchmark(dt.diff_for_humans, other)
+
+
+@pytest.mark.benchmark(group="DateTime")
+def test_in_timezone(benchmark: Callable[..., Any], dt: pendulum.DateTime) -> None:
+    benchmark(dt.in_timezone, "America/New_York")
+
+
+@pytest.mark.benchmark(group="Creation")
+@pytest.mark.parametrize("tz", ["Europe/Paris", "UTC", 5.5])
+def test_create(benchmark: Callable[..., Any], tz: str | float) -> None:
+    timezone = pendulum._safe_timezone(tz)
+
+    benchmark(pendulum.DateTime.create, 2016, 3, 26, 12, 34, 56, 123456, tz=timezone)
+
+
+@pytest.mark.benchmark(group="Creation")
+def test_from_timestamp(benchmark: Callable[..., Any]) -> None:
+    benchmark(pendulum.from_timestamp, 1458992096.123, "Europe/Paris")
+
+
+@pytest.mark.benchmark(group="Creation")
+def test_from_epoch_millis(benchmark: Callable[..., Any]) -> None:
+    benchmark(pendulum.from_epoch_millis, 1458992096123, "Europe/Paris")
+
+
+@pytest.mark.benchmark(group="DateTime")
+def test_start_of(benchmark: Callable[..., Any], dt: pendulum.DateTime) -> None:
+    benchmark(dt.start_of, "month")
+
+
+@pytest.mark.benchmark(group="Formatting")
+def test_format(benchmark: Callable[..., Any], dt: pendulum.DateTime) -> None:
+    benchmark(dt.format, "dddd Do [of] MMMM YYYY HH:mm:ss.SSS A Z")
+
+
+@pytest.mark.benchmark(group="Formatting")
+def test_format_localized(benchmark: Callable[..., Any], dt: pendulum.DateTime) -> None:
+    benchmark(dt.format, "dddd D MMMM YYYY LT", locale="fr")
+
+
+@pytest.mark.benchmark(group="Formatting")
+def test_from_format(benchmark: Callable[..., Any]) -> None:
+    benchmark(
+        pendulum.from_format,
+        "Saturday 26th of March 2016 12:34:56.123 PM +01:00",
+        "dddd Do [of] MMMM YYYY HH:mm:ss.SSS A Z",
+    )
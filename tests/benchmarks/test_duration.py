@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from typing import Any
+from typing import Callable
+
+import pytest
+
+import pendulum
+
+
+@pytest.fixture
+def duration() -> pendulum.Duration:
+    return pendulum.duration(days=12, hours=5, minutes=32, seconds=7)
+
+
+@pytest.mark.benchmark(group="Duration")
+def test_duration(benchmark: Callable[..., Any]) -> None:
+    benchmark(pendulum.duration, years=1, days=12, hours=5, minutes=32, seconds=7)
+
+
+@pytest.mark.benchmark(group="Duration")
+def test_add(benchmark: Callable[..., Any], duration: pendulum.Duration) -> None:
+    other = pendulum.duration(hours=30, seconds=2)
+
+    benchmark(duration.__add__, other)
+
+
+@pytest.mark.benchmark(group="Duration")
+def test_multiply(benchmark: Callable[..., Any], duration: pendulum.Duration) -> None:
+    benchmark(duration.__mul__, 3)
+
+
+@pytest.mark.benchmark(group="Duration")
+def test_divide(benchmark: Callable[..., Any], duration: pendulum.Duration) -> None:
+    benchmark(duration.__truediv__, 7)
+
+
+@pytest.mark.benchmark(group="Duration")
+def test_in_words(benchmark: Callable[..., Any], duration: pendulum.Duration) -> None:
+    benchmark(duration.in_words)
+
+
+@pytest.mark.benchmark(group="Duration")
+def test_sum(benchmark: Callable[..., Any]) -> None:
+    durations = [pendulum.duration(minutes=i % 60, seconds=i) for i in range(1000)]
+
+    benchmark(pendulum.Duration.sum, durations)
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+from typing import Any
+from typing import Callable
+
+import pytest
+
+
+# Modules which must only be imported when their features are used
+LAZY_MODULES = {
+    "dateutil",
+    "time_machine",
+    "pendulum.datetime_array",
+    "pendulum.interval_index",
+    "pendulum.locales.bundle",
+    "pendulum.parser",
+    "pendulum.testing.traveller",
+}
+
+
+def import_times(code: str) -> dict[str, int]:
+    """
+    Runs code in a new interpreter and returns the cumulative import time,
+    in microseconds, of every module it imported.
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    times = {}
+    for line in process.stderr.splitlines():
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+
+    return times
+
+
+@pytest.mark.benchmark(group="Import")
+def test_import(benchmark: Callable[..., Any]) -> None:
+    code = "import pendulum; pendulum.now()"
+
+    # pytest-codspeed does not return the result of the benchmarked function
+    benchmark(import_times, code)
+    times = import_times(code)
+
+    assert "pendulum" in times
+    assert not LAZY_MODULES & set(times)
+
+
+@pytest.mark.benchmark(group="Import")
+def test_import_and_parse_non_strict(benchmark: Callable[..., Any]) -> None:
+    # Common layouts are handled without falling back on dateutil
+    code = (
+        "import pendulum; "
+        "pendulum.parse('Thu, 06 Oct 2016 12:34:56 GMT', strict=False); "
+        "pendulum.parse('10/06/2016 12:34 PM', strict=False)"
+    )
+
+    benchmark(import_times, code)
+    times = import_times(code)
+
+    assert "pendulum" in times
+    assert "dateutil" not in times
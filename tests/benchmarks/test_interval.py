@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from typing import Any
+from typing import Callable
+
+import pytest
+
+import pendulum
+
+
+@pytest.fixture
+def interval() -> pendulum.Interval:
+    start = pendulum.datetime(2016, 1, 1, tz="Europe/Paris")
+
+    return pendulum.interval(start, start.add(years=1))
+
+
+@pytest.mark.benchmark(group="Interval")
+def test_interval(benchmark: Callable[..., Any]) -> None:
+    start = pendulum.datetime(2016, 1, 1, tz="Europe/Paris")
+    end = pendulum.datetime(2017, 3, 4, 5, 6, 7, tz="Europe/Paris")
+
+    benchmark(pendulum.interval, start, end)
+
+
+@pytest.mark.benchmark(group="Interval")
+def test_range_days(benchmark: Callable[..., Any], interval: pendulum.Interval) -> None:
+    benchmark(lambda: list(interval.range("days")))
+
+
+@pytest.mark.benchmark(group="Interval")
+def test_range_hours(
+    benchmark: Callable[..., Any], interval: pendulum.Interval
+) -> None:
+    benchmark(lambda: list(interval.range("hours", 6)))
+
+
+@pytest.mark.benchmark(group="Interval")
+def test_range_months(
+    benchmark: Callable[..., Any], interval: pendulum.Interval
+) -> None:
+    benchmark(lambda: list(interval.range("months")))
+
+
+@pytest.mark.benchmark(group="Interval")
+def test_contains(benchmark: Callable[..., Any], interval: pendulum.Interval) -> None:
+    dt = pendulum.datetime(2016, 6, 1, tz="Europe/Paris")
+
+    benchmark(interval.__contains__, dt)
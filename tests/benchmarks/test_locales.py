@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from typing import Any
+from typing import Callable
+
+import pytest
+
+from pendulum.locales.locale import Locale
+
+
+@pytest.mark.benchmark(group="Locales")
+def test_load(benchmark: Callable[..., Any]) -> None:
+    def load() -> Locale:
+        Locale._cache.pop("fr", None)
+
+        return Locale.load("fr")
+
+    benchmark(load)
+
+
+@pytest.mark.benchmark(group="Locales")
+def test_load_cached(benchmark: Callable[..., Any]) -> None:
+    Locale.load("fr")
+
+    benchmark(Locale.load, "fr")
+
+
+@pytest.mark.benchmark(group="Locales")
+def test_translation(benchmark: Callable[..., Any]) -> None:
+    locale = Locale.load("fr")
+
+    benchmark(locale.translation, "units.day.other")
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+from typing import Callable
+
+import pytest
+
+import pendulum
+
+from pendulum.parsing import parse
+
+
+@pytest.mark.benchmark(group="Parsing")
+@pytest.mark.parametrize(
+    "text",
+    [
+        "2016-10-06T12:34:56.123456+05:30",
+        "2016-10-06T12:34:56.123456Z",
+        "2016-10-06T12:34:56.123456",
+    ],
+)
+def test_parse(benchmark: Callable[..., Any], text: str) -> None:
+    benchmark(pendulum.parse, text)
+
+
+@pytest.mark.benchmark(group="Parsing")
+def test_parse_through_native_datetime(benchmark: Callable[..., Any]) -> None:
+    # The path taken before DateTime instances were built by the parser,
+    # kept as a reference for the per-call saving.
+    def parse_and_convert(text: str) -> pendulum.DateTime:
+        dt = parse(text)
+        assert isinstance(dt, datetime)
+
+        return pendulum.instance(dt)
+
+    benchmark(parse_and_convert, "2016-10-06T12:34:56.123456+05:30")
@@ -158,6 +158,13 @@ def test_deepcopy():
     assert dt == deepcopy(dt)
 
 
+def test_pickle_and_deepcopy_keep_nanoseconds():
+    dt = pendulum.datetime(2016, 10, 6, 12, 34, 56, 123456, nanosecond=789)
+
+    assert pickle.loads(pickle.dumps(dt)).nanosecond == 789
+    assert deepcopy(dt).nanosecond == 789
+
+
 def test_deepcopy_on_transition():
     dt = pendulum.datetime(2023, 11, 5, 1, 0, 0, tz="US/Pacific")
     clone = deepcopy(dt)
@@ -125,6 +125,51 @@ if time_machine:
         assert not in_paris.is_dst()
         assert in_paris.isoformat() == in_paris_from_utc.isoformat()
 
+    @time_machine.travel("2016-10-30 01:30:00.123456Z", tick=False)
+    def test_now_coarse():
+        now = pendulum.now("Europe/Paris", coarse=True)
+
+        assert now.isoformat() == "2016-10-30T02:30:00+01:00"
+        assert now.fold == 1
+        assert pendulum.now("Europe/Paris", coarse=True) is now
+
+    def test_now_coarse_ticks():
+        with time_machine.travel("2016-10-30 01:30:00Z", tick=False) as traveller:
+            now = pendulum.now("UTC", coarse=True)
+
+            traveller.shift(0.5)
+            assert pendulum.now("UTC", coarse=True) is now
+
+            traveller.shift(0.5)
+            assert pendulum.now("UTC", coarse=True) == now.add(seconds=1)
+
+    def test_today_is_memoized_until_the_end_of_the_day():
+        with time_machine.travel("2016-03-26 22:30:00Z", tick=False) as traveller:
+            today = pendulum.today("Europe/Paris")
+            tomorrow = pendulum.tomorrow("Europe/Paris")
+            yesterday = pendulum.yesterday("Europe/Paris")
+
+            assert today.isoformat() == "2016-03-26T00:00:00+01:00"
+            assert tomorrow.isoformat() == "2016-03-27T00:00:00+01:00"
+            assert yesterday.isoformat() == "2016-03-25T00:00:00+01:00"
+
+            traveller.shift(1799)
+            assert pendulum.today("Europe/Paris") is today
+            assert pendulum.tomorrow("Europe/Paris") is tomorrow
+            assert pendulum.yesterday("Europe/Paris") is yesterday
+
+            traveller.shift(1)
+            assert pendulum.today("Europe/Paris") == tomorrow
+            assert pendulum.tomorrow("Europe/Paris").isoformat() == (
+                "2016-03-28T00:00:00+02:00"
+            )
+            assert pendulum.yesterday("Europe/Paris") == today
+
+
+def test_timezones_are_cached_by_name():
+    assert pendulum.timezone("Europe/Paris") is pendulum.timezone("Europe/Paris")
+    assert pendulum.timezone("utc") is pendulum.UTC
+
 
 def test_now_with_fixed_offset():
     now = pendulum.now(6)
@@ -157,3 +202,41 @@ def test_local():
 
     assert_datetime(local, 2018, 2, 2, 12, 34, 56, 123456)
     assert local.timezone_name == "America/Toronto"
+
+
+class MyDateTime(DateTime):
+    pass
+
+
+@pytest.mark.parametrize(
+    "tz", ["Europe/Paris", "UTC", pendulum.fixed_timezone(-9000), None]
+)
+def test_create_subclass(tz):
+    dt = MyDateTime.create(2013, 3, 31, 12, 34, 56, 123456, tz=tz)
+
+    assert type(dt) is MyDateTime
+    assert_datetime(dt, 2013, 3, 31, 12, 34, 56, 123456)
+    assert dt.tzinfo is (None if tz is None else pendulum._safe_timezone(tz))
+
+
+def test_create_normalizes_skipped_and_repeated_times():
+    skipped = MyDateTime.create(2013, 3, 31, 2, 30, tz="Europe/Paris")
+    repeated = MyDateTime.create(2013, 10, 27, 2, 30, tz="Europe/Paris", fold=0)
+
+    assert type(skipped) is MyDateTime
+    assert_datetime(skipped, 2013, 3, 31, 3, 30)
+    assert skipped.offset == 7200
+    assert type(repeated) is MyDateTime
+    assert_datetime(repeated, 2013, 10, 27, 2, 30)
+    assert repeated.offset == 7200
+
+
+def test_create_with_invalid_fields():
+    with pytest.raises(ValueError):
+        pendulum.datetime(2013, 2, 29, tz="Europe/Paris")
+
+    with pytest.raises(ValueError):
+        pendulum.datetime(2013, 3, 31, 24, tz="Europe/Paris")
+
+    with pytest.raises(TypeError):
+        pendulum.datetime(2013, 3, 31, 1.5, tz="Europe/Paris")
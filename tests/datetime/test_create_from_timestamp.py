@@ -22,3 +22,40 @@ def test_create_from_timestamp_with_timezone():
     d = pendulum.from_timestamp(0, timezone("America/Toronto"))
     assert d.timezone_name == "America/Toronto"
     assert_datetime(d, 1969, 12, 31, 19, 0, 0)
+
+
+def test_create_from_epoch_seconds():
+    d = pendulum.from_epoch_seconds(169943525)
+    assert_datetime(d, 1975, 5, 21, 22, 32, 5)
+    assert d.timezone_name == "UTC"
+
+
+def test_create_from_epoch_with_timezone():
+    d = pendulum.from_epoch_seconds(0, "America/Toronto")
+    assert d.timezone_name == "America/Toronto"
+    assert_datetime(d, 1969, 12, 31, 19, 0, 0)
+
+    d = pendulum.from_epoch_millis(1382837400123, timezone("Europe/Paris"))
+    assert_datetime(d, 2013, 10, 27, 2, 30, 0, 123000)
+    assert d.fold == 1
+    assert d.offset == 3600
+
+
+def test_create_from_epoch_subsecond_units():
+    assert_datetime(
+        pendulum.from_epoch_millis(1382837400123), 2013, 10, 27, 1, 30, 0, 123000
+    )
+    assert_datetime(
+        pendulum.from_epoch_micros(1382837400123456), 2013, 10, 27, 1, 30, 0, 123456
+    )
+    assert_datetime(
+        pendulum.from_epoch_nanos(1382837400123456789), 2013, 10, 27, 1, 30, 0, 123456
+    )
+    assert_datetime(pendulum.from_epoch_nanos(-1), 1969, 12, 31, 23, 59, 59, 999999)
+
+
+def test_create_from_epoch_is_exact():
+    # 2**53 + 1 microseconds cannot be represented by a float timestamp
+    d = pendulum.from_epoch_micros(2**53 + 1)
+    assert d.microsecond == 740993
+    assert pendulum.from_timestamp((2**53 + 1) / 1e6).microsecond != 740993
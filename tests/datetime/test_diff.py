@@ -836,6 +836,68 @@ def test_diff_for_humans_accuracy():
         assert now.add(days=6).diff_for_humans(absolute=True) == "6 days"
 
 
+def test_format_diffs():
+    now = pendulum.datetime(2016, 8, 29, tz="America/Toronto")
+    dts = [now.subtract(minutes=3), now.add(days=2), now.subtract(minutes=3)]
+
+    with pendulum.travel_to(now, freeze=True):
+        assert pendulum.format_diffs(dts) == [
+            "3 minutes ago",
+            "in 2 days",
+            "3 minutes ago",
+        ]
+        assert pendulum.format_diffs(dts, absolute=True, locale="fr") == [
+            "3 minutes",
+            "2 jours",
+            "3 minutes",
+        ]
+
+    assert pendulum.format_diffs(dts, now) == [
+        "3 minutes before",
+        "2 days after",
+        "3 minutes before",
+    ]
+
+    dates = [dt.date() for dt in dts]
+    assert pendulum.format_diffs(dates, now.add(days=1).date()) == [
+        "2 days before",
+        "1 day after",
+        "2 days before",
+    ]
+
+
+def test_format_diffs_mixed_dates_and_datetimes():
+    now = pendulum.datetime(2016, 8, 29, 12, tz="America/Toronto")
+    values = [
+        pendulum.date(2016, 8, 27),
+        now.subtract(minutes=3),
+        pendulum.date(2016, 8, 31),
+        now.add(hours=5),
+    ]
+
+    with pendulum.travel_to(now, freeze=True):
+        assert pendulum.format_diffs(values) == [
+            value.diff_for_humans() for value in values
+        ]
+        assert pendulum.format_diffs(values) == [
+            "2 days ago",
+            "3 minutes ago",
+            "in 2 days",
+            "in 5 hours",
+        ]
+
+
+def test_diff_for_humans_is_cached_by_bucket():
+    now = pendulum.datetime(2016, 8, 29, tz="America/Toronto")
+
+    with pendulum.travel_to(now, freeze=True):
+        first = now.subtract(minutes=3).diff_for_humans()
+        second = now.subtract(minutes=3, seconds=25).diff_for_humans()
+
+    assert first == second == "3 minutes ago"
+    assert first is second
+
+
 def test_subtraction():
     d = pendulum.naive(2016, 7, 5, 12, 32, 25, 0)
     future_dt = datetime(2016, 7, 5, 13, 32, 25, 0)
@@ -878,3 +940,17 @@ def test_subtraction_with_timezone():
     post = dt.add(microseconds=1)
 
     assert (post - dt).total_seconds() == 1e-06
+
+
+def test_diff_in_nanoseconds():
+    dt1 = pendulum.from_epoch_nanos(1475757296123456789)
+    dt2 = pendulum.from_epoch_nanos(1475757297123456001, "Europe/Paris")
+
+    assert dt1.diff(dt2).in_nanoseconds() == 999999212
+    assert dt2.diff(dt1).in_nanoseconds() == 999999212
+    assert dt2.diff(dt1, False).in_nanoseconds() == -999999212
+    assert (dt1 - dt2).in_nanoseconds() == -999999212
+
+    # Endpoints without nanoseconds
+    dt = pendulum.datetime(2016, 1, 1)
+    assert dt.diff(dt.add(microseconds=1)).in_nanoseconds() == 1000
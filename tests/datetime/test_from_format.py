@@ -220,3 +220,30 @@ def test_from_format_2_digit_year():
 
     d = pendulum.from_format("99", "YY")
     assert d.year == 1999
+
+
+def test_from_format_reuses_compiled_pattern():
+    formatter = pendulum._formatter
+    formatter._compiled_patterns.cache_clear()
+
+    d = pendulum.from_format("21/05/1975 22:32:11", "DD/MM/YYYY HH:mm:ss")
+    assert_datetime(d, 1975, 5, 21, 22, 32, 11)
+
+    d = pendulum.from_format("22/06/1976 23:33:12", "DD/MM/YYYY HH:mm:ss")
+    assert_datetime(d, 1976, 6, 22, 23, 33, 12)
+
+    info = formatter._compiled_patterns.cache_info()
+    assert info.hits == 1
+    assert info.misses == 1
+
+
+def test_from_format_nanoseconds():
+    d = pendulum.from_format(
+        "2016-10-06 12:34:56.123456789", "YYYY-MM-DD HH:mm:ss.SSSSSSSSS"
+    )
+    assert_datetime(d, 2016, 10, 6, 12, 34, 56, 123456)
+    assert d.nanosecond == 789
+
+    d = pendulum.from_format("12:34:56.1234567", "HH:mm:ss.SSSSSSS")
+    assert d.microsecond == 123456
+    assert d.nanosecond == 700
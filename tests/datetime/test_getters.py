@@ -293,3 +293,29 @@ def test_time():
 )
 def test_week_of_month_negative(date, expected):
     assert date.week_of_month == expected
+
+
+def test_nanosecond():
+    d = pendulum.datetime(2016, 10, 6, 12, 34, 56, 123456, nanosecond=789)
+    assert d.microsecond == 123456
+    assert d.nanosecond == 789
+    assert d.int_timestamp_ns == 1475757296123456789
+
+    d = pendulum.datetime(2016, 10, 6, 12, 34, 56, 123456)
+    assert d.nanosecond == 0
+    assert d.int_timestamp_ns == 1475757296123456000
+
+    with pytest.raises(ValueError):
+        pendulum.datetime(2016, 10, 6, nanosecond=1000)
+
+
+def test_nanosecond_is_kept_by_timezone_changes_and_additions():
+    d = pendulum.from_epoch_nanos(1475757296123456789)
+    assert d.nanosecond == 789
+    assert d.in_timezone("Europe/Paris").nanosecond == 789
+    assert d.add(hours=1).nanosecond == 789
+    assert d.add(months=1).nanosecond == 789
+    assert d.subtract(seconds=1).int_timestamp_ns == 1475757295123456789
+
+    # Truncations reset it
+    assert d.start_of("second").nanosecond == 0
@@ -59,3 +59,16 @@ def test_replace_tzinfo_dst_transitioning_off():
     assert not in_paris.is_dst()
     assert in_paris.offset == 3600
     assert in_paris.timezone_name == "Europe/Paris"
+
+
+def test_replace_keeps_nanosecond():
+    dt = pendulum.parse("2016-10-06T12:34:56.123456789+05:30")
+
+    assert dt.replace(hour=1).nanosecond == 789
+    assert dt.replace(tzinfo=pendulum.timezone("Europe/Paris")).nanosecond == 789
+    assert dt.set(year=2020).nanosecond == 789
+    assert dt.at(1).nanosecond == 0
+
+    # Replacing the microsecond resets it
+    assert dt.replace(microsecond=123456).nanosecond == 0
+    assert dt.set(microsecond=1).nanosecond == 0
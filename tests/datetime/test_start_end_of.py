@@ -21,6 +21,17 @@ def test_end_of_second():
     assert_datetime(new, d.year, d.month, d.day, d.hour, d.minute, d.second, 999999)
 
 
+@pytest.mark.parametrize(
+    "unit",
+    ["second", "minute", "hour", "day", "week", "month", "year", "decade", "century"],
+)
+def test_end_of_sets_last_nanosecond(unit):
+    d = pendulum.from_epoch_nanos(1475757296123456789)
+
+    assert d.end_of(unit).nanosecond == 999
+    assert d.start_of(unit).nanosecond == 0
+
+
 def test_start_of_minute():
     d = pendulum.now()
     new = d.start_of("minute")
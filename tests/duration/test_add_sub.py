@@ -2,8 +2,11 @@ from __future__ import annotations
 
 from datetime import timedelta
 
+import pytest
+
 import pendulum
 
+from pendulum.duration import AbsoluteDuration
 from tests.conftest import assert_duration
 
 
@@ -52,3 +55,56 @@ def test_sub_unsupported():
 def test_neg():
     p = pendulum.duration(days=23, seconds=32)
     assert_duration(-p, 0, 0, -3, -2, 0, 0, -32)
+
+
+def test_sum():
+    p = pendulum.Duration.sum(
+        [
+            pendulum.duration(days=23, seconds=32),
+            pendulum.duration(years=1, months=2, hours=-1),
+            timedelta(days=12, seconds=30),
+        ]
+    )
+
+    assert isinstance(p, pendulum.Duration)
+    assert_duration(p, 1, 2, 4, 6, 23, 1, 2)
+
+
+def test_sum_empty():
+    assert_duration(pendulum.Duration.sum([]), 0, 0, 0, 0, 0, 0, 0, 0)
+
+
+def test_accumulator():
+    acc = pendulum.DurationAccumulator()
+    acc += pendulum.duration(days=23, seconds=32)
+    acc -= timedelta(days=12, seconds=28)
+    acc.add(pendulum.duration(months=1, microseconds=5))
+    acc.subtract(pendulum.duration(years=1))
+
+    assert_duration(acc.as_duration(), -1, 1, 1, 4, 0, 0, 4, 5)
+    assert repr(acc) == f"DurationAccumulator({acc.as_duration()!r})"
+
+
+def test_accumulator_update():
+    deltas = [pendulum.duration(seconds=1, microseconds=i) for i in range(1000)]
+    acc = pendulum.DurationAccumulator(deltas[:500])
+    acc.update(deltas[500:])
+
+    assert acc.as_duration() == pendulum.duration(seconds=1000, microseconds=499500)
+
+
+def test_accumulator_unsupported():
+    acc = pendulum.DurationAccumulator()
+
+    with pytest.raises(TypeError):
+        acc.add(5)  # type: ignore[arg-type]
+
+    with pytest.raises(TypeError):
+        acc += 5  # type: ignore[arg-type]
+
+
+def test_accumulator_absolute_duration():
+    acc = pendulum.DurationAccumulator([AbsoluteDuration(years=1, days=-2)])
+    acc -= AbsoluteDuration(months=1, hours=-1)
+
+    assert_duration(acc.as_duration(), 1, -1, 0, 1, 23, 0, 0)
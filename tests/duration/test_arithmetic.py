@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+from datetime import timedelta
+
 import pendulum
 
+from pendulum.duration import AbsoluteDuration
 from tests.conftest import assert_duration
 
 
@@ -83,3 +86,46 @@ def test_floor_divide():
 
     assert isinstance(mul, pendulum.Duration)
     assert_duration(mul, 0, 1, 0, 0, 16, 0, 11, 840740)
+
+
+def test_floor_divide_by_timedelta():
+    it = pendulum.duration(days=2, seconds=34, microseconds=522222)
+
+    assert it // timedelta(hours=1) == 48
+    assert it // pendulum.duration(hours=1) == 48
+    assert it / timedelta(days=4) == it.total_seconds() / (4 * 86400)
+
+
+def test_modulo():
+    it = pendulum.duration(days=2, seconds=34, microseconds=522222)
+
+    assert_duration(it % timedelta(hours=1), 0, 0, 0, 0, 0, 0, 34, 522222)
+
+    q, r = divmod(it, pendulum.duration(days=1))
+    assert q == 2
+    assert_duration(r, 0, 0, 0, 0, 0, 0, 34, 522222)
+
+
+def test_absolute_duration_with_years_and_months():
+    it = AbsoluteDuration(years=1, days=2)
+
+    assert_duration(it * 2, years=2, weeks=0, days=4)
+    assert_duration(2 * it, years=2, weeks=0, days=4)
+    assert_duration(it * 1.5, weeks=78, days=4, hours=12)
+    assert it / pendulum.duration(days=1, hours=1) == 352.32
+    assert_duration(it / 2, weeks=26, days=1, hours=12)
+    assert_duration(it // 2, weeks=26, days=1, hours=12)
+    assert it // pendulum.duration(hours=7) == 1258
+    assert_duration(it % pendulum.duration(hours=7), hours=2)
+
+    q, r = divmod(it, pendulum.duration(hours=7))
+    assert q == 1258
+    assert_duration(r, hours=2)
+
+    it = AbsoluteDuration(months=2, days=-3, hours=5)
+
+    assert_duration(it * 2, months=4, weeks=0, days=5, hours=14)
+    assert it / pendulum.duration(days=1, hours=1) == 60.28
+    assert_duration(it // 2, months=1, weeks=4, days=3, hours=9, minutes=30)
+    assert_duration(it % pendulum.duration(hours=7), hours=2)
+    assert divmod(it, pendulum.duration(hours=7))[0] == 215
@@ -30,3 +30,35 @@ def test_deepcopy() -> None:
 
     assert copied_duration == duration
     assert_duration(copied_duration, months=1)
+
+
+def test_no_instance_dict() -> None:
+    duration = pendulum.duration(days=3, seconds=2456, microseconds=123456)
+    interval = pendulum.datetime(2020, 1, 1) - pendulum.datetime(2019, 3, 4)
+
+    assert not hasattr(duration, "__dict__")
+    assert not hasattr(interval, "__dict__")
+
+
+def test_breakdown_is_computed_on_access() -> None:
+    duration = pendulum.duration(weeks=-2, days=-3, hours=-5, microseconds=-1)
+
+    assert duration._parts is None
+    assert_duration(
+        duration, weeks=-2, days=-3, hours=-5, minutes=0, seconds=0, microseconds=-1
+    )
+    assert duration._parts is not None
+
+
+def test_signature_keeps_calendar_units() -> None:
+    dt = pendulum.datetime(2024, 3, 30, 12, tz="Europe/Paris")
+
+    assert dt + pendulum.duration(days=1) == pendulum.datetime(
+        2024, 3, 31, 12, tz="Europe/Paris"
+    )
+    assert dt + pendulum.duration(seconds=86400) == pendulum.datetime(
+        2024, 3, 31, 13, tz="Europe/Paris"
+    )
+    assert dt + pendulum.duration(months=1, seconds=1, microseconds=5) == (
+        pendulum.datetime(2024, 4, 30, 12, 0, 1, 5, tz="Europe/Paris")
+    )
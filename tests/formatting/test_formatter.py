@@ -190,6 +190,13 @@ def test_fractional_second():
     assert f.format(d, "SSSS") == "0001"
     assert f.format(d, "SSSSS") == "00012"
     assert f.format(d, "SSSSSS") == "000123"
+    assert f.format(d, "SSSSSSSSS") == "000123000"
+
+    d = pendulum.datetime(2016, 8, 28, 7, 3, 6, 123456, nanosecond=789)
+    assert f.format(d, "SSSSSS") == "123456"
+    assert f.format(d, "SSSSSSS") == "1234567"
+    assert f.format(d, "SSSSSSSS") == "12345678"
+    assert f.format(d, "SSSSSSSSS") == "123456789"
 
 
 def test_timezone():
@@ -275,3 +282,27 @@ def test_unknown_token():
     d = pendulum.datetime(2016, 8, 28, 7, 3, 6, 123456)
 
     assert f.format(d, "J") == "J"
+
+
+def test_compiled_formats_are_reused():
+    f = Formatter()
+    d = pendulum.datetime(2016, 8, 28, 7, 3, 6, 123456)
+
+    assert f.format(d, "dddd D MMMM YYYY") == "Sunday 28 August 2016"
+    assert f.format(d, "dddd D MMMM YYYY") == "Sunday 28 August 2016"
+    assert f.format(d, "dddd D MMMM YYYY", locale="fr") == "dimanche 28 août 2016"
+
+    info = f._compiled_formats.cache_info()  # type: ignore[attr-defined]
+    assert info.hits == 1
+    assert info.misses == 2
+
+
+def test_compiled_formats_follow_current_locale():
+    f = Formatter()
+    d = pendulum.datetime(2016, 8, 28)
+
+    assert f.format(d, "MMMM") == "August"
+
+    pendulum.set_locale("fr")
+
+    assert f.format(d, "MMMM") == "août"
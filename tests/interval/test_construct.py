@@ -119,3 +119,19 @@ def test_different_timezones_same_time():
 
     assert interval.in_words() == "1 day 5 hours"
     assert interval.in_hours() == 29
+
+
+def test_precise_diff_is_computed_lazily():
+    dt1 = pendulum.datetime(2000, 1, 1)
+    dt2 = pendulum.datetime(2001, 2, 3, 4, 5, 6)
+
+    p = pendulum.interval(dt1, dt2)
+
+    assert p._precise_diff is None
+    assert dt1.add(days=7) in p
+    assert p._precise_diff is None
+
+    assert p.years == 1
+    assert p.months == 1
+    assert p.remaining_days == 2
+    assert p._precise_diff is not None
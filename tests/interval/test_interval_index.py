@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+import pendulum
+
+from pendulum.interval import Interval
+
+
+@pytest.fixture
+def intervals() -> list[Interval]:
+    rng = random.Random(42)
+    start = pendulum.datetime(2023, 1, 1, tz="Europe/Paris")
+
+    intervals: list[Interval] = []
+    for _ in range(500):
+        dt = start.add(minutes=rng.randrange(60 * 24 * 30))
+        intervals.append(pendulum.interval(dt, dt.add(minutes=rng.randrange(600))))
+
+    return intervals
+
+
+def test_containing(intervals: list[Interval]) -> None:
+    index = pendulum.IntervalIndex(intervals)
+    start = pendulum.datetime(2023, 1, 1, tz="Europe/Paris")
+
+    assert len(index) == len(intervals)
+
+    for minutes in range(0, 60 * 24 * 31, 97):
+        dt = start.add(minutes=minutes)
+        expected = [i for i in intervals if i.start <= dt <= i.end]
+
+        assert sorted(index.containing(dt), key=intervals.index) == expected
+
+
+def test_containing_endpoints() -> None:
+    dt = pendulum.datetime(2023, 1, 1)
+    interval = pendulum.interval(dt, dt.add(hours=1))
+    index = pendulum.IntervalIndex([interval])
+
+    assert index.containing(dt) == [interval]
+    assert index.containing(dt.add(hours=1)) == [interval]
+    assert index.containing(dt.add(hours=1, microseconds=1)) == []
+    assert index.containing(dt.in_timezone("Asia/Tokyo")) == [interval]
+
+
+def test_overlapping(intervals: list[Interval]) -> None:
+    index = pendulum.IntervalIndex(intervals)
+    start = pendulum.datetime(2023, 1, 1, tz="Europe/Paris")
+
+    for minutes in range(0, 60 * 24 * 31, 331):
+        a = start.add(minutes=minutes)
+        b = a.add(minutes=minutes % 240)
+        expected = [i for i in intervals if i.start <= b and a <= i.end]
+
+        assert sorted(index.overlapping(a, b), key=intervals.index) == expected
+        assert sorted(index.overlapping(b, a), key=intervals.index) == expected
+
+
+def test_merged() -> None:
+    dt = pendulum.datetime(2023, 1, 1)
+    index = pendulum.IntervalIndex(
+        [
+            pendulum.interval(dt.add(hours=5), dt.add(hours=6)),
+            pendulum.interval(dt, dt.add(hours=2)),
+            pendulum.interval(dt.add(hours=3), dt.add(hours=1)),
+            pendulum.interval(dt.add(hours=2), dt.add(hours=4)),
+            pendulum.interval(dt.add(hours=7), dt.add(hours=8)),
+            pendulum.interval(dt.add(hours=7), dt.add(hours=7, minutes=30)),
+        ]
+    )
+
+    assert [(i.start, i.end) for i in index.merged()] == [
+        (dt, dt.add(hours=4)),
+        (dt.add(hours=5), dt.add(hours=6)),
+        (dt.add(hours=7), dt.add(hours=8)),
+    ]
+
+
+def test_dates() -> None:
+    d = pendulum.date(2023, 1, 1)
+    index = pendulum.IntervalIndex(
+        [Interval(d, d.add(days=3)), Interval(d.add(days=3), d)]
+    )
+
+    assert len(index.containing(d.add(days=1))) == 2
+    assert index.overlapping(d.add(days=4), d.add(days=10)) == []
+    assert [(i.start, i.end) for i in index.merged()] == [(d, d.add(days=3))]
+
+    with pytest.raises(TypeError):
+        index.containing(pendulum.datetime(2023, 1, 2))
+
+
+def test_mixed_intervals() -> None:
+    with pytest.raises(TypeError):
+        pendulum.IntervalIndex(
+            [
+                Interval(pendulum.date(2023, 1, 1), pendulum.date(2023, 1, 2)),
+                pendulum.interval(
+                    pendulum.naive(2023, 1, 1), pendulum.naive(2023, 1, 2)
+                ),
+            ]
+        )
+
+
+def test_empty() -> None:
+    index = pendulum.IntervalIndex()
+
+    assert len(index) == 0
+    assert index.containing(pendulum.datetime(2023, 1, 1)) == []
+    assert index.merged() == []
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pytest
+
 import pendulum
 
 from pendulum.interval import Interval
@@ -117,3 +119,83 @@ def test_range_amount():
     assert_datetime(r[1], 2016, 10, 16, 1, 0, 0)
     assert_datetime(r[2], 2016, 10, 18, 0, 0, 0)
     assert_datetime(r[3], 2016, 10, 20, 0, 0, 0)
+
+
+def test_range_len_and_indexing():
+    dt1 = pendulum.datetime(2016, 1, 1, tz="Europe/Paris")
+    dt2 = pendulum.datetime(2016, 12, 31, 23, 59, tz="Europe/Paris")
+
+    r = pendulum.interval(dt1, dt2).range("minutes", 15)
+
+    assert len(r) == 366 * 24 * 4
+    assert r[0] == dt1
+    assert r[1] == dt1.add(minutes=15)
+    assert_datetime(r[-1], 2016, 12, 31, 23, 45, 0)
+    assert r[-1] == r[len(r) - 1]
+    assert r[10:13] == [dt1.add(minutes=150), dt1.add(minutes=165), dt1.add(hours=3)]
+
+    with pytest.raises(IndexError):
+        r[len(r)]
+
+
+def test_range_months_len_and_indexing():
+    dt1 = pendulum.date(2016, 1, 31)
+    dt2 = pendulum.date(2017, 3, 1)
+
+    r = pendulum.interval(dt2, dt1).range("months")
+
+    assert len(r) == 14
+    assert r[1] == pendulum.date(2017, 2, 1)
+    assert r[-1] == pendulum.date(2016, 2, 1)
+    assert list(r) == [dt2.subtract(months=i) for i in range(14)]
+
+
+@pytest.mark.parametrize("unit", ["years", "months", "weeks", "days", "hours"])
+@pytest.mark.parametrize("amount", [1, 3])
+def test_range_matches_add(unit, amount):
+    dt1 = pendulum.datetime(2016, 1, 31, 2, 30, tz="America/Sao_Paulo")
+    dt2 = dt1.add(years=5)
+
+    r = pendulum.interval(dt1, dt2).range(unit, amount)
+    expected = [dt1]
+    while dt1.add(**{unit: amount * len(expected)}) <= dt2:
+        expected.append(dt1.add(**{unit: amount * len(expected)}))
+
+    assert len(r) == len(expected)
+    assert list(r) == expected
+    assert [dt.fold for dt in r] == [dt.fold for dt in expected]
+
+
+def test_range_across_repeated_time():
+    dt1 = pendulum.datetime(2016, 10, 30, 1, 50, tz="Europe/Paris")
+    dt2 = pendulum.datetime(2016, 10, 30, 2, 10, tz="Europe/Paris", fold=1)
+
+    r = pendulum.interval(dt1, dt2).range("minutes", 10)
+
+    # Comparisons in the same timezone only consider the wall clock time,
+    # so iteration stops at the first element past 02:10 in the first 2 AM.
+    assert len(r) == 3
+    assert list(r) == [dt1, dt1.add(minutes=10), dt1.add(minutes=20)]
+
+
+def test_range_next():
+    dt1 = pendulum.datetime(2000, 1, 1)
+    dt2 = pendulum.datetime(2000, 1, 2)
+
+    r = pendulum.interval(dt1, dt2).range("hours", 12)
+
+    assert next(r) == dt1
+    assert next(r) == dt1.add(hours=12)
+    assert list(r) == [dt1, dt1.add(hours=12), dt2]
+    assert next(r) == dt2
+
+    with pytest.raises(StopIteration):
+        next(r)
+
+
+def test_range_invalid_amount():
+    dt1 = pendulum.datetime(2000, 1, 1)
+    dt2 = pendulum.datetime(2000, 1, 31)
+
+    with pytest.raises(ValueError):
+        pendulum.interval(dt1, dt2).range("days", 0)
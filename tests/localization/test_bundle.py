@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+import pendulum
+
+from pendulum.locales.bundle import LocaleBundle
+from pendulum.locales.bundle import available_locales
+from pendulum.locales.bundle import compile_bundle
+from pendulum.locales.locale import Locale
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+
+@pytest.fixture
+def bundle(tmp_path: Path) -> Iterator[Path]:
+    path = tmp_path / "locales.bundle"
+    compile_bundle(path)
+
+    yield path
+
+    Locale.use_bundle(None)
+
+
+@pytest.mark.parametrize("name", available_locales())
+def test_bundle_matches_modules(bundle: Path, name: str) -> None:
+    expected = Locale.load(name)
+
+    Locale.use_bundle(bundle)
+    locale = Locale.load(name)
+
+    assert locale is not expected
+    for number in range(200):
+        assert locale.plural(number) == expected.plural(number)
+        assert locale.ordinal(number) == expected.ordinal(number)
+
+    assert locale.translation("units") == expected.translation("units")
+    assert locale.get("custom.date_formats") == expected.get("custom.date_formats")
+
+
+def test_bundle_formatting(bundle: Path) -> None:
+    Locale.use_bundle(bundle)
+
+    dt = pendulum.datetime(2000, 11, 10, 12, 34, 56)
+
+    assert dt.format("dddd Do MMMM LT", locale="fr") == "vendredi 10e novembre 12:34"
+    assert dt.diff_for_humans(dt.add(days=2), locale="cs") == "2 dny zpět"
+
+
+def test_bundle_subset(tmp_path: Path) -> None:
+    path = tmp_path / "locales.bundle"
+    compile_bundle(path, ["en", "fr"])
+
+    bundle = LocaleBundle(path)
+
+    assert bundle.locales() == ["en", "fr"]
+    assert "de" not in bundle
+
+    Locale.use_bundle(path)
+    try:
+        with pytest.raises(ValueError):
+            Locale.load("de")
+    finally:
+        Locale.use_bundle(None)
+
+
+def test_invalid_bundle(tmp_path: Path) -> None:
+    path = tmp_path / "locales.bundle"
+    path.write_bytes(b"not a bundle")
+
+    with pytest.raises(ValueError):
+        LocaleBundle(path)
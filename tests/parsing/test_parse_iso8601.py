@@ -6,6 +6,8 @@ from datetime import time
 
 import pytest
 
+import pendulum
+
 from pendulum.parsing import parse_iso8601
 
 
@@ -90,6 +92,43 @@ def test_parse_iso8601(text: str, expected: date) -> None:
     assert parse_iso8601(text) == expected
 
 
+def test_parse_iso8601_datetime_class() -> None:
+    dt = parse_iso8601("2016-10-06T12:34:56.123456+05:30", pendulum.DateTime)
+
+    assert isinstance(dt, pendulum.DateTime)
+    assert dt == datetime(2016, 10, 6, 7, 4, 56, 123456, tzinfo=pendulum.UTC)
+    assert dt.tzinfo is pendulum.fixed_timezone(19800)
+
+    dt = parse_iso8601("2016-10-06T12:34:56Z", pendulum.DateTime)
+
+    assert isinstance(dt, pendulum.DateTime)
+    assert dt.tzinfo is pendulum.UTC
+
+    dt = parse_iso8601("2016-10-06T12:34:56", pendulum.DateTime)
+
+    assert isinstance(dt, pendulum.DateTime)
+    assert dt.tzinfo is None
+
+    # Dates and times are not affected
+    assert type(parse_iso8601("2016-10-06", pendulum.DateTime)) is date
+
+
+def test_parse_iso8601_nanoseconds() -> None:
+    text = "2016-10-06T12:34:56.123456789+05:30"
+
+    dt = parse_iso8601(text, pendulum.DateTime)
+    assert dt.microsecond == 123456
+    assert dt.nanosecond == 789
+
+    dt = parse_iso8601("2016-10-06T12:34:56,1234567", pendulum.DateTime)
+    assert dt.nanosecond == 700
+
+    # Native datetimes cannot carry them
+    dt = parse_iso8601(text)
+    assert dt.microsecond == 123456
+    assert not hasattr(dt, "nanosecond")
+
+
 def test_parse_ios8601_invalid():
     # Invalid month
     with pytest.raises(ValueError):
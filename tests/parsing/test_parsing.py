@@ -672,3 +672,100 @@ def test_exif_edge_case():
     assert parsed.hour == 15
     assert parsed.minute == 45
     assert parsed.second == 28
+
+
+def test_rfc_2822():
+    text = "Thu, 06 Oct 2016 12:34:56 GMT"
+
+    with pytest.raises(ParserError):
+        parse(text)
+
+    parsed = parse(text, strict=False)
+    assert parsed.year == 2016
+    assert parsed.month == 10
+    assert parsed.day == 6
+    assert parsed.hour == 12
+    assert parsed.minute == 34
+    assert parsed.second == 56
+    assert parsed.microsecond == 0
+    assert parsed.utcoffset() == datetime.timedelta(0)
+
+    text = "6 Oct 2016 12:34 -0530"
+
+    parsed = parse(text, strict=False)
+    assert parsed.year == 2016
+    assert parsed.month == 10
+    assert parsed.day == 6
+    assert parsed.hour == 12
+    assert parsed.minute == 34
+    assert parsed.second == 0
+    assert parsed.utcoffset() == -datetime.timedelta(hours=5, minutes=30)
+
+    # Offsets of zero are UTC, like with dateutil
+    assert parse("06 Oct 2016 12:34:56 -0000", strict=False).tzinfo is pendulum.UTC
+    assert parse("06 Oct 2016 12:34:56 +0000", strict=False).tzinfo is pendulum.UTC
+
+    text = "06 October 2016"
+
+    parsed = parse(text, strict=False)
+    assert parsed.year == 2016
+    assert parsed.month == 10
+    assert parsed.day == 6
+    assert parsed.hour == 0
+    assert parsed.minute == 0
+    assert parsed.second == 0
+    assert parsed.tzinfo is None
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Thu, 06 Oct 2016 12:34:56 gmt",
+        "Thu, 06 Oct 2016 12:34:56 Utc",
+        "Tues, 04 Oct 2016 12:34:56 GMT",
+        "Thur, 06 Oct 2016 12:34:56 GMT",
+        "Thurs, 06 Oct 2016 12:34:56 GMT",
+    ],
+)
+def test_rfc_2822_spellings_not_supported_by_dateutil(text):
+    parsed = parse(text, strict=False)
+
+    assert parsed.hour == 12
+    assert parsed.tzinfo is pendulum.UTC
+
+
+def test_us_slash_dates():
+    text = "10/06/2016"
+
+    parsed = parse(text, strict=False)
+    assert parsed.year == 2016
+    assert parsed.month == 10
+    assert parsed.day == 6
+    assert parsed.hour == 0
+    assert parsed.minute == 0
+    assert parsed.second == 0
+    assert parsed.tzinfo is None
+
+    parsed = parse(text, strict=False, day_first=True)
+    assert parsed.year == 2016
+    assert parsed.month == 6
+    assert parsed.day == 10
+
+    text = "10/06/2016 12:05:03.25 AM"
+
+    parsed = parse(text, strict=False)
+    assert parsed.year == 2016
+    assert parsed.month == 10
+    assert parsed.day == 6
+    assert parsed.hour == 0
+    assert parsed.minute == 5
+    assert parsed.second == 3
+    assert parsed.microsecond == 250000
+    assert parsed.tzinfo is None
+
+    text = "10/06/2016 1:05 pm"
+
+    parsed = parse(text, strict=False)
+    assert parsed.hour == 13
+    assert parsed.minute == 5
+    assert parsed.second == 0
@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+from array import array
+
+import pytest
+
+import pendulum
+
+from pendulum import DateTimeArray
+from pendulum.tz import fixed_timezone
+
+
+@pytest.fixture
+def dts() -> list[pendulum.DateTime]:
+    return [
+        pendulum.datetime(2013, 3, 30, 12, 34, 56, 123456, tz="Europe/Paris"),
+        pendulum.datetime(2013, 3, 31, 1, 30, tz="Europe/Paris"),
+        pendulum.datetime(2013, 10, 27, 2, 30, tz="Europe/Paris"),
+        pendulum.datetime(2016, 2, 29, 23, 59, 59, 999999, tz="Europe/Paris"),
+        pendulum.datetime(1969, 12, 31, 23, 0, tz="Europe/Paris"),
+    ]
+
+
+def test_from_datetimes(dts: list[pendulum.DateTime]) -> None:
+    values = DateTimeArray.from_datetimes(dts)
+
+    assert len(values) == len(dts)
+    assert values.tz.name == "Europe/Paris"
+    assert list(values.microseconds) == [
+        dt.int_timestamp * 1_000_000 + dt.microsecond for dt in dts
+    ]
+
+
+def test_from_datetimes_naive() -> None:
+    values = DateTimeArray.from_datetimes(
+        [pendulum.naive(2013, 3, 31, 2, 30)], tz="Europe/Paris"
+    )
+
+    assert values[0] == pendulum.datetime(2013, 3, 31, 2, 30, tz="Europe/Paris")
+
+
+def test_indexing_materializes_datetimes(dts: list[pendulum.DateTime]) -> None:
+    values = DateTimeArray.from_datetimes(dts)
+
+    for i, dt in enumerate(dts):
+        assert isinstance(values[i], pendulum.DateTime)
+        assert values[i] == dt
+        assert values[i].timezone_name == "Europe/Paris"
+        assert values[i].offset == dt.offset
+
+    assert list(values) == dts
+    assert values[-1] == dts[-1]
+
+
+def test_slicing_returns_an_array(dts: list[pendulum.DateTime]) -> None:
+    values = DateTimeArray.from_datetimes(dts)[1:3]
+
+    assert isinstance(values, DateTimeArray)
+    assert list(values) == dts[1:3]
+
+
+def test_buffer_is_shared() -> None:
+    buffer = array("q", [0, 1_000_000])
+    values = DateTimeArray(buffer, tz="Europe/Paris")
+
+    assert values.microseconds is buffer
+    assert values.in_timezone("UTC").microseconds is buffer
+    assert values[1] == pendulum.datetime(1970, 1, 1, 0, 0, 1)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"hours": 1},
+        {"minutes": 90, "seconds": 30},
+        {"microseconds": -1},
+        {"days": 1},
+        {"weeks": 2},
+        {"months": 1},
+        {"years": 1, "hours": 3},
+    ],
+)
+def test_add(dts: list[pendulum.DateTime], kwargs: dict[str, int]) -> None:
+    values = DateTimeArray.from_datetimes(dts)
+
+    expected = [dt.add(**kwargs) for dt in dts]
+    result = list(values.add(**kwargs))
+
+    assert result == expected
+    assert [dt.offset for dt in result] == [dt.offset for dt in expected]
+
+    expected = [dt.subtract(**kwargs) for dt in dts]
+
+    assert list(values.subtract(**kwargs)) == expected
+
+
+def test_add_fixed_timezone() -> None:
+    dts = [pendulum.datetime(2016, 1, 31, 12, tz=fixed_timezone(3600))]
+    values = DateTimeArray.from_datetimes(dts)
+
+    assert list(values.add(days=1)) == [dts[0].add(days=1)]
+    assert list(values.add(months=1)) == [dts[0].add(months=1)]
+
+
+@pytest.mark.parametrize("unit", DateTimeArray._MODIFIERS_VALID_UNITS)
+@pytest.mark.parametrize(
+    "tz",
+    ["Europe/Paris", "Asia/Kathmandu", "UTC", fixed_timezone(-9000)],
+)
+def test_start_of(
+    dts: list[pendulum.DateTime], unit: str, tz: str | pendulum.FixedTimezone
+) -> None:
+    dts = [dt.in_timezone(tz) for dt in dts]
+    values = DateTimeArray.from_datetimes(dts)
+
+    assert list(values.start_of(unit)) == [dt.start_of(unit) for dt in dts]
+
+
+@pytest.mark.parametrize("unit", ["hour", "day", "week"])
+@pytest.mark.parametrize("tz", ["America/Sao_Paulo", "America/Havana"])
+def test_start_of_skipped_midnights(unit: str, tz: str) -> None:
+    # Both timezones skip midnight when they switch to DST
+    dts = [
+        pendulum.datetime(year, month, day, hour, tz=tz)
+        for year, month, day in [(2016, 3, 13), (2016, 10, 16), (2017, 10, 15)]
+        for hour in (1, 5, 23)
+    ]
+    values = DateTimeArray.from_datetimes(dts)
+
+    assert list(values.start_of(unit)) == [dt.start_of(unit) for dt in dts]
+
+
+def test_start_of_week_respects_week_start(dts: list[pendulum.DateTime]) -> None:
+    pendulum.week_starts_at(pendulum.SUNDAY)
+
+    values = DateTimeArray.from_datetimes(dts)
+
+    assert list(values.start_of("week")) == [dt.start_of("week") for dt in dts]
+
+
+def test_start_of_invalid_unit() -> None:
+    with pytest.raises(ValueError):
+        DateTimeArray().start_of("microsecond")
+
+
+def test_in_timezone(dts: list[pendulum.DateTime]) -> None:
+    values = DateTimeArray.from_datetimes(dts).in_timezone("America/New_York")
+
+    assert values.tz.name == "America/New_York"
+    assert list(values) == [dt.in_timezone("America/New_York") for dt in dts]
+    assert [dt.timezone_name for dt in values] == ["America/New_York"] * len(dts)
+
+
+def test_comparisons(dts: list[pendulum.DateTime]) -> None:
+    values = DateTimeArray.from_datetimes(dts)
+    pivot = pendulum.datetime(2013, 10, 27, 2, 30, tz="Europe/Paris")
+
+    assert (values < pivot) == [True, True, False, False, True]
+    assert (values <= pivot) == [True, True, True, False, True]
+    assert (values > pivot) == [False, False, False, True, False]
+    assert (values >= pivot) == [False, False, True, True, False]
+    assert (values == pivot) == [False, False, True, False, False]
+    assert (values != pivot) == [True, True, False, True, True]
+
+    assert (values == values.in_timezone("UTC")) == [True] * len(dts)
+    assert (values < values.add(seconds=1)) == [True] * len(dts)
+
+    with pytest.raises(ValueError):
+        values < values[1:]  # noqa: B015
+
+    with pytest.raises(TypeError):
+        values < pendulum.naive(2013, 1, 1)  # noqa: B015
+
+
+@pytest.mark.parametrize("unit", DateTimeArray._MODIFIERS_VALID_UNITS)
+@pytest.mark.parametrize(
+    "tz", ["Europe/Paris", "Australia/Lord_Howe", "UTC", fixed_timezone(19800)]
+)
+def test_truncate(
+    dts: list[pendulum.DateTime], unit: str, tz: str | pendulum.FixedTimezone
+) -> None:
+    values = [dt.int_timestamp * 1_000_000 + dt.microsecond for dt in dts]
+    expected = [dt.in_timezone(tz).start_of(unit) for dt in dts]
+
+    assert pendulum.truncate(values, unit, tz) == array(
+        "q", [dt.int_timestamp * 1_000_000 for dt in expected]
+    )
+    assert list(pendulum.truncate(DateTimeArray(values, tz), unit)) == expected
+
+
+def test_truncate_array_in_another_timezone(dts: list[pendulum.DateTime]) -> None:
+    values = pendulum.truncate(DateTimeArray.from_datetimes(dts), "day", "Asia/Tokyo")
+
+    assert values.tz.name == "Asia/Tokyo"
+    assert list(values) == [dt.in_timezone("Asia/Tokyo").start_of("day") for dt in dts]
+
+
+def test_truncate_defaults_to_utc() -> None:
+    assert pendulum.truncate([90_061_000_001, -1], "hour") == array(
+        "q", [90_000_000_000, -3_600_000_000]
+    )
+
+
+def test_truncate_ambiguous_times() -> None:
+    # 2:30 in Paris happened twice on 2013-10-27
+    first = pendulum.datetime(2013, 10, 27, 0, 30)
+    second = pendulum.datetime(2013, 10, 27, 1, 30)
+    values = [dt.int_timestamp * 1_000_000 for dt in (first, second)]
+
+    assert pendulum.truncate(values, "hour", "Europe/Paris") == array(
+        "q", [values[0] - 1_800_000_000, values[1] - 1_800_000_000]
+    )
+
+
+def test_truncate_skipped_midnight() -> None:
+    # Midnight was skipped in Sao Paulo on 2016-10-16
+    dt = pendulum.datetime(2016, 10, 16, 5, tz="America/Sao_Paulo")
+    values = DateTimeArray.from_datetimes([dt])
+
+    assert list(pendulum.truncate(values, "day")) == [
+        pendulum.datetime(2016, 10, 16, 1, tz="America/Sao_Paulo")
+    ]
+
+
+def test_truncate_respects_week_start(dts: list[pendulum.DateTime]) -> None:
+    pendulum.week_starts_at(pendulum.SUNDAY)
+
+    values = DateTimeArray.from_datetimes(dts)
+
+    assert list(pendulum.truncate(values, "week")) == [
+        dt.start_of("week") for dt in dts
+    ]
+
+
+def test_truncate_invalid_unit() -> None:
+    with pytest.raises(ValueError):
+        pendulum.truncate([0], "microsecond")
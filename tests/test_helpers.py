@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import asyncio
+
 from datetime import datetime
+from typing import cast
 
 import pytest
 import pytz
@@ -190,3 +193,57 @@ def test_week_ends_at_invalid_value() -> None:
 
     with pytest.raises(ValueError):
         pendulum.week_ends_at(11)  # type: ignore[arg-type]
+
+
+def test_settings() -> None:
+    dt = pendulum.datetime(2000, 11, 10, 12, 34, 56, 123456)
+
+    with pendulum.settings(locale="fr", week_start=pendulum.SATURDAY):
+        assert pendulum.get_locale() == "fr"
+        assert dt.format("MMMM") == "novembre"
+        assert dt.start_of("week").day_of_week == pendulum.SATURDAY
+        assert dt.date().end_of("week").day_of_week == pendulum.FRIDAY
+
+        with pendulum.settings(week_end=pendulum.SUNDAY):
+            assert pendulum.get_locale() == "fr"
+            assert pendulum.get_week_starts_at() == pendulum.SATURDAY
+            assert pendulum.get_week_ends_at() == pendulum.SUNDAY
+
+    assert pendulum.get_locale() == "en"
+    assert pendulum.get_week_starts_at() == pendulum.MONDAY
+    assert pendulum.get_week_ends_at() == pendulum.SUNDAY
+
+
+def test_settings_override_global_settings() -> None:
+    pendulum.set_locale("de")
+
+    with pendulum.settings(locale="fr"):
+        assert pendulum.get_locale() == "fr"
+
+    with pendulum.settings(week_start=pendulum.SUNDAY):
+        assert pendulum.get_locale() == "de"
+
+
+def test_settings_invalid() -> None:
+    with pytest.raises(ValueError), pendulum.settings(locale="invalid"):
+        pass
+
+    invalid_day = cast(pendulum.WeekDay, 11)
+    with pytest.raises(ValueError), pendulum.settings(week_start=invalid_day):
+        pass
+
+
+def test_settings_are_local_to_tasks() -> None:
+    dt = pendulum.datetime(2000, 11, 10)
+
+    async def format_month(locale: str) -> str:
+        with pendulum.settings(locale=locale):
+            await asyncio.sleep(0)
+
+            return dt.format("MMMM")
+
+    async def main() -> list[str]:
+        return list(await asyncio.gather(format_month("fr"), format_month("es")))
+
+    assert asyncio.run(main()) == ["novembre", "noviembre"]
+    assert pendulum.get_locale() == "en"
@@ -4,6 +4,7 @@ from datetime import date
 from datetime import datetime
 from datetime import time
 
+import pytest
 import pytz
 
 from dateutil import tz
@@ -61,3 +62,21 @@ def test_safe_timezone_with_tzinfo_objects() -> None:
 
     assert isinstance(tz, Timezone)
     assert tz.name == "Europe/Paris"
+
+
+def test_lazy_attributes() -> None:
+    from pendulum.datetime_array import DateTimeArray
+    from pendulum.parser import parse
+
+    assert pendulum.DateTimeArray is DateTimeArray
+    assert pendulum.parse is parse
+    assert pendulum.travel == pendulum._traveller.travel
+    assert pendulum.freeze == pendulum._traveller.freeze
+
+    with pytest.raises(AttributeError):
+        pendulum.unknown  # noqa: B018
+
+
+def test_all_attributes_exist() -> None:
+    for name in pendulum.__all__:
+        assert hasattr(pendulum, name)
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from typing import Iterator
+
+import pytest
+
+import pendulum
+
+from pendulum.parallel import ParallelExecutor
+
+
+@pytest.fixture(scope="module")
+def executor() -> Iterator[ParallelExecutor]:
+    with ParallelExecutor(2, timezones=["Europe/Paris"], locales=["fr"]) as executor:
+        yield executor
+
+
+@pytest.fixture
+def values() -> pendulum.DateTimeArray:
+    start = pendulum.datetime(2013, 3, 30, 22, 30)
+
+    return pendulum.DateTimeArray.from_datetimes(
+        [start.add(minutes=37 * i) for i in range(100)], tz="Europe/Paris"
+    )
+
+
+def test_start_of(executor: ParallelExecutor, values: pendulum.DateTimeArray) -> None:
+    for unit in ["hour", "day", "month"]:
+        result = executor.start_of(values, unit)
+
+        assert result.tz is values.tz
+        assert result.microseconds == values.start_of(unit).microseconds
+
+    with pytest.raises(ValueError):
+        executor.start_of(values, "fortnight")
+
+
+def test_utc_offsets(
+    executor: ParallelExecutor, values: pendulum.DateTimeArray
+) -> None:
+    assert list(executor.utc_offsets(values)) == [dt.offset for dt in values]
+
+
+def test_format(executor: ParallelExecutor, values: pendulum.DateTimeArray) -> None:
+    fmt = "dddd D MMMM YYYY HH:mm Z"
+
+    assert executor.format(values, fmt, locale="fr") == [
+        dt.format(fmt, locale="fr") for dt in values
+    ]
+
+
+def test_parse_many(executor: ParallelExecutor) -> None:
+    texts = [f"2016-10-06T12:34:{second:02d}+05:30" for second in range(60)]
+    texts[42] = "invalid"
+
+    batch = executor.parse_many(texts, tz="Europe/Paris")
+    expected = pendulum.parse_many(texts, raw=True, tz="Europe/Paris")
+
+    assert batch.microseconds == expected.microseconds
+    assert batch.offsets == expected.offsets
+    assert list(batch.errors) == [42]
+
+
+def test_empty_inputs(executor: ParallelExecutor) -> None:
+    values = pendulum.DateTimeArray([], tz="Europe/Paris")
+
+    assert len(executor.start_of(values, "day")) == 0
+    assert len(executor.utc_offsets(values)) == 0
+    assert executor.format(values, "YYYY") == []
+    assert executor.parse_many([]).errors == {}
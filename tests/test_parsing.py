@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import pytest
+
 import pendulum
 
+from pendulum.parsing import ParserError
 from tests.conftest import assert_date
 from tests.conftest import assert_datetime
 from tests.conftest import assert_duration
@@ -142,3 +145,102 @@ def test_parse_with_utc_timezone() -> None:
     dt = pendulum.parse("2020-02-05T20:05:37.364951Z")
 
     assert dt.to_iso8601_string() == "2020-02-05T20:05:37.364951Z"
+
+
+@pytest.mark.parametrize(
+    ["text", "tz", "expected"],
+    [
+        (
+            "2016-10-16T12:34:56.123456+01:30",
+            "Europe/Paris",
+            pendulum.datetime(2016, 10, 16, 12, 34, 56, 123456, tz=5400 / 3600),
+        ),
+        (
+            "2016-10-16T12:34:56Z",
+            "Europe/Paris",
+            pendulum.datetime(2016, 10, 16, 12, 34, 56, tz="UTC"),
+        ),
+        (
+            "2016-10-16T12:34:56",
+            pendulum.UTC,
+            pendulum.datetime(2016, 10, 16, 12, 34, 56, tz="UTC"),
+        ),
+        (
+            "2016-10-30T02:30:00",
+            "Europe/Paris",
+            pendulum.datetime(2016, 10, 30, 2, 30, tz="Europe/Paris"),
+        ),
+    ],
+)
+def test_parse_datetime(text: str, tz: str, expected: pendulum.DateTime) -> None:
+    dt = pendulum.parse(text, tz=tz)
+
+    assert isinstance(dt, pendulum.DateTime)
+    assert dt.tzinfo == expected.tzinfo
+    assert dt.offset == expected.offset
+    assert dt == expected
+
+
+@pytest.mark.parametrize("tz", ["UTC", "Europe/Paris", pendulum.fixed_timezone(3600)])
+def test_parse_nanoseconds(tz: str | pendulum.FixedTimezone) -> None:
+    dt = pendulum.parse("2016-10-06T12:34:56.123456789", tz=tz)
+
+    assert isinstance(dt, pendulum.DateTime)
+    assert dt.microsecond == 123456
+    assert dt.nanosecond == 789
+
+    dt = pendulum.parse("2016-10-06T12:34:56.123456789+05:30")
+
+    assert isinstance(dt, pendulum.DateTime)
+    assert dt.nanosecond == 789
+
+
+def test_parse_many() -> None:
+    result = pendulum.parse_many(
+        ["2016-10-16T12:34:56.123456+01:30", "invalid", "2016-10-16", "P2D"],
+        tz="Europe/Paris",
+    )
+
+    assert len(result.values) == 4
+
+    dt = result.values[0]
+    assert isinstance(dt, pendulum.DateTime)
+    assert_datetime(dt, 2016, 10, 16, 12, 34, 56, 123456)
+    assert dt.offset == 5400
+
+    assert result.values[1] is None
+
+    dt = result.values[2]
+    assert isinstance(dt, pendulum.DateTime)
+    assert_datetime(dt, 2016, 10, 16, 0, 0, 0, 0)
+    assert dt.timezone_name == "Europe/Paris"
+
+    assert isinstance(result.values[3], pendulum.Duration)
+    assert_duration(result.values[3], days=2)
+
+    assert list(result.errors) == [1]
+    assert isinstance(result.errors[1], ParserError)
+
+
+def test_parse_many_raw() -> None:
+    result = pendulum.parse_many(
+        [
+            "1970-01-01T00:00:01.5Z",
+            "2016-10-16T12:34:56+01:30",
+            "2016-10-16",
+            "invalid",
+            "P2D",
+        ],
+        raw=True,
+        tz="Europe/Paris",
+    )
+
+    assert list(result.microseconds) == [
+        1500000,
+        pendulum.datetime(2016, 10, 16, 11, 4, 56).int_timestamp * 1000000,
+        pendulum.datetime(2016, 10, 15, 22).int_timestamp * 1000000,
+        0,
+        0,
+    ]
+    assert list(result.offsets) == [0, 5400, 7200, 0, 0]
+    assert sorted(result.errors) == [3, 4]
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import io
+
+from typing import Iterator
+
+import pytest
+
+import pendulum
+
+from pendulum.parsing.exceptions import ParserError
+from pendulum.stream import BadLine
+from pendulum.stream import parse_lines
+from pendulum.stream import reformat_lines
+
+
+LINES = [
+    "2016-10-06T12:34:56+05:30\n",
+    "invalid\n",
+    "2016-10-06 12:34:56\n",
+    "2016-10-06\n",
+]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 10])
+def test_parse_lines(chunk_size: int) -> None:
+    results = list(parse_lines(LINES, tz="Europe/Paris", chunk_size=chunk_size))
+
+    assert results[0] == pendulum.datetime(2016, 10, 6, 7, 4, 56)
+    assert isinstance(results[1], BadLine)
+    assert results[1].row == 1
+    assert results[1].line == "invalid\n"
+    assert isinstance(results[1].error, ParserError)
+    assert results[2] == pendulum.datetime(2016, 10, 6, 12, 34, 56, tz="Europe/Paris")
+    assert results[3] == pendulum.datetime(2016, 10, 6, tz="Europe/Paris")
+
+
+def test_parse_lines_with_format() -> None:
+    lines = io.StringIO("06/10/2016 12:34\n31/02/2016 12:34\n")
+
+    results = list(parse_lines(lines, "DD/MM/YYYY HH:mm", tz="Europe/Paris"))
+
+    assert results[0] == pendulum.datetime(2016, 10, 6, 12, 34, tz="Europe/Paris")
+    assert isinstance(results[1], BadLine)
+    assert results[1].row == 1
+
+
+def test_parse_lines_is_lazy() -> None:
+    def lines() -> Iterator[str]:
+        yield "2016-10-06"
+
+        raise AssertionError("The second chunk should not be read")
+
+    results = parse_lines(lines(), chunk_size=1)
+
+    assert next(results) == pendulum.datetime(2016, 10, 6)
+
+
+def test_reformat_lines() -> None:
+    lines = [*LINES, "P2Y\n"]
+
+    results = list(
+        reformat_lines(lines, None, "DD/MM/YYYY HH:mm:ss Z", tz="Europe/Paris")
+    )
+
+    assert results[0] == "06/10/2016 09:04:56 +02:00"
+    assert isinstance(results[1], BadLine)
+    assert results[2] == "06/10/2016 12:34:56 +02:00"
+    assert results[3] == "06/10/2016 00:00:00 +02:00"
+    # Durations cannot be reformatted
+    assert isinstance(results[4], BadLine)
+    assert results[4].row == 4
+
+
+def test_reformat_lines_with_locale() -> None:
+    results = list(
+        reformat_lines(
+            ["6 octobre 2016"], "D MMMM YYYY", "dddd D MMMM YYYY", locale="fr"
+        )
+    )
+
+    assert results == ["jeudi 6 octobre 2016"]
+
+
+def test_reformat_lines_in_worker_processes() -> None:
+    lines = [f"2016-10-{day:02d}T12:00:00Z" for day in range(1, 33)]
+
+    results = list(reformat_lines(lines, None, "YYYY-MM-DD", chunk_size=4, processes=2))
+
+    assert results[:31] == [f"2016-10-{day:02d}" for day in range(1, 32)]
+    assert isinstance(results[31], BadLine)
+    assert results[31].row == 31
+
+
+def test_invalid_options() -> None:
+    with pytest.raises(ValueError):
+        parse_lines(LINES, chunk_size=0)
+
+    with pytest.raises(ValueError):
+        parse_lines(LINES, processes=-1)
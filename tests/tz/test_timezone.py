@@ -451,3 +451,126 @@ def test_repr():
     tz = timezone("Europe/Paris")
 
     assert repr(tz) == "Timezone('Europe/Paris')"
+
+
+@pytest.mark.parametrize(
+    "tz", ["Europe/Paris", "America/Sao_Paulo", "Australia/Lord_Howe", "UTC"]
+)
+def test_local_offsets_match_utcoffset(tz):
+    tz = timezone(tz)
+
+    for year in (1900, 1945, 1996, 2013, 2021, 2050):
+        window = tz._transition_window(year)
+        for at, _, _ in window.transitions:
+            for delta in range(-7201, 7202, 900):
+                dt = datetime(1970, 1, 1) + timedelta(seconds=at + delta)
+
+                assert tz._local_offsets(dt) == (
+                    tz.utcoffset(dt.replace(fold=0)) // timedelta(seconds=1),
+                    tz.utcoffset(dt.replace(fold=1)) // timedelta(seconds=1),
+                )
+
+
+def test_convert_many():
+    tz = timezone("Europe/Paris")
+    dts = [
+        datetime(2013, 3, 31, 2, 30, 45, 123456),
+        datetime(2013, 3, 31, 2, 30, 45, 123456, fold=1),
+        datetime(2013, 10, 27, 2, 30, 45, 123456),
+        datetime(2013, 10, 27, 2, 30, 45, 123456, fold=1),
+        datetime(2013, 6, 1, 12, tzinfo=zoneinfo.ZoneInfo("UTC")),
+    ]
+
+    assert [dt.isoformat() for dt in tz.convert_many(dts)] == [
+        "2013-03-31T01:30:45.123456+01:00",
+        "2013-03-31T03:30:45.123456+02:00",
+        "2013-10-27T02:30:45.123456+02:00",
+        "2013-10-27T02:30:45.123456+01:00",
+        "2013-06-01T14:00:00+02:00",
+    ]
+
+    with pytest.raises(NonExistingTime):
+        tz.convert_many(dts[:1], raise_on_unknown_times=True)
+
+    with pytest.raises(AmbiguousTime):
+        tz.convert_many(dts[2:3], raise_on_unknown_times=True)
+
+
+def test_convert_many_fixed_timezone():
+    tz = fixed_timezone(-5 * 3600)
+
+    assert tz.convert_many([datetime(2013, 3, 31, 2, 30)]) == [
+        datetime(2013, 3, 31, 2, 30, tzinfo=tz)
+    ]
+
+
+@pytest.mark.parametrize(
+    "tz",
+    [
+        "Europe/Paris",
+        "America/New_York",
+        "Australia/Lord_Howe",
+        fixed_timezone(19800),
+        "UTC",
+    ],
+)
+def test_pendulum_convert_many_matches_in_timezone(
+    tz: str | pendulum.FixedTimezone,
+) -> None:
+    start = pendulum.datetime(2013, 3, 1)
+    dts = [start.add(minutes=17 * i) for i in range(30000)]
+    # Unsorted inputs are supported too
+    dts += dts[::-97]
+
+    converted = pendulum.convert_many(dts, tz)
+
+    for dt, result in zip(dts, converted):
+        expected = dt.in_timezone(tz)
+
+        assert isinstance(result, pendulum.DateTime)
+        assert result == expected
+        assert result.isoformat() == expected.isoformat()
+        assert result.tzinfo is expected.tzinfo
+        assert result.fold == expected.fold or result.tzinfo is pendulum.UTC
+
+
+def test_pendulum_convert_many_naive() -> None:
+    dts = [datetime(2013, 10, 27, 2, 30, fold=1), datetime(2013, 3, 31, 2, 30)]
+
+    assert [dt.isoformat() for dt in pendulum.convert_many(dts, "Europe/Paris")] == [
+        "2013-10-27T02:30:00+01:00",
+        "2013-03-31T01:30:00+01:00",
+    ]
+
+
+def test_pendulum_convert_many_keeps_nanoseconds() -> None:
+    dts = [
+        pendulum.from_epoch_nanos(1475757296123456789),
+        pendulum.naive(2016, 10, 6, 12, 34, 56, 123456),
+        datetime(2016, 10, 6, 12, 34, 56),
+    ]
+    dts[1]._nanosecond = 5
+
+    converted = pendulum.convert_many(dts, "Europe/Paris")
+
+    assert [dt.nanosecond for dt in converted] == [789, 5, 0]
+    assert converted[0].nanosecond == dts[0].in_timezone("Europe/Paris").nanosecond
+
+
+def test_pendulum_convert_timestamps() -> None:
+    timestamps = [1383010200, 1383013800, 1383013800.5]
+
+    assert [
+        dt.isoformat() for dt in pendulum.convert_timestamps(timestamps, "Europe/Paris")
+    ] == [
+        "2013-10-29T02:30:00+01:00",
+        "2013-10-29T03:30:00+01:00",
+        "2013-10-29T03:30:00.500000+01:00",
+    ]
+
+    assert pendulum.convert_timestamps(
+        [1382833800000, 1382837400000], "Europe/Paris", "milliseconds", raw=True
+    ) == [(2013, 10, 27, 2, 30, 0, 0, 7200), (2013, 10, 27, 2, 30, 0, 0, 3600)]
+
+    with pytest.raises(ValueError):
+        pendulum.convert_timestamps(timestamps, "Europe/Paris", "hours")